@@ -0,0 +1,119 @@
+"""Compare the vectorized continuity imputation and ablation of
+ContinuityValidationPrimitive with the row loops they replace, on synthetic
+series with missing timestamps.
+
+Usage: python benchmark/continuity_validation.py --lengths 10000 100000 1000000 10000000 --gaps 100
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from tods.data_processing.ContinuityValidation import ContinuityValidationPrimitive
+
+parser = argparse.ArgumentParser(description='Benchmark continuity validation')
+parser.add_argument('--lengths', type=int, nargs='+', default=[10000, 100000, 1000000, 10000000],
+                    help='Number of rows of the synthetic series')
+parser.add_argument('--gaps', type=int, default=100,
+                    help='Number of missing timestamps of each series')
+parser.add_argument('--max_loop_length', type=int, default=10000,
+                    help='Longest series the row loops are run on')
+
+
+def make_series(length, gaps, random_state):
+    timestamps = np.sort(random_state.choice(length + gaps, length, replace=False))
+    timestamps -= timestamps[0]
+    return pd.DataFrame({'d3mIndex': np.arange(length),
+                         'timestamp': timestamps.astype(np.float64),
+                         'value': random_state.rand(length),
+                         'ground_truth': random_state.randint(0, 2, length)})
+
+
+def loop_imputation(inputs, interval):
+    time1 = inputs.iloc[0]['timestamp']
+    for i in range(1, inputs.shape[0]):
+        time2 = inputs.iloc[i]['timestamp']
+        if time2 - time1 != interval:
+            blank_number = int((time2 - time1) / interval)
+            for j in range(1, blank_number):
+                dict = {'timestamp': [time1 + interval * j], 'ground_truth': [int(inputs.iloc[i]['ground_truth'])]}
+                for col in list(inputs.columns.values):
+                    if not col in ['d3mIndex', 'timestamp', 'ground_truth']:
+                        dict[col] = [inputs.iloc[i-1][col] + (inputs.iloc[i][col] - inputs.iloc[i-1][col]) / blank_number * j]
+                # DataFrame.append is gone from recent pandas
+                inputs = pd.concat([inputs, pd.DataFrame(dict)], ignore_index=True, sort=False)
+        time1 = time2
+
+    inputs.sort_values("timestamp", inplace=True)
+    inputs['d3mIndex'] = list(range(inputs.shape[0]))
+    return inputs
+
+
+def loop_ablation_set(inputs):
+    min_interval = inputs.iloc[1]['timestamp'] - inputs.iloc[0]['timestamp']
+    for i in range(2, inputs.shape[0]):
+        curr_interval = inputs.iloc[i]['timestamp'] - inputs.iloc[i - 1]['timestamp']
+        if min_interval > curr_interval:
+            min_interval = curr_interval
+
+    max_interval = ((inputs.iloc[-1]['timestamp'] - inputs.iloc[0]['timestamp']) + min_interval * (2 - inputs.shape[0]))
+
+    interval = min_interval
+    ablation_set = list()
+    origin_set = set(inputs['timestamp'])
+    while interval <= max_interval:
+        start = 0
+        while (inputs.iloc[start]['timestamp'] <= inputs.iloc[0]['timestamp'] + max_interval) and (inputs.iloc[start]['timestamp'] <= inputs.iloc[-1]['timestamp']):
+            tmp_list = list()
+            for i in np.arange(start=inputs.iloc[start]['timestamp'], step=interval, stop=inputs.iloc[-1]['timestamp']):
+                if i in origin_set:
+                    tmp_list.append(i)
+                else: break
+            ablation_set.append(tmp_list)
+            start += 1
+        interval += min_interval
+
+    max_size_index = 0
+    for i in range(1, len(ablation_set)):
+        if len(ablation_set[i]) > len(ablation_set[max_size_index]):
+            max_size_index = i
+    return ablation_set[max_size_index]
+
+
+def main():
+    args = parser.parse_args()
+    random_state = np.random.RandomState(0)
+    hyperparams_class = ContinuityValidationPrimitive.metadata.get_hyperparams()
+    primitive = ContinuityValidationPrimitive(hyperparams=hyperparams_class.defaults())
+
+    print('{:<12}{:<12}{:>12}{:>12}{:>10}{:>10}'.format('length', 'mode', 'loop (s)', 'vector (s)', 'speedup', 'same'))
+    for length in args.lengths:
+        inputs = make_series(length, args.gaps, random_state)
+        for mode in ['imputation', 'ablation']:
+            start = time.perf_counter()
+            if mode == 'imputation':
+                result = primitive._continuity_imputation(inputs.copy())
+            else:
+                result = primitive._find_ablation_set(inputs)
+            vector_time = time.perf_counter() - start
+
+            if length > args.max_loop_length:
+                print('{:<12}{:<12}{:>12}{:>12.3f}{:>10}{:>10}'.format(length, mode, '-', vector_time, '-', '-'))
+                continue
+
+            start = time.perf_counter()
+            if mode == 'imputation':
+                expected = loop_imputation(inputs.copy(), primitive.hyperparams['interval'])
+                same = expected.values.tolist() == result.values.tolist()
+            else:
+                expected = loop_ablation_set(inputs)
+                same = expected == result
+            loop_time = time.perf_counter() - start
+
+            print('{:<12}{:<12}{:>12.3f}{:>12.3f}{:>9.0f}x{:>10}'.format(
+                length, mode, loop_time, vector_time, loop_time / vector_time, str(same)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,57 @@
+"""Time import tods and the import of a few primitives in fresh interpreters,
+against the import of all of them that import tods did before the primitives
+were loaded lazily, and check which heavy backends every case imports.
+
+import tods must not import TensorFlow, the script fails if it does.
+
+Usage: python benchmark/import_time.py --repeat 5 --primitives StatisticalMeanPrimitive IsolationForestPrimitive
+"""
+import argparse
+import json
+import subprocess
+import sys
+
+BACKENDS = ['tensorflow', 'keras', 'stumpy', 'xgboost', 'pyod']
+
+parser = argparse.ArgumentParser(description='Benchmark import time of tods')
+parser.add_argument('--repeat', type=int, default=5,
+                    help='Number of fresh interpreters timed per case')
+parser.add_argument('--primitives', type=str, nargs='+', default=['StatisticalMeanPrimitive', 'IsolationForestPrimitive'],
+                    help='Primitives imported from tods after import tods')
+
+SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import tods
+names = {names}
+if names is None:
+    names = list(tods._PRIMITIVES)
+for name in names:
+    getattr(tods, name)
+print(json.dumps({{'time': time.perf_counter() - start,
+                   'backends': [backend for backend in {backends!r} if backend in sys.modules]}}))
+"""
+
+
+def run(names):
+    output = subprocess.run([sys.executable, '-c', SCRIPT.format(names=names, backends=BACKENDS)],
+                            check=True, stdout=subprocess.PIPE, universal_newlines=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    args = parser.parse_args()
+    cases = [('import tods', []), ('+ ' + ', '.join(args.primitives), args.primitives), ('all primitives', None)]
+
+    print('{:<70}{:>10}{:>10}  {}'.format('case', 'best (s)', 'mean (s)', 'backends'))
+    for name, names in cases:
+        results = [run(names) for _ in range(args.repeat)]
+        times = [result['time'] for result in results]
+        backends = results[0]['backends']
+        print('{:<70}{:>10.3f}{:>10.3f}  {}'.format(name, min(times), sum(times) / len(times), ', '.join(backends)))
+        if names == []:
+            assert 'tensorflow' not in backends, 'import tods imports tensorflow'
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,97 @@
+"""Compare the approximate matrix profile of the MatrixProfile primitives with
+the exact one of stumpy.mstump on the bundled anomaly datasets.
+
+The agreement is reported on the discords, the subsequences farthest from
+their nearest neighbor: the share of the top k exact discords found among
+the top k approximate ones, and the Spearman correlation of the scores of
+all the subsequences. The scores are the ones of the MatrixProfile detector,
+the sum over the dimensions of the min-max scaled profile.
+
+Usage: python benchmark/matrix_profile.py --window_size 50 --percentages 0.01 0.05 0.1 0.5 --top_k 10
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+import stumpy
+from scipy.stats import spearmanr
+from sklearn.preprocessing import MinMaxScaler
+
+from tods.feature_analysis.core.matrix_profile import approximate_matrix_profile, exclusion_zone
+
+DATASETS = {
+    'kpi': ('datasets/anomaly/raw_data/kpi.csv', ['value']),
+    'yahoo_sub_5': ('datasets/anomaly/raw_data/yahoo_sub_5.csv', ['value_0', 'value_1', 'value_2', 'value_3', 'value_4']),
+}
+
+parser = argparse.ArgumentParser(description='Benchmark approximate matrix profile')
+parser.add_argument('--window_size', type=int, default=50,
+                    help='Subsequence length')
+parser.add_argument('--percentages', type=float, nargs='+', default=[0.01, 0.05, 0.1, 0.5],
+                    help='Fractions of the diagonals visited by the approximate profile')
+parser.add_argument('--time_budget', type=float, default=None,
+                    help='Time budget in seconds of every approximate profile')
+parser.add_argument('--top_k', type=int, default=10,
+                    help='Number of discords compared')
+parser.add_argument('--seed', type=int, default=0,
+                    help='Seed of the order of the diagonals')
+
+
+def scores(matrix_profile):
+    return np.sum(MinMaxScaler().fit_transform(matrix_profile.T), axis=1)
+
+
+def top_discords(score, k, excl_zone):
+    """Indices of the k highest scores at least excl_zone apart."""
+    score = score.copy()
+    discords = []
+    for _ in range(k):
+        index = int(np.argmax(score))
+        if not np.isfinite(score[index]):
+            break
+        discords.append(index)
+        score[max(index - excl_zone, 0):index + excl_zone + 1] = -np.inf
+    return np.array(discords)
+
+
+def discord_agreement(exact, approximate, excl_zone):
+    """Share of the exact discords within excl_zone of an approximate one."""
+    distances = np.abs(exact[:, np.newaxis] - approximate[np.newaxis, :])
+    return np.mean(distances.min(axis=1) <= excl_zone)
+
+
+def main():
+    args = parser.parse_args()
+    excl_zone = exclusion_zone(args.window_size)
+
+    print('{:<14}{:>8}{:>12}{:>12}{:>10}{:>10}{:>10}'.format(
+        'dataset', 'shape', 'percentage', 'time (s)', 'speedup', 'top k', 'spearman'))
+    for name, (path, columns) in DATASETS.items():
+        values = pd.read_csv(path)[columns].values.astype(np.float64)
+        shape = '{}x{}'.format(*values.shape)
+        # compile the numba functions of mstump before timing it
+        stumpy.mstump(values[:4 * args.window_size].T, m=args.window_size)
+
+        start = time.perf_counter()
+        exact, _ = stumpy.mstump(values.T, m=args.window_size)
+        exact_time = time.perf_counter() - start
+        exact_scores = scores(exact)
+        exact_discords = top_discords(exact_scores, args.top_k, excl_zone)
+        print('{:<14}{:>8}{:>12}{:>12.3f}{:>10}{:>10}{:>10}'.format(name, shape, 'exact', exact_time, '', '', ''))
+
+        for percentage in args.percentages:
+            start = time.perf_counter()
+            approximate, _ = approximate_matrix_profile(values, args.window_size, percentage=percentage,
+                                                        time_budget=args.time_budget, random_state=args.seed)
+            approximate_time = time.perf_counter() - start
+            approximate_scores = scores(approximate)
+            agreement = discord_agreement(exact_discords,
+                                          top_discords(approximate_scores, args.top_k, excl_zone), excl_zone)
+            print('{:<14}{:>8}{:>12.2f}{:>12.3f}{:>9.1f}x{:>10.2f}{:>10.3f}'.format(
+                name, shape, percentage, approximate_time, exact_time / approximate_time, agreement,
+                spearmanr(exact_scores, approximate_scores)[0]))
+
+
+if __name__ == '__main__':
+    main()
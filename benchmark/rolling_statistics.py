@@ -0,0 +1,78 @@
+"""Compare the vectorized rolling-statistics engine with the per-window loops
+previously used by the Statistical* feature analysis primitives.
+
+Usage: python benchmark/rolling_statistics.py --length 100000 --window_size 50
+"""
+import argparse
+import time
+
+import numpy as np
+from scipy import stats
+
+from tods.feature_analysis.core.rolling import rolling_statistic
+
+parser = argparse.ArgumentParser(description='Benchmark rolling statistics')
+parser.add_argument('--length', type=int, default=100000,
+                    help='Number of samples of the synthetic series')
+parser.add_argument('--window_size', type=int, default=50,
+                    help='Rolling window size')
+parser.add_argument('--statistics', type=str, nargs='+',
+                    default=['mean', 'vec_sum', 'std', 'median', 'maximum', 'kurtosis', 'skew',
+                             'median_absolute_deviation', 'mean_abs_temporal_derivative'],
+                    help='Statistics to benchmark')
+
+
+LOOP_FUNCTIONS = {
+    'mean': np.mean,
+    'vec_sum': np.sum,
+    'abs_sum': lambda sequence: np.sum(np.abs(sequence)),
+    'mean_abs': lambda sequence: np.mean(np.abs(sequence)),
+    'abs_energy': lambda sequence: np.round(np.sum(sequence * sequence), 4),
+    'maximum': np.max,
+    'minimum': np.min,
+    'median': np.median,
+    'std': np.std,
+    'var': np.var,
+    'skew': lambda sequence: round(stats.skew(sequence), 4),
+    'kurtosis': lambda sequence: round(stats.kurtosis(sequence), 4),
+    'gmean': lambda sequence: stats.gmean(sequence).round(4),
+    'hmean': lambda sequence: stats.hmean(sequence).round(4),
+    'variation': lambda sequence: stats.variation(sequence).round(4),
+    'mean_temporal_derivative': lambda sequence: np.mean(np.diff(sequence)),
+    'mean_abs_temporal_derivative': lambda sequence: np.mean(np.abs(np.diff(sequence))),
+}
+if hasattr(stats, 'median_absolute_deviation'):
+    LOOP_FUNCTIONS['median_absolute_deviation'] = lambda sequence: stats.median_absolute_deviation(sequence).round(4)
+else:
+    LOOP_FUNCTIONS['median_absolute_deviation'] = lambda sequence: stats.median_abs_deviation(sequence, scale=1.4826).round(4)
+
+
+def loop_statistic(values, window_size, statistic):
+    function = LOOP_FUNCTIONS[statistic]
+    result = np.zeros(len(values))
+    for iter in range(window_size - 1, len(values)):
+        result[iter] = function(values[iter - window_size + 1:iter + 1])
+    result[:window_size - 1] = result[window_size - 1]
+    return result
+
+
+def main():
+    args = parser.parse_args()
+    values = np.random.RandomState(0).rand(args.length) + 0.5
+
+    print('{:<32}{:>12}{:>12}{:>10}{:>12}'.format('statistic', 'loop (s)', 'engine (s)', 'speedup', 'max diff'))
+    for statistic in args.statistics:
+        start = time.perf_counter()
+        expected = loop_statistic(values, args.window_size, statistic)
+        loop_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        result = rolling_statistic(values, args.window_size, statistic)
+        engine_time = time.perf_counter() - start
+
+        print('{:<32}{:>12.3f}{:>12.4f}{:>9.0f}x{:>12.2e}'.format(
+            statistic, loop_time, engine_time, loop_time / engine_time, np.max(np.abs(result - expected))))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""Compare the one-call wavelet decomposition of WaveletTransformPrimitive with
+the per-column decomposition and concatenation it replaces.
+
+Usage: python benchmark/wavelet_transform.py --length 10000 --columns 500 --wavelet db8
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+import pywt
+
+from tods.feature_analysis.WaveletTransform import Wavelet
+
+parser = argparse.ArgumentParser(description='Benchmark wavelet transform')
+parser.add_argument('--length', type=int, default=10000,
+                    help='Number of samples of each synthetic series')
+parser.add_argument('--columns', type=int, default=500,
+                    help='Number of columns of the synthetic frame')
+parser.add_argument('--wavelet', type=str, default='db8',
+                    help='Wavelet to use')
+parser.add_argument('--level', type=int, default=None,
+                    help='Decomposition level, the maximum one if not given')
+
+
+def loop_transform(data, wavelet, level):
+    coeffs_buf = pd.DataFrame(columns=[])
+    for index, data_to_transform in data.items():
+        if level is None:
+            level = pywt.dwt_max_level(len(data_to_transform), pywt.Wavelet(wavelet).dec_len)
+        coeffs = pywt.wavedec(data=data_to_transform.to_numpy().copy(), wavelet=wavelet, level=level)
+        coeffs_buf = pd.concat([coeffs_buf, pd.DataFrame(coeffs).T], axis=1)
+    return coeffs_buf
+
+
+def main():
+    args = parser.parse_args()
+    data = pd.DataFrame(np.random.RandomState(0).randn(args.length, args.columns))
+
+    start = time.perf_counter()
+    expected = loop_transform(data, args.wavelet, args.level)
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = Wavelet(wavelet=args.wavelet, level=args.level).transform_to_dataframe(data)
+    batched_time = time.perf_counter() - start
+
+    print('{:<12}{:>12}{:>12}{:>10}{:>12}'.format('columns', 'loop (s)', 'batched (s)', 'speedup', 'max diff'))
+    print('{:<12}{:>12.3f}{:>12.3f}{:>9.0f}x{:>12.2e}'.format(
+        args.columns, loop_time, batched_time, loop_time / batched_time,
+        np.nanmax(np.abs(result.values - expected.values))))
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,20 @@
 from .utils import *
-from tods.data_processing import *
-from tods.timeseries_processing import *
-from tods.feature_analysis import *
-from tods.detection_algorithm import *
-from tods.sk_interface import *
+from . import utils as _utils
+from tods.common.lazy import lazy_attributes, package_attributes
+
+# The primitives and their interfaces are imported on first access, so that
+# import tods does not import TensorFlow, see tods.common.lazy
+_PRIMITIVES = package_attributes([
+    'tods.data_processing',
+    'tods.timeseries_processing',
+    'tods.feature_analysis',
+    'tods.detection_algorithm',
+    'tods.sk_interface',
+])
+
+__getattr__, __dir__ = lazy_attributes(__name__, _PRIMITIVES, submodules=[
+    'common', 'reinforcement', 'schemas', 'searcher', 'tests',
+])
+
+# from tods import * keeps exporting the helpers of tods.utils and the primitives
+__all__ = [name for name in vars(_utils) if not name.startswith('_')] + sorted(_PRIMITIVES)
@@ -12,8 +12,26 @@ from d3m.metadata import base as metadata_base, hyperparams, params
 from d3m import container
 from d3m import utils
 
+from tods.common.system_wise import is_system_wise, map_systems, collect_systems
+
 __all__ = ('TODSTransformerPrimitiveBase',)
 
+
+def _produce_system(primitive, inputs, method, **kwargs):
+    return getattr(primitive, method)(inputs=inputs, **kwargs)
+
+
+def _fit_system(primitive, inputs, **kwargs):
+    primitive.set_training_data(inputs=inputs)
+    primitive._fit(**kwargs)
+    return primitive
+
+
+def _fit_produce_system(primitive, inputs, method, **kwargs):
+    _fit_system(primitive, inputs, **kwargs)
+    return primitive, _produce_system(primitive, inputs, method, **kwargs)
+
+
 class TODSTransformerPrimitiveBase(transformer.TransformerPrimitiveBase[Inputs, Outputs, Hyperparams]): # pragma: no cover
     """
     A base class for primitives which are not fitted at all and can
@@ -28,8 +46,7 @@ class TODSTransformerPrimitiveBase(transformer.TransformerPrimitiveBase[Inputs,
 
     def produce(self, *, inputs: container.DataFrame, timeout: float = None, iterations: int = None) -> CallResult[container.DataFrame]:
 
-        is_system = len(inputs.iloc[0, 0].shape) != 0 # check the shape of first row first column, if not a single data entry(,) then it is system-wise data (row, col)
-        if is_system: 
+        if is_system_wise(inputs):
             outputs = self._forward(inputs, '_produce')
         else:
             outputs = self._produce(inputs=inputs)
@@ -64,17 +81,20 @@ class TODSTransformerPrimitiveBase(transformer.TransformerPrimitiveBase[Inputs,
 
         return
 
+    def _system_n_jobs(self):
+        """
+        Number of worker processes of system-wise data, from the system_n_jobs hyperparam if the primitive has one.
+        The transformer primitives do not declare it and process the systems one after another in this
+        process, one that should use workers can add system_n_jobs to its Hyperparams.
+        """
+        return self.hyperparams.get('system_n_jobs', 1)
+
     def _forward(self, data, method):
         """
-        General Forward Function to feed system data one-by-one to the primitive
+        General Forward Function to feed system data to the primitive, serially unless it declares system_n_jobs
         """
-        col_name = list(data.columns)[0]
-        for i, _ in data.iterrows():
-            sys_data = data.iloc[i][col_name]
-            produce_func = getattr(self, method, None)
-            out = produce_func(inputs=sys_data)
-            data.iloc[i][col_name] = out.value
-        return data
+        results = map_systems(_produce_system, self, data, n_jobs=self._system_n_jobs(), method=method)
+        return collect_systems(data, [result.value for result in results])
 
 class TODSUnsupervisedLearnerPrimitiveBase(UnsupervisedLearnerPrimitiveBase[Inputs, Outputs, Params, Hyperparams]):# pragma: no cover
 
@@ -82,11 +102,20 @@ class TODSUnsupervisedLearnerPrimitiveBase(UnsupervisedLearnerPrimitiveBase[Inpu
             random_seed: int=0, 
             docker_containers: Dict[str, DockerContainer] = None) -> None:
         super().__init__(hyperparams=hyperparams, random_seed=random_seed, docker_containers=docker_containers)
+        self._system_primitives = None
+
+    def __getstate__(self) -> dict:
+        state = super().__getstate__()
+        state['system_primitives'] = self._system_primitives
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        super().__setstate__(state)
+        self._system_primitives = state.get('system_primitives')
 
     def produce(self, *, inputs: container.DataFrame, timeout: float = None, iterations: int = None) -> CallResult[container.DataFrame]:
 
-        is_system = len(inputs.iloc[0, 0].shape) != 0 # check the shape of first row first column, if not a single data entry(,) then it is system-wise data (row, col)
-        if is_system: 
+        if is_system_wise(inputs):
             outputs = self._forward(inputs, '_produce')
         else:
             outputs = self._produce(inputs=inputs)
@@ -95,8 +124,7 @@ class TODSUnsupervisedLearnerPrimitiveBase(UnsupervisedLearnerPrimitiveBase[Inpu
         return CallResult(outputs) 
 
     def produce_score(self, *, inputs: container.DataFrame, timeout: float = None, iterations: int = None) -> CallResult[container.DataFrame]:
-        is_system = len(inputs.iloc[0, 0].shape) != 0 # check the shape of first row first column, if not a single data entry(,) then it is system-wise data (row, col)
-        if is_system: 
+        if is_system_wise(inputs):
             outputs = self._forward(inputs, '_produce_score')
         else:
             outputs = self._produce(inputs=inputs)
@@ -108,37 +136,29 @@ class TODSUnsupervisedLearnerPrimitiveBase(UnsupervisedLearnerPrimitiveBase[Inpu
         """
         A noop.
         """
-        is_system = len(self._inputs.iloc[0, 0].shape) != 0 # check the shape of first row first column, if not a single data entry(,) then it is system-wise data (row, col)
-        if is_system: 
-            data = inputs
-            col_name = list(data.columns)[0]
-            for i, _ in data.iterrows():
-                sys_data = data.iloc[i][col_name]
-                self.set_training_data(inputs=sys_data)
-                self._fit()
+        if is_system_wise(self._inputs):
+            # One fitted primitive per system
+            primitives = [self._new_system_primitive() for _ in range(len(self._inputs))]
+            self._system_primitives = map_systems(_fit_system, primitives, self._inputs, n_jobs=self._system_n_jobs(),
+                                                  timeout=timeout, iterations=iterations)
         else:
+            self._system_primitives = None
             outputs = self._fit()
             outputs = outputs.value
 
         return CallResult(None)
 
     def fit_multi_produce(self, *, produce_methods: typing.Sequence[str], inputs: Inputs, timeout: float = None, iterations: int = None) -> MultiCallResult:
-        is_system = len(inputs.iloc[0, 0].shape) != 0 # check the shape of first row first column, if not a single data entry(,) then it is system-wise data (row, col)
-        if is_system: 
+        if is_system_wise(inputs):
             data = inputs
             produce_method = produce_methods[0]
-            col_name = list(data.columns)[0]
-            results = []
-            for i, _ in data.iterrows():
-                sys_data = data.iloc[i][col_name]
-                self.set_training_data(inputs=sys_data)
-                fit_result = self._fit()
-                if produce_method == "produce":
-                    out = self._produce(inputs=sys_data, timeout=timeout)
-                else:
-                    out = self._produce_score(inputs=sys_data, timeout=timeout)
-                data.iloc[i][col_name] = out.value
-                results.append(out)
+            method = '_produce' if produce_method == "produce" else '_produce_score'
+            primitives = [self._new_system_primitive() for _ in range(len(data))]
+            fitted = map_systems(_fit_produce_system, primitives, data, n_jobs=self._system_n_jobs(),
+                                 method=method, timeout=timeout)
+            self._system_primitives = [primitive for primitive, _ in fitted]
+            results = [result for _, result in fitted]
+            data = collect_systems(data, [result.value for result in results])
             iterations_done = None
             for result in results:
                 if result.iterations_done is not None:
@@ -152,6 +172,7 @@ class TODSUnsupervisedLearnerPrimitiveBase(UnsupervisedLearnerPrimitiveBase[Inpu
                 iterations_done=iterations_done,
                 )
         else:
+            self._system_primitives = None
             return self._fit_multi_produce(produce_methods=produce_methods, timeout=timeout, iterations=iterations, inputs=inputs)
 
     @abc.abstractmethod
@@ -187,17 +208,31 @@ class TODSUnsupervisedLearnerPrimitiveBase(UnsupervisedLearnerPrimitiveBase[Inpu
 
         return
 
+    def _system_n_jobs(self):
+        """
+        Number of worker processes of system-wise data, from the system_n_jobs hyperparam if the primitive has one
+        """
+        return self.hyperparams.get('system_n_jobs', 1)
+
+    def _new_system_primitive(self):
+        """
+        Unfitted copy of the primitive holding the fitted state of one system
+        """
+        return type(self)(hyperparams=self.hyperparams, random_seed=self.random_seed,
+                          docker_containers=self.docker_containers)
+
     def _forward(self, data, method):
         """
-        General Forward Function to feed system data one-by-one to the primitive
+        General Forward Function to feed system data to the primitive, each system to the primitive fitted on it
+        when fitted on system-wise data, with system_n_jobs workers
         """
-        col_name = list(data.columns)[0]
-        for i, _ in data.iterrows():
-            sys_data = data.iloc[i][col_name]
-            produce_func = getattr(self, method, None)
-            out = produce_func(inputs=sys_data)
-            data.iloc[i][col_name] = out.value
-        return data
+        primitives = self._system_primitives
+        if primitives is None:
+            primitives = self
+        elif len(primitives) != len(data):
+            raise ValueError("Fitted on {} systems, got {}.".format(len(primitives), len(data)))
+        results = map_systems(_produce_system, primitives, data, n_jobs=self._system_n_jobs(), method=method)
+        return collect_systems(data, [result.value for result in results])
 
 
 class TODSSupervisedLearnerPrimitiveBase(SupervisedLearnerPrimitiveBase[Inputs, Outputs, Params, Hyperparams]):
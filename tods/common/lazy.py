@@ -0,0 +1,57 @@
+"""Lazy attributes of the TODS packages.
+
+The primitive modules import their backends, TensorFlow and Keras for the
+deep detectors, stumpy, xgboost or pyod for the others, so the packages do
+not import them up front. A package lists where each of its names is
+defined and imports the module when the name is first looked up:
+``from tods.detection_algorithm import TelemanomPrimitive`` imports
+TensorFlow, ``from tods.detection_algorithm import IsolationForestPrimitive``
+does not.
+"""
+import importlib
+import sys
+
+
+def lazy_attributes(package, attributes, submodules=()):
+    """Module __getattr__ and __dir__ of a package with lazy attributes.
+
+    Args:
+        package: Name of the package, its __name__
+        attributes: dict from the names of the package to the modules
+            defining them, a name is looked up in its module when first
+            accessed and kept in the package afterwards
+        submodules: Names of subpackages or modules of the package that are
+            imported when accessed as attributes
+
+    Returns:
+        (__getattr__, __dir__) to set in the package
+    """
+    submodules = set(submodules) | {module[len(package) + 1:] for module in attributes.values()
+                                    if module.startswith(package + '.') and '.' not in module[len(package) + 1:]}
+
+    def __getattr__(name):
+        namespace = sys.modules[package].__dict__
+        if name in attributes:
+            value = getattr(importlib.import_module(attributes[name]), name)
+        elif name in submodules:
+            value = importlib.import_module('{}.{}'.format(package, name))
+        else:
+            raise AttributeError("module {!r} has no attribute {!r}".format(package, name))
+        namespace[name] = value
+        return value
+
+    def __dir__():
+        namespace = sys.modules[package].__dict__
+        return sorted(set(namespace) | set(attributes) | submodules)
+
+    return __getattr__, __dir__
+
+
+def package_attributes(packages):
+    """dict from the names in __all__ of lazy packages to the package
+    defining them, the last package wins like successive star imports.
+    """
+    attributes = {}
+    for package in packages:
+        attributes.update((name, package) for name in importlib.import_module(package).__all__)
+    return attributes
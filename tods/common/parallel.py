@@ -0,0 +1,27 @@
+"""Per-column execution shared by the primitives fitting a model on each
+column of their inputs.
+"""
+from joblib import Parallel, delayed
+
+
+def map_columns(func, X, n_jobs=1, prefer='processes', **kwargs):
+    """Apply a function to every column of a DataFrame.
+
+    Args:
+        func: Module level function taking a column as a Series and the
+            keyword arguments
+        X: DataFrame
+        n_jobs: Number of workers, -1 uses all the CPU cores, 1 runs the
+            columns one after another in this process
+        prefer: 'processes' or 'threads', the kind of workers used when
+            n_jobs is not 1
+        **kwargs: Keyword arguments passed to func
+
+    Returns:
+        list, the results of func in the order of the columns of X
+    """
+    columns = [X.iloc[:, index] for index in range(X.shape[1])]
+    if n_jobs in (None, 1) or len(columns) < 2:
+        return [func(column, **kwargs) for column in columns]
+
+    return Parallel(n_jobs=n_jobs, prefer=prefer)(delayed(func)(column, **kwargs) for column in columns)
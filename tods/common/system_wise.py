@@ -0,0 +1,135 @@
+"""System-wise data shared by the TODS base primitives and the system-wise
+detection primitive.
+
+A system-wise dataset is a DataFrame whose cells of the first column are the
+DataFrames of the systems. PackedSystems holds the same data in one
+contiguous array with the row offsets of the systems, which avoids a
+DataFrame per system when the systems are small.
+"""
+import itertools
+
+import numpy as np
+from joblib import Parallel, delayed
+
+from d3m import container
+
+
+class PackedSystems:
+    """Systems stored one after another in one array.
+
+    Args:
+        values: numpy array of shape (n_samples, n_columns), the samples of
+            all the systems one after another
+        offsets: numpy array of shape (n_systems + 1,), rows
+            offsets[i]:offsets[i + 1] of values are the samples of system i
+        columns: Names of the columns, their positions as strings if not given
+    """
+    def __init__(self, values, offsets, columns=None):
+        values = np.asarray(values)
+        if values.ndim == 1:
+            values = values[:, np.newaxis]
+        offsets = np.asarray(offsets, dtype=np.int64)
+        if offsets.ndim != 1 or len(offsets) < 2 or offsets[0] != 0 or offsets[-1] != values.shape[0] \
+                or np.any(np.diff(offsets) < 0):
+            raise ValueError("offsets must increase from 0 to the {} rows of values.".format(values.shape[0]))
+
+        self.values = np.ascontiguousarray(values)
+        self.offsets = offsets
+        if columns is None:
+            columns = [str(index) for index in range(values.shape[1])]
+        self.columns = list(columns)
+
+    @classmethod
+    def from_frames(cls, frames):
+        """Pack a sequence of DataFrames or 2D arrays with the same columns."""
+        frames = list(frames)
+        values = np.concatenate([np.asarray(frame) for frame in frames])
+        offsets = np.concatenate([[0], np.cumsum([len(frame) for frame in frames])])
+        return cls(values, offsets, getattr(frames[0], 'columns', None))
+
+    @classmethod
+    def from_system_frame(cls, data):
+        """Pack a DataFrame whose first column holds the systems."""
+        return cls.from_frames(data.iloc[:, 0])
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    @property
+    def lengths(self):
+        """Number of samples of every system."""
+        return np.diff(self.offsets)
+
+    def system_values(self, index):
+        """Samples of a system as a view of values."""
+        return self.values[self.offsets[index]:self.offsets[index + 1]]
+
+    def system(self, index):
+        """Samples of a system as a container DataFrame."""
+        return container.DataFrame(self.system_values(index), columns=self.columns, generate_metadata=True)
+
+    def __iter__(self):
+        return (self.system(index) for index in range(len(self)))
+
+    def to_system_frame(self, column_name='system'):
+        """DataFrame of DataFrames with the systems in its only column."""
+        return container.DataFrame({column_name: list(self)}, columns=[column_name], generate_metadata=False)
+
+
+def is_system_wise(inputs):
+    """Whether the inputs hold one DataFrame per system rather than samples.
+
+    The first cell of a system-wise DataFrame has two dimensions while a
+    sample is a scalar.
+    """
+    if isinstance(inputs, PackedSystems):
+        return True
+    return len(getattr(inputs.iloc[0, 0], 'shape', ())) != 0
+
+
+def iter_systems(inputs):
+    """DataFrames of the systems of system-wise inputs, in order."""
+    if isinstance(inputs, PackedSystems):
+        return iter(inputs)
+    return iter(inputs.iloc[:, 0])
+
+
+def map_systems(func, primitives, inputs, n_jobs=1, **kwargs):
+    """Call a function with the primitive and the DataFrame of every system.
+
+    Args:
+        func: Module level function taking a primitive, the DataFrame of a
+            system and the keyword arguments
+        primitives: One primitive per system, or a single primitive used for
+            all of them
+        inputs: System-wise DataFrame or PackedSystems
+        n_jobs: Number of worker processes, -1 uses all the CPU cores, 1
+            runs the systems one after another in this process
+        **kwargs: Keyword arguments passed to func
+
+    Returns:
+        list, the results of func in the order of the systems
+    """
+    n_systems = len(inputs)
+    if not isinstance(primitives, (list, tuple)):
+        primitives = itertools.repeat(primitives, n_systems)
+    tasks = zip(primitives, iter_systems(inputs))
+    if n_jobs in (None, 1) or n_systems < 2:
+        return [func(primitive, system, **kwargs) for primitive, system in tasks]
+
+    # The DataFrames of packed systems are built as the workers consume them
+    return Parallel(n_jobs=n_jobs)(delayed(func)(primitive, system, **kwargs) for primitive, system in tasks)
+
+
+def collect_systems(inputs, outputs):
+    """Put the output DataFrames of the systems back in the layout of the
+    inputs: a PackedSystems for packed inputs, otherwise a copy of the
+    system-wise DataFrame with the outputs in place of the systems.
+    """
+    if isinstance(inputs, PackedSystems):
+        return PackedSystems.from_frames(outputs)
+    # Leave the caller's inputs untouched
+    inputs = inputs.copy()
+    for index, output in enumerate(outputs):
+        inputs.iat[index, 0] = output
+    return inputs
@@ -8,6 +8,9 @@ from d3m import utils
 
 import time
 
+import numpy as np
+import pandas as pd
+
 __all__ = ('ContinuityValidationPrimitive',)
 
 Inputs = container.DataFrame
@@ -95,72 +98,119 @@ class ContinuityValidationPrimitive(transformer.TransformerPrimitiveBase[Inputs,
     def _find_ablation_set(self, inputs):
         """
         Find the longest series with minimum timestamp interval of inputs
-        """
-        # find the min inteval and max interval
-        min_interval = inputs.iloc[1]['timestamp'] - inputs.iloc[0]['timestamp']
-        for i in range(2, inputs.shape[0]):
-            curr_interval = inputs.iloc[i]['timestamp'] - inputs.iloc[i - 1]['timestamp']
-            if min_interval > curr_interval:
-                min_interval = curr_interval
-
-        max_interval = ((inputs.iloc[-1]['timestamp'] - inputs.iloc[0]['timestamp']) + min_interval * (2 - inputs.shape[0]))
-
-        print((inputs.iloc[-1]['timestamp'] - inputs.iloc[0]['timestamp']), inputs.shape[0])
-
-        interval = min_interval
-        ablation_set = list()
-        origin_set = set(inputs['timestamp'])
-
-        print(min_interval, max_interval)
-
-        while interval <= max_interval:
-            start = 0
-            while  (inputs.iloc[start]['timestamp'] <= inputs.iloc[0]['timestamp'] + max_interval) and (inputs.iloc[start]['timestamp'] <= inputs.iloc[-1]['timestamp']):
-                tmp_list = list()
-                tmp = utils.numpy.arange(start=inputs.iloc[start]['timestamp'], step=interval,stop=inputs.iloc[-1]['timestamp'])
-
-                for i in tmp:
-                    if i in origin_set:
-                        tmp_list.append(i)
-                    else: break
 
-                ablation_set.append(tmp_list)
-                start += 1
-
-            interval += min_interval
-
-        max_size_index = 0
-        for i in range(1, len(ablation_set)):
-            if len(ablation_set[i]) > len(ablation_set[max_size_index]):
-                max_size_index = i
-        return ablation_set[max_size_index]
+        Candidate series start at one of the first timestamps and step by a multiple
+        of the minimum interval, they are ranked by interval then start and the first
+        longest one is kept. Timestamps are placed on grids of the minimum interval,
+        so that the length of every candidate of an interval is found at once with
+        run-length operations on the positions of a grid.
+        """
+        timestamps = np.unique(inputs['timestamp'].to_numpy(dtype=np.float64))
+        if timestamps.shape[0] < 2:
+            return list(timestamps)
+
+        # find the min inteval and max interval, in min intervals
+        min_interval = np.min(np.diff(timestamps))
+        scaled = (timestamps - timestamps[0]) / min_interval
+        end = scaled[-1]
+        max_interval = end + 2 - timestamps.shape[0]
+
+        # timestamps are positions on the grid of their phase
+        positions = np.floor(scaled + 1e-9).astype(np.int64)
+        phases = np.unique(np.round(scaled - positions, 9), return_inverse=True)[1].reshape(-1)
+        starts = np.flatnonzero(scaled <= max_interval + 1e-9)
+
+        grids = {}
+        for phase in np.unique(phases[starts]):
+            members = np.flatnonzero(phases == phase)
+            stop = end - (scaled[members[0]] - positions[members[0]])
+            if np.isclose(stop, np.rint(stop)):
+                stop = np.rint(stop)
+            grid_size = int(np.floor(stop + 1e-9)) + 1
+            present = np.zeros(grid_size, dtype=bool)
+            present[positions[members]] = True
+            grids[phase] = (members, np.flatnonzero(~present), grid_size, stop)
+
+        best_length, best_start, best_step = 0, 0, 1
+        for step in range(1, int(np.floor(max_interval + 1e-9)) + 1):
+            # no longer series than the best one with this or a larger interval
+            if np.ceil(end / step) <= best_length:
+                break
+
+            lengths = np.zeros(starts.shape[0], dtype=np.int64)
+            for phase, (members, missing, grid_size, stop) in grids.items():
+                in_phase = phases[starts] == phase
+                lengths[in_phase] = _series_lengths(positions[members], missing, grid_size,
+                                                    positions[starts[in_phase]], step, stop)
+
+            candidate = np.argmax(lengths)
+            if lengths[candidate] > best_length:
+                best_length, best_start, best_step = lengths[candidate], starts[candidate], step
+
+        members = grids[phases[best_start]][0]
+        series_positions = positions[best_start] + best_step * np.arange(best_length)
+        return list(timestamps[members[np.searchsorted(positions[members], series_positions)]])
 
 
     def _continuity_imputation(self, inputs: Inputs):
         """
         Linearly imputate the missing timestmap and value of inputs
+
+        All the absent timestamps are generated at once from the gaps between
+        consecutive rows and appended before sorting.
         """
         interval = self.hyperparams['interval']
-        time1 = inputs.iloc[0]['timestamp']
-      
-        for i in range(1, inputs.shape[0]):
-            time2 = inputs.iloc[i]['timestamp']
-            if time2 - time1 != interval:
-            
-                blank_number = int((time2 - time1) / interval) # how many imputation should there be between two timestamps in original data
-                for j in range(1, blank_number):
-
-                    dict = {'timestamp':[time1 + interval * j], 'ground_truth':[int(inputs.iloc[i]['ground_truth'])]}
-
-                    for col in list(inputs.columns.values):
-                        if not col in ['d3mIndex', 'timestamp', 'ground_truth']:
-                            dict[col] = [inputs.iloc[i-1][col] + (inputs.iloc[i][col] - inputs.iloc[i-1][col]) / blank_number * j]
-                    
-                    inputs = inputs.append(utils.pandas.DataFrame(dict), ignore_index=True, sort=False)
-                                
-            time1 = time2
+        timestamps = inputs['timestamp'].to_numpy(dtype=np.float64)
+
+        # how many imputation should there be between two timestamps in original data
+        differences = np.diff(timestamps)
+        blank_numbers = np.zeros(differences.shape[0], dtype=np.int64)
+        gaps = differences != interval
+        blank_numbers[gaps] = np.trunc(differences[gaps] / interval)
+        counts = np.maximum(blank_numbers - 1, 0)
+
+        if counts.sum() > 0:
+            # previous row and index in the gap of every imputed row
+            previous = np.repeat(np.arange(differences.shape[0]), counts)
+            j = np.arange(previous.shape[0]) - np.repeat(np.cumsum(counts) - counts, counts) + 1
+            blank_number = blank_numbers[previous]
+
+            imputed = {'timestamp': timestamps[previous] + interval * j,
+                       'ground_truth': inputs['ground_truth'].to_numpy()[previous + 1].astype(int)}
+            for col in list(inputs.columns.values):
+                if not col in ['d3mIndex', 'timestamp', 'ground_truth']:
+                    values = inputs[col].to_numpy()
+                    imputed[col] = values[previous] + (values[previous + 1] - values[previous]) / blank_number * j
+
+            inputs = pd.concat([inputs, pd.DataFrame(imputed)], ignore_index=True, sort=False)
 
         inputs.sort_values("timestamp",inplace=True)
         inputs['d3mIndex'] = list(range(inputs.shape[0]))
         return inputs
 
+
+def _series_lengths(points, missing, grid_size, starts, step, stop):
+    """
+    Length of the series stepping by ``step`` from each of ``starts`` over the
+    sorted ``points`` of a grid, stopping before the position ``stop``.
+    """
+    lengths = np.ceil((stop - starts) / step).astype(np.int64)
+
+    # sort the positions by residue class and position
+    if missing.shape[0] < points.shape[0]:
+        # stop at the first missing position of the residue class
+        keys = np.sort((missing % step) * grid_size + missing)
+        found = np.searchsorted(keys, (starts % step) * grid_size + starts)
+        if keys.shape[0] > 0:
+            found_key = keys[np.minimum(found, keys.shape[0] - 1)]
+            has_missing = (found < keys.shape[0]) & (found_key // grid_size == starts % step)
+            lengths = np.where(has_missing, np.minimum(lengths, (found_key % grid_size - starts) // step), lengths)
+    else:
+        # stop at the end of the run of consecutive points of the residue class
+        keys = np.sort((points % step) * grid_size + points)
+        run_ends = np.append(np.flatnonzero((np.diff(keys) != step) | (np.diff(keys // grid_size) != 0)),
+                             keys.shape[0] - 1)
+        found = np.searchsorted(keys, (starts % step) * grid_size + starts)
+        lengths = np.minimum(lengths, run_ends[np.searchsorted(run_ends, found)] - found + 1)
+
+    return lengths
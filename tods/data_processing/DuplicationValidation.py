@@ -8,6 +8,8 @@ from d3m import utils
 
 import time
 
+import numpy
+
 __all__ = ('DuplicationValidationPrimitive',)
 
 Inputs = container.DataFrame
@@ -73,16 +75,35 @@ class DuplicationValidationPrimitive(transformer.TransformerPrimitiveBase[Inputs
         return inputs.drop_duplicates(subset=['timestamp'],keep='first')
 
     def _timestamp_keep_average(self, inputs: Inputs):
-        inputs_copy = inputs.copy()
-        inputs = inputs.drop_duplicates(subset=['timestamp'],keep='first')
-        
-        inputs_copy = inputs_copy.groupby('timestamp').mean().reset_index()
+        outputs = drop_duplicate_timestamps(inputs, 'average')
+        if outputs is inputs:
+            outputs = inputs.copy()
+        return outputs
+
+
+def drop_duplicate_timestamps(inputs: Inputs, keep_option: str = 'first') -> Inputs:
+    """
+    Drop the rows with a duplicated timestamp, keeping the first row or the first row
+    with the average values of its timestamp. The inputs are returned as is when no
+    timestamp is duplicated.
 
-        for col in list(inputs.columns.values):
-            if not col in ['d3mIndex', 'timestamp', 'ground_truth']:
-                
-                inputs[col] = inputs_copy[col].values
-                
+    Args:
+        inputs: Container DataFrame
+        keep_option: 'first' or 'average'
 
+    Returns:
+        Container DataFrame without duplicated timestamps
+    """
+    duplicated = inputs['timestamp'].duplicated(keep='first')
+    if not duplicated.any():
         return inputs
 
+    outputs = inputs.take(numpy.flatnonzero(~duplicated.values))
+    if keep_option == 'average':
+        value_columns = [col for col in inputs.columns if not col in ['d3mIndex', 'timestamp', 'ground_truth']]
+        # groups are in order of first appearance, like the rows kept
+        averages = inputs.groupby('timestamp', sort=False)[value_columns].mean()
+        for col in value_columns:
+            outputs[col] = averages[col].values
+
+    return outputs
@@ -144,35 +144,46 @@ class TimeIntervalTransformPrimitive(transformer.TransformerPrimitiveBase[Inputs
         Returns:
             Container DataFrame with resampled time intervals
         """
-        
-        #configure dataframe for resampling
-        inputs['timestamp'] = pd.to_datetime(inputs['timestamp'], unit='s')
-        inputs['timestamp'] = inputs['timestamp'].dt.tz_localize('US/Pacific')
-        inputs = inputs.set_index('timestamp')
+        return resample_time_interval(inputs, self.hyperparams['time_interval'])
 
-        #resample dataframe
-        inputs = inputs.resample(self.hyperparams['time_interval']).mean()
 
-        #configure dataframe to original format
-        inputs = inputs.reset_index()
-        value_columns = list(set(inputs.columns) - set(['d3mIndex', 'timestamp', 'ground_truth']))
-        inputs = inputs.reindex(columns=['d3mIndex','timestamp'] + value_columns + ['ground_truth'])
-        inputs['timestamp'] = inputs['timestamp'].astype(np.int64) // 10 ** 9
-        inputs['d3mIndex'] = range(0, len(inputs))
+    def _update_metadata(self, outputs):
+        outputs.metadata = outputs.metadata.generate(outputs)
 
-        """
-        Since the mean of the ground_truth was taken for a set interval, 
-        we should set those values that are greater than 0 to 1 so they are consistent with original data
-        """
-        for i in range(len(inputs['ground_truth'])):
-            if(inputs['ground_truth'][i] > 0):
-                inputs.loc[i, 'ground_truth'] = 1
 
-        inputs = container.DataFrame(inputs)    #convert pandas DataFrame back to d3m comtainer(Important)
 
-        return inputs
+def resample_time_interval(inputs: Inputs, time_interval: str) -> Outputs:
+    """
+    Resample a time series to the mean of every time_interval, the inputs are left untouched
 
+    Args:
+        inputs: Container DataFrame
+        time_interval: Pandas offset alias of the new interval
+    Returns:
+        Container DataFrame with resampled time intervals
+    """
 
-    def _update_metadata(self, outputs):
-        outputs.metadata = outputs.metadata.generate(outputs)
+    #configure dataframe for resampling
+    timestamps = pd.to_datetime(inputs['timestamp'], unit='s').dt.tz_localize('US/Pacific')
+    outputs = inputs.drop(columns=['timestamp'])
+    outputs.index = pd.DatetimeIndex(timestamps, name='timestamp')
+
+    #resample dataframe
+    outputs = outputs.resample(time_interval).mean()
+
+    #configure dataframe to original format
+    outputs = outputs.reset_index()
+    value_columns = [col for col in outputs.columns if not col in ['d3mIndex', 'timestamp', 'ground_truth']]
+    outputs = outputs.reindex(columns=['d3mIndex','timestamp'] + value_columns + ['ground_truth'])
+    outputs['timestamp'] = outputs['timestamp'].astype(np.int64) // 10 ** 9
+    outputs['d3mIndex'] = range(0, len(outputs))
+
+    """
+    Since the mean of the ground_truth was taken for a set interval, 
+    we should set those values that are greater than 0 to 1 so they are consistent with original data
+    """
+    outputs.loc[outputs['ground_truth'] > 0, 'ground_truth'] = 1
+
+    outputs = container.DataFrame(outputs)    #convert pandas DataFrame back to d3m comtainer(Important)
 
+    return outputs
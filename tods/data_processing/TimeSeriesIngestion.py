@@ -0,0 +1,78 @@
+import typing
+
+from d3m import container
+from d3m.primitive_interfaces import base, transformer
+from d3m.metadata import hyperparams
+
+from tods.data_processing.TimeStampValidation import sort_by_timestamp
+from tods.data_processing.DuplicationValidation import drop_duplicate_timestamps
+from tods.data_processing.TimeIntervalTransform import resample_time_interval
+
+__all__ = ('TimeSeriesIngestionPrimitive',)
+
+Inputs = container.DataFrame
+Outputs = container.DataFrame
+
+from tods.utils import construct_primitive_metadata
+
+class Hyperparams(hyperparams.Hyperparams):
+    keep_option = hyperparams.Enumeration(
+        values=['first', 'average'],
+        default='first',
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/ControlParameter'],
+        description="When dropping rows, choose to keep the first one of duplicated data or calculate their average",
+    )
+    time_interval = hyperparams.Hyperparameter[typing.Union[str, None]](
+        default=None,
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/ControlParameter'],
+        description='Time interval to resample the timestamps to, the timestamps are not resampled if None.'
+    )
+
+
+class TimeSeriesIngestionPrimitive(transformer.TransformerPrimitiveBase[Inputs, Outputs, Hyperparams]):
+    """
+    Validate, deduplicate and resample a time series in one primitive, with the same
+    results as TimeStampValidation, DuplicationValidation and TimeIntervalTransform
+    one after another. Each step only copies the rows it changes and the metadata
+    is generated once.
+
+    Parameters
+    ----------
+    keep_option :enumeration
+        When dropping rows, choose to keep the first one or calculate the average
+    time_interval :Union[str, None]
+        Time interval to resample the timestamps to, the timestamps are not resampled if None.
+    """
+
+    __author__: "DATA Lab at Texas A&M University"
+
+
+    metadata = construct_primitive_metadata(module='data_processing', name='time_series_ingestion', id='TimeSeriesIngestionPrimitive', primitive_family='data_preprocessing', description='Time Series Ingestion')
+
+    def produce(self, *, inputs: Inputs, timeout: float = None, iterations: int = None) -> base.CallResult[Outputs]:
+        """
+        Args:
+            inputs: Container DataFrame
+            timeout: Default
+            iterations: Default
+
+        Returns:
+            Container DataFrame sorted by Time Stamp, without duplicated Time Stamp and resampled
+        """
+        outputs = sort_by_timestamp(inputs, 'timestamp')
+        outputs = drop_duplicate_timestamps(outputs, self.hyperparams['keep_option'])
+
+        if self.hyperparams['time_interval'] is not None:
+            outputs = resample_time_interval(outputs, self.hyperparams['time_interval'])
+        elif outputs is inputs:
+            outputs = inputs.reset_index(drop=True)
+        else:
+            # only the intermediate frames are modified in place
+            outputs.reset_index(drop=True, inplace=True)
+
+        self._update_metadata(outputs)
+
+        return base.CallResult(outputs)
+
+    def _update_metadata(self, outputs):
+        outputs.metadata = outputs.metadata.generate(outputs)
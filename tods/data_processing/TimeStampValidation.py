@@ -42,11 +42,7 @@ class TimeStampValidationPrimitive(transformer.TransformerPrimitiveBase[Inputs,
         self.logger.info('Time Stamp order validation called')
         outputs = inputs
         try:
-            if (self._is_time_stamp_sorted(inputs, 'timestamp')):
-                outputs = inputs
-            else:
-                outputs = inputs.sort_values(by=["timestamp"])
-
+            outputs = sort_by_timestamp(inputs, 'timestamp')
 
             self._update_metadata(outputs)
 
@@ -55,7 +51,6 @@ class TimeStampValidationPrimitive(transformer.TransformerPrimitiveBase[Inputs,
 
         except Exception as e :
             self.logger.error('Time Stamp order validation error  %s :',e)
-        print(self.logger.info(base.CallResult(outputs).value))
         return base.CallResult(outputs)
 
     def _is_time_stamp_sorted(self,input:Inputs,column:str = 'timestamp') -> bool :
@@ -69,7 +64,39 @@ class TimeStampValidationPrimitive(transformer.TransformerPrimitiveBase[Inputs,
             Boolean : True  if timestamp column is sorted  False if not
 
         """
-        return all(input[column][i] <= input[column][i+1] for i in range(len(input[column])-1))
+        return is_time_stamp_sorted(input, column)
 
     def _update_metadata(self, outputs):
         outputs.metadata = outputs.metadata.generate(outputs)
+
+
+def is_time_stamp_sorted(inputs: Inputs, column: str = 'timestamp') -> bool:
+    """
+    Check the order of a timestamp column in one column-wise pass
+
+    Args:
+        inputs: Container Dataframe
+        column: Column Name
+
+    Returns:
+        Boolean : True  if timestamp column is sorted  False if not
+
+    """
+    return inputs[column].is_monotonic_increasing
+
+
+def sort_by_timestamp(inputs: Inputs, column: str = 'timestamp') -> Inputs:
+    """
+    Sort a time series by its timestamp column, the inputs are returned as is when already sorted
+
+    Args:
+        inputs: Container Dataframe
+        column: Column Name
+
+    Returns:
+        Container Dataframe sorted by Time Stamp
+
+    """
+    if is_time_stamp_sorted(inputs, column):
+        return inputs
+    return inputs.sort_values(by=[column])
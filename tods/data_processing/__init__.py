@@ -1,8 +1,17 @@
-from tods.data_processing.CategoricalToBinary import CategoricalToBinaryPrimitive
-from tods.data_processing.ColumnFilter import ColumnFilterPrimitive
-from tods.data_processing.ContinuityValidation import ContinuityValidationPrimitive
-from tods.data_processing.DatasetToDataframe import DatasetToDataFramePrimitive
-from tods.data_processing.DuplicationValidation import DuplicationValidationPrimitive
-from tods.data_processing.SKImputer import SKImputerPrimitive
-from tods.data_processing.TimeIntervalTransform import TimeIntervalTransformPrimitive
-from tods.data_processing.TimeStampValidation import TimeStampValidationPrimitive
+from tods.common.lazy import lazy_attributes
+
+# The primitives are imported on first access, see tods.common.lazy
+_PRIMITIVES = {
+    'CategoricalToBinaryPrimitive': 'tods.data_processing.CategoricalToBinary',
+    'ColumnFilterPrimitive': 'tods.data_processing.ColumnFilter',
+    'ContinuityValidationPrimitive': 'tods.data_processing.ContinuityValidation',
+    'DatasetToDataFramePrimitive': 'tods.data_processing.DatasetToDataframe',
+    'DuplicationValidationPrimitive': 'tods.data_processing.DuplicationValidation',
+    'SKImputerPrimitive': 'tods.data_processing.SKImputer',
+    'TimeIntervalTransformPrimitive': 'tods.data_processing.TimeIntervalTransform',
+    'TimeSeriesIngestionPrimitive': 'tods.data_processing.TimeSeriesIngestion',
+    'TimeStampValidationPrimitive': 'tods.data_processing.TimeStampValidation',
+}
+
+__all__ = list(_PRIMITIVES)
+__getattr__, __dir__ = lazy_attributes(__name__, _PRIMITIVES)
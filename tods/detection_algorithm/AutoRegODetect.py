@@ -82,6 +82,20 @@ class Hyperparams(Hyperparams_ODBase):
         semantic_types=['https://metadata.datadrivendiscovery.org/types/ControlParameter']
     )
 
+    batch_size = hyperparams.Union[Union[int, None]](
+        configuration=OrderedDict(
+            limit=hyperparams.Hyperparameter[int](
+                default=1024,
+            ),
+            unlimited=hyperparams.Hyperparameter[None](
+                default=None,
+            ),
+        ),
+        default='unlimited',
+        description='Number of windows scored at once so that memory stays bounded on long series, all the windows at once if None.',
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/ResourcesUseParameter'],
+    )
+
     pass
 
 
@@ -110,6 +124,9 @@ Parameters
         'median'}. Pass in weights of detector for weighted version.
     weights : numpy array of shape (1, n_dimensions)
         Score weight by dimensions. (default=[1,1,...,1])
+    batch_size : int, optional (default=None)
+        Number of windows scored at once so that memory stays bounded on
+        long series, all the windows at once if None.
 
 .. dropdown:: Attributes
 
@@ -137,6 +154,7 @@ Parameters
                                     step_size=hyperparams['step_size'],
                                     method=hyperparams['method'],
                                     weights=hyperparams['weights'],
+                                    batch_size=hyperparams['batch_size'],
                                     )
 
         return
@@ -122,6 +122,20 @@ class Hyperparams(Hyperparams_ODBase):
         semantic_types=['https://metadata.datadrivendiscovery.org/types/ControlParameter'],
     )
 
+    batch_size = hyperparams.Union[Union[int, None]](
+        configuration=OrderedDict(
+            limit=hyperparams.Hyperparameter[int](
+                default=1024,
+            ),
+            unlimited=hyperparams.Hyperparameter[None](
+                default=None,
+            ),
+        ),
+        default='unlimited',
+        description='Number of windows scored at once so that memory stays bounded on long series, all the windows at once if None.',
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/ResourcesUseParameter'],
+    )
+
     pass
 
 
@@ -211,6 +225,9 @@ Parameters
         See http://scikit-learn.org/stable/modules/generated/sklearn.metrics.pairwise.pairwise_distances
     metric_params : dict, optional (default = None)
         Additional keyword arguments for the metric function.
+    batch_size : int, optional (default=None)
+        Number of windows scored at once so that memory stays bounded on
+        long series, all the windows at once if None.
 
 .. dropdown:: Attributes
 
@@ -250,6 +267,7 @@ Parameters
                             metric=hyperparams['metric'],
                             metric_params=hyperparams['metric_params'],
                             p=hyperparams['p'],
+                            batch_size=hyperparams['batch_size'],
                             )
 
         return
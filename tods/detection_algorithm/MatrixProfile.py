@@ -35,12 +35,13 @@ import uuid
 
 from d3m import container, utils as d3m_utils
 from .core.CollectiveBase import CollectiveBaseDetector
-from .core.utility import get_sub_matrices
+from .core.utility import get_sub_sequences_length
 
 from .UODBasePrimitive import Params_ODBase, Hyperparams_ODBase, UnsupervisedOutlierDetectorBase
 import stumpy
 
 from sklearn.preprocessing import MinMaxScaler
+from tods.feature_analysis.core.matrix_profile import IncrementalMatrixProfile, approximate_matrix_profile, pad_profile
 # from typing import Union
 
 Inputs = d3m_dataframe
@@ -61,15 +62,54 @@ class Hyperparams(Hyperparams_ODBase):
         description='The moving window size.',
         semantic_types=['https://metadata.datadrivendiscovery.org/types/TuningParameter']
     )
+    incremental = hyperparams.UniformBool(
+        default=False,
+        description='Keep the matrix profile between calls and only compute the profiles of the new subsequences when the inputs continue the previous ones, e.g. a sliding window over a stream.',
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/ControlParameter']
+    )
+    approximate = hyperparams.UniformBool(
+        default=False,
+        description='Compute an approximate matrix profile from a random subset of the diagonals of the distance matrix, SCRIMP-style, bounded by percentage and time_budget. Takes precedence over incremental.',
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/ControlParameter']
+    )
+    percentage = hyperparams.Uniform(
+        lower=0.,
+        upper=1.,
+        default=0.1,
+        upper_inclusive=True,
+        description='Fraction of the diagonals of the distance matrix visited by the approximate matrix profile, 1 gives the exact profile.',
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/TuningParameter']
+    )
+    time_budget = hyperparams.Union[typing.Union[float, None]](
+        configuration=OrderedDict(
+            limit=hyperparams.Hyperparameter[float](
+                default=1.,
+            ),
+            unlimited=hyperparams.Hyperparameter[None](
+                default=None,
+            ),
+        ),
+        default='unlimited',
+        description='Seconds after which the approximate matrix profile stops visiting diagonals.',
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/ControlParameter']
+    )
 
 class MP(CollectiveBaseDetector):
     """
     This is the class for matrix profile function
     """
-    def __init__(self, window_size, step_size, contamination):
+    def __init__(self, window_size, step_size, contamination, incremental=False, approximate=False, percentage=0.1,
+                 time_budget=None, random_state=None):
         self._window_size = window_size
         self._step_size = step_size
         self.contamination = contamination
+        self._profile = IncrementalMatrixProfile(window_size) if incremental else None
+        self._approximate = approximate
+        self._percentage = percentage
+        self._time_budget = time_budget
+        self._random_state = random_state
+        self._last_X = None
+        self._last_scores = None
         return
 
     def _get_right_inds(self, data):
@@ -81,6 +121,40 @@ class MP(CollectiveBaseDetector):
         data.columns = range(0,len(data.columns))
         return data
 
+    def _matrix_profile(self, X):
+        """Sum over the dimensions of the min-max scaled matrix profile of X,
+        reused when X is the series of the previous call, e.g. the training
+        data scored after fit.
+
+        Returns
+        -------
+        scores : numpy array of shape (n_samples,)
+        """
+        X = np.asarray(X, dtype=np.float64)
+        if self._last_X is not None and np.array_equal(self._last_X, X):
+            return self._last_scores
+
+        if self._approximate:
+            matrix_profile, _ = approximate_matrix_profile(X, self._window_size, percentage=self._percentage,
+                                                           time_budget=self._time_budget,
+                                                           random_state=self._random_state)
+        elif self._profile is not None:
+            matrix_profile = self._profile.update(X)
+        else:
+            matrix_profile, _ = stumpy.mstump(X.transpose(), m = self._window_size)
+        matrix_profile = pad_profile(matrix_profile.T, X.shape[0])
+
+        # apply min-max scaling and sum over the dimension with normalized MP value
+        matrix_profile = MinMaxScaler().fit_transform(matrix_profile)
+        self._last_X = X.copy()
+        self._last_scores = np.sum(matrix_profile, axis=1)
+        return self._last_scores
+
+    def _get_inds(self, n_samples):
+        valid_len = max(get_sub_sequences_length(n_samples, self._window_size, self._step_size), 0)
+        left_inds_ = np.arange(valid_len) * self._step_size
+        return left_inds_, left_inds_ + self._window_size
+
     def fit(self, X):
         """Fit detector. y is ignored in unsupervised methods.
         Parameters
@@ -94,36 +168,8 @@ class MP(CollectiveBaseDetector):
         self : object
             Fitted estimator.
         """
-        sub_matrices, self.left_inds_, self.right_inds_ = get_sub_matrices(
-            X,
-            window_size=self._window_size,
-            step=self._step_size,
-            return_numpy=True,
-            flatten=True)
-        sub_matrices = sub_matrices[:-1, :]
-        #self.left_inds_ = self.left_inds_[:-1]
-        #self.right_inds_ = self.right_inds_[:-1]
-        matrix_profile, matrix_profile_indices = stumpy.mstump(X.transpose(), m = self._window_size)
-        blank = X.shape[0] - matrix_profile.shape[0]
-        for i in range(blank):
-            matrix_profile = np.append(matrix_profile, [matrix_profile[-1]], axis=0)
-        #matrix_profile, matrix_profile_indices = stumpy.mstump(data, m = self._window_size)
-
-        #left_inds_ = numpy.arange(0, len(matrix_profile), self._step_size)
-        #right_inds_ = left_inds_ + self._window_size
-        #right_inds_[right_inds_ > len(matrix_profile)] = len(matrix_profile)
-        #left_inds_ = np.array([left_inds_]).transpose()
-        #right_inds_ = np.array([right_inds_]).transpose()
-        
-        # apply min-max scaling
-        scaler = MinMaxScaler()
-        scaler = scaler.fit(matrix_profile)
-        matrix_profile = scaler.transform(matrix_profile)
-
-        # sum over the dimension with normalized MP value
-        if len(matrix_profile.shape) > 1 or matrix_profile.shape[1] > 1:
-            matrix_profile = np.sum(matrix_profile, axis=1)
-        self.decision_scores_ = matrix_profile
+        self.left_inds_, self.right_inds_ = self._get_inds(X.shape[0])
+        self.decision_scores_ = self._matrix_profile(X)
         self._process_decision_scores()
         return self
 
@@ -131,50 +177,13 @@ class MP(CollectiveBaseDetector):
 
         """
         Args:
-            data: dataframe column
+            X: numpy array of shape (n_samples, n_features)
         Returns:
-            nparray
-        """
+            nparray of the scores of the samples, left and right indices
+            of the subsequences
         """
-        #only keep first two columns of MP results, the second column is left index, use windowsize to get right index
-        transformed_columns=utils.pandas.DataFrame()
-        for col in data.transpose(): #data.reshape(1,len(data)):
-            output = stumpy.stump(col, m = self._window_size)
-            output = pd.DataFrame(output)
-            output=output.drop(columns=[2,3])
-            output = self._get_right_inds(output)
-            transformed_columns=pd.concat([transformed_columns,output], axis=1)
-        return transformed_columns
-        """
-        sub_matrices, left_inds_, right_inds_ = get_sub_matrices(
-            X,
-            window_size=self._window_size,
-            step=self._step_size,
-            return_numpy=True,
-            flatten=True)
-        sub_matrices = sub_matrices[:-1, :]
-        matrix_profile, matrix_profile_indices = stumpy.mstump(X.transpose(), m = self._window_size)
-        blank = X.shape[0] - matrix_profile.shape[0]
-        for i in range(blank):
-            matrix_profile = np.append(matrix_profile, [matrix_profile[-1]], axis=0)
-        #matrix_profile, matrix_profile_indices = stumpy.mstump(data, m = self._window_size)
-
-        #left_inds_ = numpy.arange(0, len(matrix_profile), self._step_size)
-        #right_inds_ = left_inds_ + self._window_size
-        #right_inds_[right_inds_ > len(matrix_profile)] = len(matrix_profile)
-        #left_inds_ = np.array([left_inds_]).transpose()
-        #right_inds_ = np.array([right_inds_]).transpose()
-        
-        # apply min-max scaling
-        scaler = MinMaxScaler()
-        scaler = scaler.fit(matrix_profile)
-        matrix_profile = scaler.transform(matrix_profile)
-
-        # sum over the dimension with normalized MP value
-        if len(matrix_profile.shape) > 1 or matrix_profile.shape[1] > 1:
-            matrix_profile = np.sum(matrix_profile, axis=1)
-
-        return matrix_profile, left_inds_, right_inds_
+        left_inds_, right_inds_ = self._get_inds(X.shape[0])
+        return self._matrix_profile(X), left_inds_, right_inds_
         
 class MatrixProfilePrimitive(UnsupervisedOutlierDetectorBase[Inputs, Outputs, Params, Hyperparams]):
     """
@@ -204,7 +213,7 @@ Parameters
     
     """
 
-    metadata = construct_primitive_metadata(module='detection_algorithm', name='matrix_profile', id='MatrixProfilePrimitive', primitive_family='anomaly_detect', hyperparams=['window_size'], description='Matrix Profile')
+    metadata = construct_primitive_metadata(module='detection_algorithm', name='matrix_profile', id='MatrixProfilePrimitive', primitive_family='anomaly_detect', hyperparams=['window_size', 'percentage'], description='Matrix Profile')
 
 
     def __init__(self, *,
@@ -213,7 +222,9 @@ Parameters
                  docker_containers: Dict[str, DockerContainer] = None) -> None:
         super().__init__(hyperparams=hyperparams, random_seed=random_seed, docker_containers=docker_containers)
 
-        self._clf = MP(window_size=hyperparams['window_size'], step_size=hyperparams['step_size'], contamination=hyperparams['contamination'])
+        self._clf = MP(window_size=hyperparams['window_size'], step_size=hyperparams['step_size'], contamination=hyperparams['contamination'], incremental=hyperparams['incremental'],
+                       approximate=hyperparams['approximate'], percentage=hyperparams['percentage'],
+                       time_budget=hyperparams['time_budget'], random_state=random_seed)
 
     def set_training_data(self, *, inputs: Inputs) -> None:
         """
@@ -145,6 +145,20 @@ class Hyperparams(Hyperparams_ODBase):
             description="If True, perform standardization first to convert data to zero mean and unit variance.",
     )
 
+    batch_size = hyperparams.Union[Union[int, None]](
+        configuration=OrderedDict(
+            limit=hyperparams.Hyperparameter[int](
+                default=1024,
+            ),
+            unlimited=hyperparams.Hyperparameter[None](
+                default=None,
+            ),
+        ),
+        default='unlimited',
+        description='Number of windows scored at once so that memory stays bounded on long series, all the windows at once if None.',
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/ResourcesUseParameter'],
+    )
+
     pass
 
 
@@ -225,6 +239,9 @@ Parameters
         If True, perform standardization first to convert
         data to zero mean and unit variance.
         See http://scikit-learn.org/stable/auto_examples/preprocessing/plot_scaling_importance.html
+    batch_size : int, optional (default=None)
+        Number of windows scored at once so that memory stays bounded on
+        long series, all the windows at once if None.
 
 .. dropdown:: Attributes
     
@@ -262,6 +279,7 @@ Parameters
                         iterated_power=hyperparams['iterated_power'],
                         random_state=hyperparams['random_state'],
                         standardization=hyperparams['standardization'],
+                        batch_size=hyperparams['batch_size'],
                         )
 
         return
@@ -24,6 +24,9 @@ from d3m.base import utils as base_utils
 import uuid
 from d3m.exceptions import PrimitiveNotFittedError
 
+from tods.common.system_wise import PackedSystems
+from .core import system_scores
+
 __all__ = ('SystemWiseDetectionPrimitive',)
 
 Inputs = container.DataFrame
@@ -305,154 +308,66 @@ class SystemWiseDetectionPrimitive(transformer.TransformerPrimitiveBase[Inputs,
         inputs.to_csv(str(time.time()) + '.csv')
 
     def _system_wise_detection(self,X,method_type,window_size,contamination):
-        systemIds = [int(idx) for idx in X.index]
+        """
+        Rank the systems on the outlier scores of their time points, in the first column of every system.
+        Args:
+            X: Container DataFrame with the DataFrame of every system in its 'system' column, or PackedSystems
+            method_type: str, the type of method used to find anomalous system
+            window_size: int
+            contamination: float
+        Returns:
+            list, 1 for the anomalous systems and 0 for the others
+        """
+        if isinstance(X, PackedSystems):
+            values = X.values[:, 0]
+            offsets = X.offsets
+        else:
+            systemIds = [int(idx) for idx in X.index]
+            systems = X['system'].to_numpy()[systemIds]
+            # to_numpy of a whole system is much faster than selecting its column
+            columns = [system.to_numpy()[:, 0] for system in systems]
+            values = np.concatenate(columns)
+            offsets = np.concatenate([[0], np.cumsum([len(column) for column in columns])])
+        if values.dtype == object:
+            values = values.astype(np.float64)
+        values = np.abs(values)
 
-        transformed_X = []
         if(method_type=="max"):
             """
             Sytems are sorted based on maximum of reconstruction errors"
             """
-            maxOutlierScorePerSystemList = []
-            for systemId in systemIds:
-                systemDf = X.iloc[systemId]['system']
-                maxOutlierScorePerSystemList.append(np.max(np.abs(systemDf.iloc[:,0].values)))
-
-            ranking = np.sort(maxOutlierScorePerSystemList)
-            threshold = ranking[int((1 - contamination) * len(ranking))]
-            self.threshold = threshold
-            mask = (maxOutlierScorePerSystemList > threshold)
-            ranking[mask] = 1
-            ranking[np.logical_not(mask)] = 0
-            for iter in range(len(systemIds)):
-                transformed_X.append(ranking[iter])
+            OutlierScorePerSystemList = system_scores.segment_max(values, offsets)
 
         if (method_type == "avg"):
             """
             Sytems are sorted based on average of reconstruction errors"
             """
-            avgOutlierScorePerSystemList = []
-            for systemId in systemIds:
-                systemDf = X.iloc[systemId]['system']
-                avgOutlierScorePerSystemList.append(np.mean(np.abs(systemDf.iloc[:,0].values)))
-
-            ranking = np.sort(avgOutlierScorePerSystemList)
-            threshold = ranking[int((1 - contamination) * len(ranking))]
-            self.threshold = threshold
-            mask = (avgOutlierScorePerSystemList > threshold)
-            ranking[mask] = 1
-            ranking[np.logical_not(mask)] = 0
-            for iter in range(len(systemIds)):
-                transformed_X.append( ranking[iter])
+            OutlierScorePerSystemList = system_scores.segment_mean(values, offsets)
 
         if (method_type == "sliding_window_sum"):
             """
             Sytems are sorted based on max of sum of reconstruction errors in each window"
             """
-            maxOutlierScorePerSystemList = []
-            for systemId in systemIds:
-                systemDf = X.iloc[systemId]['system']
-                column_value = systemDf.iloc[:,0].values
-                column_score = []
-                for iter in range(window_size - 1, len(column_value)):
-                    sequence = column_value[iter - window_size + 1:iter + 1]
-                    column_score.append(np.sum(np.abs(sequence)))
-                #column_score[:window_size - 1] = column_score[window_size - 1]
-
-                maxOutlierScorePerSystemList.append(np.max(column_score))
-            #OutlierScorePerSystemList = np.asarray(OutlierScorePerSystemList)
-
-            #maxOutlierScorePerSystemList = OutlierScorePerSystemList.max(axis=1).tolist()
-
-            ranking = np.sort(maxOutlierScorePerSystemList)
-            threshold = ranking[int((1 - contamination) * len(ranking))]
-            self.threshold = threshold
-            mask = (maxOutlierScorePerSystemList > threshold)
-            ranking[mask] = 1
-            ranking[np.logical_not(mask)] = 0
-            for iter in range(len(systemIds)):
-                transformed_X.append( ranking[iter])
-
+            if np.diff(offsets).min() < window_size:
+                raise ValueError("window_size {} is larger than the time points of a system.".format(window_size))
+            window_scores, window_offsets = system_scores.window_scores(values, offsets, window_size, 'sum')
+            OutlierScorePerSystemList = system_scores.segment_max(window_scores, window_offsets)
 
         if (method_type == "majority_voting_sliding_window_sum"):
             """
             Sytem with most vote based on max of sum of reconstruction errors in each window
             """
-            OutlierScorePerSystemList = []
-            max_time_points = 0
-            for systemId in systemIds:
-                systemDf = X.iloc[systemId]['system']
-                max_time_points = max(max_time_points,systemDf.shape[0])
-
-            for systemId in systemIds:
-                column_value = np.zeros(max_time_points)
-                systemDf = X.iloc[systemId]['system']
-                column_value_actual = systemDf.iloc[:, 0].values
-                column_value[0:len(column_value_actual)] = column_value_actual
-                column_value[len(column_value_actual):]= column_value_actual[-1]
-                column_score = []
-                for iter in range(window_size - 1, len(column_value)):
-                    sequence = column_value[iter - window_size + 1:iter + 1]
-                    column_score.append(np.sum(np.abs(sequence)))
-
-                OutlierScorePerSystemList.append(column_score)
-
-            OutlierScorePerSystemList = np.asarray(OutlierScorePerSystemList)
-
-            OutlierScorePerSystemList = (
-                    OutlierScorePerSystemList == OutlierScorePerSystemList.max(axis=0)[None, :]).astype(int)
-
-            maxOutlierScorePerSystemList = OutlierScorePerSystemList.sum(axis=1).tolist()
-
-            ranking = np.sort(maxOutlierScorePerSystemList)
-            threshold = ranking[int((1 - contamination) * len(ranking))]
-
-            self.threshold = threshold
-            mask = (maxOutlierScorePerSystemList > threshold)
-            ranking[mask] = 1
-            ranking[np.logical_not(mask)] = 0
-            for iter in range(len(systemIds)):
-                transformed_X.append( ranking[iter])
-
+            OutlierScorePerSystemList = system_scores.majority_votes(values.astype(np.float64), offsets, window_size, 'sum')
 
         if (method_type == "majority_voting_sliding_window_max"):
             """
             Sytem with most vote based on max of max of reconstruction errors in each window
             """
-            OutlierScorePerSystemList = []
-            max_time_points = 0
-            for systemId in systemIds:
-                systemDf = X.iloc[systemId]['system']
-                max_time_points = max(max_time_points, systemDf.shape[0])
-
-            for systemId in systemIds:
-                column_value = np.zeros(max_time_points)
-                systemDf = X.iloc[systemId]['system']
-                column_value_actual = systemDf.iloc[:, 0].values
-                column_value[0:len(column_value_actual)] = column_value_actual
-                column_value[len(column_value_actual):] = column_value_actual[-1]
-                column_score = []
-                for iter in range(window_size - 1, len(column_value)):
-                    sequence = column_value[iter - window_size + 1:iter + 1]
-                    column_score.append(np.max(np.abs(sequence)))
-
-                OutlierScorePerSystemList.append(column_score)
-            OutlierScorePerSystemList = np.asarray(OutlierScorePerSystemList)
-
-            OutlierScorePerSystemList = (
-                    OutlierScorePerSystemList == OutlierScorePerSystemList.max(axis=0)[None, :]).astype(int)
-
-            maxOutlierScorePerSystemList = OutlierScorePerSystemList.sum(axis=1).tolist()
-
-            ranking = np.sort(maxOutlierScorePerSystemList)
-            threshold = ranking[int((1 - contamination) * len(ranking))]
-            self.threshold = threshold
-            mask = (maxOutlierScorePerSystemList > threshold)
-            ranking[mask] = 1
-            ranking[np.logical_not(mask)] = 0
-            for iter in range(len(systemIds)):
-                transformed_X.append(ranking[iter])
-
-        return transformed_X
-
+            OutlierScorePerSystemList = system_scores.majority_votes(values.astype(np.float64), offsets, window_size, 'max')
 
+        ranking = np.sort(OutlierScorePerSystemList)
+        threshold = ranking[int((1 - contamination) * len(ranking))]
+        self.threshold = threshold
+        transformed_X = (OutlierScorePerSystemList > threshold).astype(ranking.dtype)
 
+        return list(transformed_X)
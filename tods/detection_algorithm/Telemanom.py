@@ -87,6 +87,19 @@ class Hyperparams(Hyperparams_ODBase):
 		description="Batch size while predicting"
 	)
 
+	chunk_size = hyperparams.Hyperparameter[int](
+		default=10000,
+		semantic_types=['https://metadata.datadrivendiscovery.org/types/ControlParameter'],
+		description="Number of windows predicted at a time, bounds the memory of the prediction on long channels"
+	)
+
+	dtype = hyperparams.Enumeration(
+		values=['float64', 'float32'],
+		default='float64',
+		semantic_types=['https://metadata.datadrivendiscovery.org/types/ControlParameter'],
+		description="Floating point type of the windows and of the prediction errors, float32 halves their memory"
+	)
+
 
 	# LSTM Model Parameters
 
@@ -204,6 +217,12 @@ class TelemanomPrimitive(UnsupervisedOutlierDetectorBase[Inputs, Outputs, Params
         batch_size :int(default=70)
             Batch size while predicting
 
+        chunk_size :int(default=10000)
+            Number of windows predicted at a time, bounds the memory of the prediction on long channels
+
+        dtype :str(default='float64')
+            Floating point type of the windows and of the prediction errors, float32 halves their memory
+
     .. dropdown:: LSTM Model Parameters
 
         dropout :float(default=0.3)
@@ -276,7 +295,9 @@ class TelemanomPrimitive(UnsupervisedOutlierDetectorBase[Inputs, Outputs, Params
 						l_s = self.hyperparams['l_s'],
 						n_predictions = self.hyperparams['n_predictions'],
 						p = self.hyperparams['p'],
-						contamination=hyperparams['contamination']
+						contamination=hyperparams['contamination'],
+						chunk_size = self.hyperparams['chunk_size'],
+						dtype = self.hyperparams['dtype']
 						)
 
 	def set_training_data(self, *, inputs: Inputs) -> None:
@@ -351,7 +372,8 @@ class Detector(CollectiveBaseDetector):
 
 	def __init__(self,smoothing_perc=0.05,window_size = 10,error_buffer = 5,batch_size =30, \
 				 dropout = 0.3, validation_split=0.2,optimizer='adam',lstm_batch_size=64,loss_metric='mean_squared_error', \
-				 layers=[40,40],epochs = 1,patience =10,min_delta=0.0003,l_s=5,n_predictions=2,p = 0.05,contamination=0.1):
+				 layers=[40,40],epochs = 1,patience =10,min_delta=0.0003,l_s=5,n_predictions=2,p = 0.05,contamination=0.1, \
+				 chunk_size=None,dtype='float64'):
 		
 		# super(Detector, self).__init__(contamination=contamination)
 		super(Detector, self).__init__(contamination=contamination,
@@ -376,6 +398,8 @@ class Detector(CollectiveBaseDetector):
 		self._n_predictions = n_predictions
 		self._p = p
 		self.contamination = contamination
+		self._chunk_size = chunk_size
+		self._dtype = np.dtype(dtype)
 
 		# self.y_hat = None
 		self.results = []
@@ -393,11 +417,11 @@ class Detector(CollectiveBaseDetector):
 		Returns:
 			return : self object with trained model
 		"""
-		X = check_array(X).astype(np.float)
+		X = check_array(X).astype(self._dtype)
 		self._set_n_classes(None)
 
 		inputs = X
-		self._channel = Channel(n_predictions = self._n_predictions,l_s = self._l_s)
+		self._channel = Channel(n_predictions = self._n_predictions,l_s = self._l_s,dtype = self._dtype)
 		self._channel.shape_train_data(inputs)
 
 		self._model = Model(self._channel,patience = self._patience,
@@ -411,7 +435,8 @@ class Detector(CollectiveBaseDetector):
 							  epochs = self._epochs,
 							  validation_split = self._validation_split,
 							  batch_size = self._batch_size,
-							  l_s = self._l_s
+							  l_s = self._l_s,
+							  chunk_size = self._chunk_size
 						)
 
 		self.decision_scores_, self.left_inds_, self.right_inds_ = self.decision_function(X)
@@ -437,7 +462,7 @@ class Detector(CollectiveBaseDetector):
 			The anomaly score of the input samples.
 		"""
 		
-		X = check_array(X).astype(np.float)
+		X = check_array(X).astype(self._dtype)
 		self._set_n_classes(None)
 
 		inputs = X
@@ -458,17 +483,10 @@ class Detector(CollectiveBaseDetector):
 		prediction_errors = np.reshape(errors.e_s,(self._channel.X_test.shape[0],self._channel.X_test.shape[2]))
 		prediction_errors = np.sum(prediction_errors,axis=1)
 
-		left_indices = []
-		right_indices = []
-		scores = []
-		for i in range(len(prediction_errors)):
-			left_indices.append(i)
-			right_indices.append(i+self._l_s)
-			scores.append(prediction_errors[i])
+		left_indices = np.arange(len(prediction_errors))
+		right_indices = left_indices + self._l_s
 
-
-		
-		return np.asarray(scores),np.asarray(left_indices),np.asarray(right_indices)
+		return prediction_errors,left_indices,right_indices
 
 
 
@@ -72,6 +72,9 @@ class Params_ODBase(params.Params):
     target_column_indices_: Optional[Sequence[int]]
     target_columns_metadata_: Optional[List[OrderedDict]]
 
+    # Params of the primitives fitted on each system of system-wise data
+    system_params: Optional[List[params.Params]]
+
 
 
 class Hyperparams_ODBase(hyperparams.Hyperparams):
@@ -96,6 +99,12 @@ class Hyperparams_ODBase(hyperparams.Hyperparams):
         semantic_types=['https://metadata.datadrivendiscovery.org/types/TuningParameter']
     )
 
+    system_n_jobs = hyperparams.Hyperparameter[int](
+        default=1,
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/ResourcesUseParameter'],
+        description='Number of worker processes fitting and scoring the systems of system-wise data, -1 uses all the CPU cores and 1 processes them one after another.',
+    )
+
     # Keep previous
     return_subseq_inds = hyperparams.UniformBool(
         default=False,
@@ -216,6 +225,7 @@ class UnsupervisedOutlierDetectorBase(TODSUnsupervisedLearnerPrimitiveBase[Input
         self._target_columns_metadata: List[OrderedDict] = None
         self._input_column_names = None
         self._fitted = False
+        self.reset_stream()
 #
     @abc.abstractmethod
     def set_training_data(self, *, inputs: Inputs) -> None:
@@ -271,6 +281,7 @@ class UnsupervisedOutlierDetectorBase(TODSUnsupervisedLearnerPrimitiveBase[Input
             self._clf.fit(X=self._training_inputs.values, **self._clf_fit_parameter)
             self._fitted = True
             self._set_subseq_inds()
+            self.reset_stream()
 
         else: # pragma: no cover
             if self.hyperparams['error_on_no_input']:
@@ -399,6 +410,148 @@ class UnsupervisedOutlierDetectorBase(TODSUnsupervisedLearnerPrimitiveBase[Input
         return CallResult(outputs)
 
 
+    def reset_stream(self) -> None:
+        """
+        Forget the context kept by partial_produce and partial_produce_score,
+        the next call starts a new stream at index 0.
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self._stream_buffer = None
+        self._stream_offset = 0
+        self._stream_seen = 0
+        self._stream_last_left = -1
+
+    def partial_produce(self, *, inputs: Inputs, timeout: float = None, iterations: int = None) -> CallResult[Outputs]:
+        """
+        Process the next chunk of a stream of testing data.
+        Only windows that were not reported by previous calls are scored,
+        the trailing context they need is kept from previous chunks.
+        Args:
+            inputs: Container DataFrame. New rows of the time series.
+
+        Returns:
+            Container DataFrame
+            1 marks Outliers, 0 marks normal, one row per new window.
+            Subsequence indices are positions in the whole stream.
+        """
+        return self._partial_produce(inputs=inputs, score=False)
+
+    def partial_produce_score(self, *, inputs: Inputs, timeout: float = None, iterations: int = None) -> CallResult[Outputs]:
+        """
+        Process the next chunk of a stream of testing data, see partial_produce.
+        Args:
+            inputs: Container DataFrame. New rows of the time series.
+
+        Returns:
+            Container DataFrame
+            Outlier score of each new window.
+        """
+        return self._partial_produce(inputs=inputs, score=True)
+
+    def _partial_produce(self, *, inputs: Inputs, score: bool) -> CallResult[Outputs]:
+        """
+        Score the windows of the stream ending in the new rows.
+
+        Point detectors score each row independently, once the window
+        starting at it is in the stream, so that its right index is final.
+        Collective detectors score the rows kept from previous calls followed
+        by the new rows, and only the windows starting after the last
+        reported one are returned, without the padding entries of the
+        full-batch output. A window is reported once the detector can score
+        it from the kept context, so the concatenated results match a
+        full-batch run over the stream, up to the windows cut by its end, for
+        detectors whose window scores only depend on the window (KDiscord,
+        PCA, AutoRegOD, ...).
+        Args:
+            inputs: Container DataFrame. New rows of the time series.
+            score: bool. Return decision scores instead of labels.
+
+        Returns:
+            Container DataFrame
+        """
+        if not self._fitted: # pragma: no cover
+            raise PrimitiveNotFittedError("Primitive not fitted.")
+        sk_inputs = inputs
+        if self.hyperparams['use_semantic_types']:
+            sk_inputs = inputs.iloc[:, self._training_indices]
+        output_columns = []
+        if len(self._training_indices) > 0:
+            method = self._clf.decision_function if score else self._clf.predict
+            new_values = sk_inputs.values
+            seen = self._stream_seen + len(new_values)
+
+            if self._stream_buffer is None:
+                buffer = new_values
+            else:
+                buffer = numpy.concatenate((self._stream_buffer, new_values), axis=0)
+
+            if getattr(self._clf, 'left_inds_', None) is None or getattr(self._clf, 'right_inds_', None) is None: # point OD
+                # Rows whose window is in the stream, their right index is final.
+                left_inds_ = numpy.arange(self._stream_offset, seen - self.window_size + 1, self.step_size)
+                right_inds_ = left_inds_ + self.window_size
+                pred = numpy.empty(0)
+                if len(left_inds_) > 0:
+                    pred = numpy.asarray(method(buffer[left_inds_ - self._stream_offset])).ravel()
+                    start = left_inds_[-1] + self.step_size
+                    self._stream_buffer = buffer[start - self._stream_offset:]
+                    self._stream_offset = start
+                else:
+                    self._stream_buffer = buffer
+
+            else:
+                pred, left_inds_, right_inds_ = numpy.empty(0), numpy.empty(0, dtype=int), numpy.empty(0, dtype=int)
+                # Detectors forecasting the sample after a window need one more step of context.
+                if len(buffer) >= self.window_size + self.step_size:
+                    pred, left_inds_, right_inds_ = method(buffer)
+                    pred = numpy.asarray(pred).ravel()
+                    left_inds_ = numpy.asarray(left_inds_)
+                    right_inds_ = numpy.asarray(right_inds_)
+                    # Drop the padding entries and the windows reported before.
+                    new = (left_inds_ >= 0) & (right_inds_ > left_inds_) & \
+                          (left_inds_ + self._stream_offset > self._stream_last_left)
+                    pred = pred[new]
+                    left_inds_ = left_inds_[new] + self._stream_offset
+                    right_inds_ = right_inds_[new] + self._stream_offset
+                    if len(left_inds_) > 0:
+                        self._stream_last_left = left_inds_.max()
+
+                # Keep the rows from the first window not reported yet.
+                if self._stream_last_left >= 0:
+                    start = self._stream_last_left + self.step_size
+                    self._stream_buffer = buffer[start - self._stream_offset:]
+                    self._stream_offset = start
+                else:
+                    self._stream_buffer = buffer
+
+            self._stream_seen = seen
+
+            if self.hyperparams['return_subseq_inds']:
+                sk_output = numpy.concatenate((numpy.expand_dims(pred, axis=1),
+                                               numpy.expand_dims(left_inds_, axis=1),
+                                               numpy.expand_dims(right_inds_, axis=1)), axis=1)
+            else:
+                sk_output = pred
+
+            outputs = self._wrap_predictions(inputs, sk_output)
+            if len(outputs.columns) == len(self._input_column_names):
+                outputs.columns = self._input_column_names
+            output_columns = [outputs]
+        else: # pragma: no cover
+            if self.hyperparams['error_on_no_input']:
+                raise RuntimeError("No input columns were selected")
+            self.logger.warn("No input columns were selected")
+
+        outputs = base_utils.combine_columns(return_result=self.hyperparams['return_result'],
+                                             add_index_columns=self.hyperparams['add_index_columns'],
+                                             inputs=inputs, column_indices=self._training_indices,
+                                             columns_list=output_columns)
+        return CallResult(outputs)
+
+
     def get_params(self) -> Params_ODBase: # pragma: no cover
         """
         Return parameters.
@@ -409,6 +562,10 @@ class UnsupervisedOutlierDetectorBase(TODSUnsupervisedLearnerPrimitiveBase[Input
             class Params_ODBase
         """
 
+        system_params = None
+        if self._system_primitives is not None:
+            system_params = [primitive.get_params() for primitive in self._system_primitives]
+
         if not self._fitted:
             return Params_ODBase(
                 # decision_scores_=None,
@@ -423,7 +580,8 @@ class UnsupervisedOutlierDetectorBase(TODSUnsupervisedLearnerPrimitiveBase[Input
                 training_indices_=self._training_indices,
                 target_names_=self._target_names,
                 target_column_indices_=self._target_column_indices,
-                target_columns_metadata_=self._target_columns_metadata
+                target_columns_metadata_=self._target_columns_metadata,
+                system_params=system_params
             )
 
         return Params_ODBase(
@@ -439,7 +597,8 @@ class UnsupervisedOutlierDetectorBase(TODSUnsupervisedLearnerPrimitiveBase[Input
             training_indices_=self._training_indices,
             target_names_=self._target_names,
             target_column_indices_=self._target_column_indices,
-            target_columns_metadata_=self._target_columns_metadata
+            target_columns_metadata_=self._target_columns_metadata,
+            system_params=system_params
         )
         # pass
 
@@ -468,6 +627,15 @@ class UnsupervisedOutlierDetectorBase(TODSUnsupervisedLearnerPrimitiveBase[Input
         self._target_column_indices = params['target_column_indices_']
         self._target_columns_metadata = params['target_columns_metadata_']
 
+        # Rebuild the primitives fitted on each system of system-wise data
+        self._system_primitives = None
+        if params.get('system_params') is not None:
+            self._system_primitives = []
+            for system_params in params['system_params']:
+                primitive = self._new_system_primitive()
+                primitive.set_params(params=system_params)
+                self._system_primitives.append(primitive)
+
 
         # if params['decision_scores_'] is not None:
         #     self._fitted = True
@@ -976,7 +1144,8 @@ class UnsupervisedOutlierDetectorBase2(UnsupervisedLearnerPrimitiveBase[Inputs,
                 training_indices_=self._training_indices,
                 target_names_=self._target_names,
                 target_column_indices_=self._target_column_indices,
-                target_columns_metadata_=self._target_columns_metadata
+                target_columns_metadata_=self._target_columns_metadata,
+                system_params=None
             )
 
         return Params_ODBase(
@@ -992,7 +1161,8 @@ class UnsupervisedOutlierDetectorBase2(UnsupervisedLearnerPrimitiveBase[Inputs,
             training_indices_=self._training_indices,
             target_names_=self._target_names,
             target_column_indices_=self._target_column_indices,
-            target_columns_metadata_=self._target_columns_metadata
+            target_columns_metadata_=self._target_columns_metadata,
+            system_params=None
         )
         # pass
 
@@ -1,24 +1,32 @@
-from tods.detection_algorithm.AutoRegODetect import AutoRegODetectorPrimitive 
-from tods.detection_algorithm.DeepLog import DeepLogPrimitive
-from tods.detection_algorithm.Ensemble import EnsemblePrimitive
-from tods.detection_algorithm.KDiscordODetect import KDiscordODetectorPrimitive
-from tods.detection_algorithm.LSTMODetect import LSTMODetectorPrimitive
-from tods.detection_algorithm.MatrixProfile import MatrixProfilePrimitive
-from tods.detection_algorithm.PCAODetect import PCAODetectorPrimitive
-from tods.detection_algorithm.PyodABOD import ABODPrimitive
-from tods.detection_algorithm.PyodAE import AutoEncoderPrimitive
-from tods.detection_algorithm.PyodCBLOF import CBLOFPrimitive
-from tods.detection_algorithm.PyodCOF import COFPrimitive
-from tods.detection_algorithm.PyodHBOS import HBOSPrimitive
-from tods.detection_algorithm.PyodIsolationForest import IsolationForestPrimitive
-from tods.detection_algorithm.PyodKNN import KNNPrimitive
-from tods.detection_algorithm.PyodLODA import LODAPrimitive
-from tods.detection_algorithm.PyodLOF import LOFPrimitive
-from tods.detection_algorithm.PyodMoGaal import Mo_GaalPrimitive
-from tods.detection_algorithm.PyodOCSVM import OCSVMPrimitive
-from tods.detection_algorithm.PyodSOD import SODPrimitive
-from tods.detection_algorithm.PyodSoGaal import So_GaalPrimitive
-from tods.detection_algorithm.PyodVAE import VariationalAutoEncoderPrimitive
-from tods.detection_algorithm.SystemWiseDetection import SystemWiseDetectionPrimitive
-from tods.detection_algorithm.Telemanom import TelemanomPrimitive
-from tods.detection_algorithm.PyodXGBOD import XGBODPrimitive
+from tods.common.lazy import lazy_attributes
+
+# The primitives are imported on first access, see tods.common.lazy
+_PRIMITIVES = {
+    'AutoRegODetectorPrimitive': 'tods.detection_algorithm.AutoRegODetect',
+    'DeepLogPrimitive': 'tods.detection_algorithm.DeepLog',
+    'EnsemblePrimitive': 'tods.detection_algorithm.Ensemble',
+    'KDiscordODetectorPrimitive': 'tods.detection_algorithm.KDiscordODetect',
+    'LSTMODetectorPrimitive': 'tods.detection_algorithm.LSTMODetect',
+    'MatrixProfilePrimitive': 'tods.detection_algorithm.MatrixProfile',
+    'PCAODetectorPrimitive': 'tods.detection_algorithm.PCAODetect',
+    'ABODPrimitive': 'tods.detection_algorithm.PyodABOD',
+    'AutoEncoderPrimitive': 'tods.detection_algorithm.PyodAE',
+    'CBLOFPrimitive': 'tods.detection_algorithm.PyodCBLOF',
+    'COFPrimitive': 'tods.detection_algorithm.PyodCOF',
+    'HBOSPrimitive': 'tods.detection_algorithm.PyodHBOS',
+    'IsolationForestPrimitive': 'tods.detection_algorithm.PyodIsolationForest',
+    'KNNPrimitive': 'tods.detection_algorithm.PyodKNN',
+    'LODAPrimitive': 'tods.detection_algorithm.PyodLODA',
+    'LOFPrimitive': 'tods.detection_algorithm.PyodLOF',
+    'Mo_GaalPrimitive': 'tods.detection_algorithm.PyodMoGaal',
+    'OCSVMPrimitive': 'tods.detection_algorithm.PyodOCSVM',
+    'SODPrimitive': 'tods.detection_algorithm.PyodSOD',
+    'So_GaalPrimitive': 'tods.detection_algorithm.PyodSoGaal',
+    'VariationalAutoEncoderPrimitive': 'tods.detection_algorithm.PyodVAE',
+    'SystemWiseDetectionPrimitive': 'tods.detection_algorithm.SystemWiseDetection',
+    'TelemanomPrimitive': 'tods.detection_algorithm.Telemanom',
+    'XGBODPrimitive': 'tods.detection_algorithm.PyodXGBOD',
+}
+
+__all__ = list(_PRIMITIVES)
+__getattr__, __dir__ = lazy_attributes(__name__, _PRIMITIVES)
@@ -8,7 +8,7 @@ from sklearn.linear_model import LinearRegression
 
 from .CollectiveBase import CollectiveBaseDetector
 
-from .utility import get_sub_matrices
+from .utility import get_sub_matrices, iter_sub_matrices
 
 
 class AutoRegOD(CollectiveBaseDetector):
@@ -32,6 +32,10 @@ class AutoRegOD(CollectiveBaseDetector):
         the proportion of outliers in the data set. When fitting this is used
         to define the threshold on the decision function.
 
+    batch_size : int, optional (default=None)
+        If set, ``decision_function`` scores the windows in batches of
+        this size so that memory stays bounded on long series.
+
     Attributes
     ----------
     decision_scores_ : numpy array of shape (n_samples,)
@@ -51,10 +55,12 @@ class AutoRegOD(CollectiveBaseDetector):
         ``threshold_`` on ``decision_scores_``.
     """
 
-    def __init__(self, window_size, step_size=1, contamination=0.1):
+    def __init__(self, window_size, step_size=1, contamination=0.1,
+                 batch_size=None):
         super(AutoRegOD, self).__init__(contamination=contamination)
         self.window_size = window_size
         self.step_size = step_size
+        self.batch_size = batch_size
 
     def fit(self, X: np.array) -> object:
         """Fit detector. y is ignored in unsupervised methods.
@@ -88,10 +94,7 @@ class AutoRegOD(CollectiveBaseDetector):
 
         self.valid_len_ = sub_matrices.shape[0]
 
-        y_buf = np.zeros([self.valid_len_, 1])
-
-        for i in range(self.valid_len_):
-            y_buf[i] = X[i * self.step_size + self.window_size]
+        y_buf = X[self.right_inds_, 0].reshape(-1, 1)
         # print(sub_matrices.shape, y_buf.shape)
 
         # fit the linear regression model
@@ -150,6 +153,24 @@ class AutoRegOD(CollectiveBaseDetector):
         """
         check_is_fitted(self, ['lr_'])
 
+        if self.batch_size is not None:
+            X = np.asarray(X)
+            scores, left_inds, right_inds = [], [], []
+            for sub_matrices, X_left_inds, X_right_inds in iter_sub_matrices(
+                    X, self.window_size, self.step_size,
+                    batch_size=self.batch_size, flatten=True):
+                # the last window has no target, it is removed below
+                y_buf = np.take(X[:, 0], X_right_inds, mode='clip')
+                scores.append(np.absolute(
+                    y_buf - self.lr_.predict(sub_matrices).ravel()))
+                left_inds.append(X_left_inds)
+                right_inds.append(X_right_inds)
+
+            # remove the last one
+            return np.concatenate(scores)[:-1], \
+                np.concatenate(left_inds)[:-1], \
+                np.concatenate(right_inds)[:-1]
+
         sub_matrices, X_left_inds, X_right_inds = \
             get_sub_matrices(X,
                              window_size=self.window_size,
@@ -162,19 +183,13 @@ class AutoRegOD(CollectiveBaseDetector):
         X_left_inds = X_left_inds[:-1]
         X_right_inds = X_right_inds[:-1]
 
-        valid_len = sub_matrices.shape[0]
-
-        y_buf = np.zeros([valid_len, 1])
-
-        for i in range(valid_len):
-            y_buf[i] = X[i * self.step_size + self.window_size]
+        y_buf = np.asarray(X)[X_right_inds, 0].reshape(-1, 1)
 
         pred_score = np.absolute(
             y_buf.ravel() - self.lr_.predict(sub_matrices).ravel())
 
         return pred_score, X_left_inds.ravel(), X_right_inds.ravel()
 
-
 if __name__ == "__main__": # pragma: no cover
     X_train = np.asarray(
         [3., 4., 8., 16, 18, 13., 22., 36., 59., 128, 62, 67, 78,
@@ -8,7 +8,7 @@ from sklearn.utils.validation import check_is_fitted
 from .CollectiveBase import CollectiveBaseDetector
 from pyod.models.knn import KNN
 
-from .utility import get_sub_matrices
+from .utility import get_sub_matrices, batch_decision_function
 
 
 # TODO: add an argument to exclude "near equal" samples
@@ -114,6 +114,10 @@ class KDiscord(CollectiveBaseDetector):
         If ``-1``, then the number of jobs is set to the number of CPU cores.
         Affects only kneighbors and kneighbors_graph methods.
 
+    batch_size : int, optional (default = None)
+        If set, ``decision_function`` scores the windows in batches of
+        this size so that memory stays bounded on long series.
+
     Attributes
     ----------
     decision_scores_ : numpy array of shape (n_samples,)
@@ -138,7 +142,7 @@ class KDiscord(CollectiveBaseDetector):
                  n_neighbors=5, method='largest',
                  radius=1.0, algorithm='auto', leaf_size=30,
                  metric='minkowski', p=2, metric_params=None, n_jobs=1,
-                 **kwargs):
+                 batch_size=None, **kwargs):
         super(KDiscord, self).__init__(contamination=contamination)
         self.window_size = window_size
         self.step_size = step_size
@@ -153,6 +157,7 @@ class KDiscord(CollectiveBaseDetector):
         self.p = p
         self.metric_params = metric_params
         self.n_jobs = n_jobs
+        self.batch_size = batch_size
 
         # initialize a kNN model
         self.model_ = KNN(contamination=self.contamination,
@@ -218,6 +223,12 @@ class KDiscord(CollectiveBaseDetector):
         """
         check_is_fitted(self, ['model_'])
         X = check_array(X).astype(np.float)
+
+        if self.batch_size is not None:
+            return batch_decision_function(self.model_.decision_function, X,
+                                           self.window_size, self.step_size,
+                                           self.batch_size)
+
         # first convert it into submatrices, and flatten it
         sub_matrices, X_left_inds, X_right_inds = get_sub_matrices(
             X,
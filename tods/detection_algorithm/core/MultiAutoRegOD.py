@@ -43,6 +43,11 @@ class MultiAutoRegOD(CollectiveBaseDetector):
     weights : numpy array of shape (1, n_dimensions)
         Score weight by dimensions.
 
+    batch_size : int, optional (default=None)
+        If set, ``decision_function`` scores the windows of every
+        dimension in batches of this size so that memory stays bounded on
+        long series.
+
     Attributes
     ----------
     decision_scores_ : numpy array of shape (n_samples,)
@@ -58,12 +63,13 @@ class MultiAutoRegOD(CollectiveBaseDetector):
     """
 
     def __init__(self, window_size, step_size=1, method='average',
-                 weights=None, contamination=0.1):
+                 weights=None, contamination=0.1, batch_size=None):
         super(MultiAutoRegOD, self).__init__(contamination=contamination)
         self.window_size = window_size
         self.step_size = step_size
         self.method = method
         self.weights = weights
+        self.batch_size = batch_size
 
     def _validate_weights(self):
         """Internal function for validating and adjust weights.
@@ -95,7 +101,8 @@ class MultiAutoRegOD(CollectiveBaseDetector):
         for i in range(n_sequences):
             models.append(AutoRegOD(window_size=self.window_size,
                                     step_size=self.step_size,
-                                    contamination=self.contamination))
+                                    contamination=self.contamination,
+                                    batch_size=self.batch_size))
             models[i].fit(X[:, i].reshape(-1, 1))
 
         return models
@@ -8,7 +8,7 @@ from sklearn.utils.validation import check_is_fitted
 from .CollectiveBase import CollectiveBaseDetector
 from pyod.models.pca import PCA as PCA_PYOD
 
-from .utility import get_sub_matrices
+from .utility import get_sub_matrices, batch_decision_function
 
 
 class PCA(CollectiveBaseDetector):
@@ -105,6 +105,10 @@ class PCA(CollectiveBaseDetector):
         If True, perform standardization first to convert
         data to zero mean and unit variance.
         See http://scikit-learn.org/stable/auto_examples/preprocessing/plot_scaling_importance.html
+
+    batch_size : int, optional (default=None)
+        If set, ``decision_function`` scores the windows in batches of
+        this size so that memory stays bounded on long series.
         
     Attributes
     ----------
@@ -130,7 +134,7 @@ class PCA(CollectiveBaseDetector):
                  n_components=None, n_selected_components=None,
                  copy=True, whiten=False, svd_solver='auto',
                  tol=0.0, iterated_power='auto', random_state=None,
-                 weighted=True, standardization=True):
+                 weighted=True, standardization=True, batch_size=None):
         super(PCA, self).__init__(contamination=contamination)
         self.window_size = window_size
         self.step_size = step_size
@@ -146,6 +150,7 @@ class PCA(CollectiveBaseDetector):
         self.random_state = random_state
         self.weighted = weighted
         self.standardization = standardization
+        self.batch_size = batch_size
 
         # initialize a kNN model
         self.model_ = PCA_PYOD(n_components=self.n_components,
@@ -187,6 +192,10 @@ class PCA(CollectiveBaseDetector):
             flatten=True,
             flatten_order='F')
 
+        # the sub matrices may be read-only views on X, PCA must not center them in place
+        if not self.copy:
+            sub_matrices = np.array(sub_matrices)
+
         # if self.n_components > sub_matrices.shape[1]:
         #     raise ValueError('n_components exceeds window_size times the number of sequences.')
 
@@ -216,6 +225,12 @@ class PCA(CollectiveBaseDetector):
         """
         check_is_fitted(self, ['model_'])
         X = check_array(X).astype(np.float)
+
+        if self.batch_size is not None:
+            return batch_decision_function(self.model_.decision_function, X,
+                                           self.window_size, self.step_size,
+                                           self.batch_size, flatten_order='F')
+
         # first convert it into submatrices, and flatten it
         sub_matrices, X_left_inds, X_right_inds = get_sub_matrices(
             X,
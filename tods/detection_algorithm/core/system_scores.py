@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""Anomaly scores of systems from the outlier scores of their time points.
+
+The scores of all the systems are packed one after another in one array
+with the offsets of the systems, like PackedSystems, and every method is a
+segment reduction over that array. Window sums and maxima reduce a strided
+view of the windows row by row, which adds the values of a window in the
+same order as a sum over the window alone: the scores are bitwise equal to
+the ones of a loop over the windows, so equal windows tie in the majority
+votes.
+"""
+import numpy as np
+
+from tods.feature_analysis.core.rolling import window_view
+
+_WINDOW_REDUCTIONS = {'sum': np.sum, 'max': np.max}
+
+
+def segment_max(values, offsets):
+    """Maximum of every non-empty segment ``values[offsets[i]:offsets[i + 1]]``."""
+    return np.maximum.reduceat(values, offsets[:-1])
+
+
+def segment_mean(values, offsets):
+    """Mean of every non-empty segment, equal to numpy.mean of the segment.
+
+    The segments of the same length are stacked and averaged row by row, so
+    their values are added in the order of numpy.mean.
+    """
+    lengths = np.diff(offsets)
+    means = np.empty(len(lengths))
+    for length in np.unique(lengths):
+        segments = np.flatnonzero(lengths == length)
+        rows = values[offsets[segments][:, np.newaxis] + np.arange(length)]
+        means[segments] = np.mean(rows, axis=1)
+    return means
+
+
+def window_scores(values, offsets, window_size, reduction='sum'):
+    """Sum or maximum of every window lying within a segment.
+
+    Parameters
+    ----------
+    values : numpy array of shape (n_samples,)
+
+    offsets : numpy array of shape (n_segments + 1,)
+
+    window_size : int
+
+    reduction : str
+        'sum' or 'max'.
+
+    Returns
+    -------
+    scores : numpy array of shape (n_windows,)
+        The scores of the windows of every segment one after another.
+
+    window_offsets : numpy array of shape (n_segments + 1,)
+        Offsets of the windows of the segments in scores.
+    """
+    lengths = np.diff(offsets)
+    counts = np.maximum(lengths - window_size + 1, 0)
+    window_offsets = np.concatenate([[0], np.cumsum(counts)])
+    starts = np.repeat(offsets[:-1] - window_offsets[:-1], counts) + np.arange(window_offsets[-1])
+    return _reduce_windows(values, starts, window_size, reduction), window_offsets
+
+
+def _reduce_windows(values, starts, window_size, reduction):
+    reduce = _WINDOW_REDUCTIONS[reduction]
+    return reduce(window_view(values, window_size), axis=1)[starts]
+
+
+def majority_votes(values, offsets, window_size, reduction='sum'):
+    """Number of windows in which every segment has the highest score.
+
+    The segments are aligned on their first time point and extended to the
+    longest one by repeating their last value, and the score of a window is
+    the sum or maximum of its values. A window gives a vote to every segment
+    with the highest score, ties included.
+
+    Parameters
+    ----------
+    values : numpy array of shape (n_samples,)
+
+    offsets : numpy array of shape (n_segments + 1,)
+
+    window_size : int
+
+    reduction : str
+        'sum' or 'max'.
+
+    Returns
+    -------
+    votes : numpy array of int of shape (n_segments,)
+    """
+    lengths = np.diff(offsets)
+    n_windows = lengths.max() - window_size + 1
+    if n_windows <= 0:
+        raise ValueError("window_size {} is larger than the {} time points of the longest system.".format(
+            window_size, lengths.max()))
+    last = values[offsets[1:] - 1]
+
+    # Every segment followed by window_size - 1 copies of its last value
+    # holds its windows up to the first one made of the last value only
+    extended_offsets = offsets + np.arange(len(offsets)) * (window_size - 1)
+    extended = np.empty(extended_offsets[-1], dtype=values.dtype)
+    extended[np.arange(len(values)) + np.repeat(extended_offsets[:-1] - offsets[:-1], lengths)] = values
+    padding = (extended_offsets[:-1] + lengths)[:, np.newaxis] + np.arange(window_size - 1)
+    extended[padding.ravel()] = np.repeat(last, window_size - 1)
+
+    counts = np.minimum(lengths, n_windows)
+    window_offsets = np.concatenate([[0], np.cumsum(counts)])
+    positions = np.arange(window_offsets[-1]) - np.repeat(window_offsets[:-1], counts)
+    segments = np.repeat(np.arange(len(lengths)), counts)
+    scores = _reduce_windows(extended, extended_offsets[segments] + positions, window_size, reduction)
+
+    # From window lengths[i] on, segment i only repeats its last value
+    reduce = _WINDOW_REDUCTIONS[reduction]
+    constant = reduce(np.repeat(last[:, np.newaxis], window_size, axis=1), axis=1)
+
+    best = np.full(n_windows, -np.inf)
+    np.maximum.at(best, positions, scores)
+    order = np.argsort(lengths, kind='stable')
+    constant_from = np.searchsorted(lengths[order], np.arange(n_windows), side='right')
+    running = np.maximum.accumulate(constant[order])
+    has_constant = constant_from > 0
+    best[has_constant] = np.maximum(best[has_constant], running[constant_from[has_constant] - 1])
+
+    votes = np.bincount(segments, weights=scores == best[positions], minlength=len(lengths)).astype(int)
+    return votes + _count_equal_after(best, constant, lengths)
+
+
+def _count_equal_after(best, constant, starts):
+    """Number of positions j >= starts[i] with best[j] == constant[i], for
+    every i.
+    """
+    unique, inverse = np.unique(best, return_inverse=True)
+    n_windows = len(best)
+    keys = np.sort(inverse.ravel() * n_windows + np.arange(n_windows))
+
+    value_ids = np.minimum(np.searchsorted(unique, constant), len(unique) - 1)
+    found = unique[value_ids] == constant
+    starts = np.minimum(starts, n_windows)
+    counts = np.searchsorted(keys, value_ids * n_windows + n_windows) \
+        - np.searchsorted(keys, value_ids * n_windows + starts)
+    return np.where(found, counts, 0)
@@ -3,6 +3,7 @@
 """
 
 import numpy as np
+from numpy.lib.stride_tricks import as_strided
 from sklearn.utils import check_array
 
 
@@ -47,6 +48,12 @@ def get_sub_matrices(X, window_size, step=1, return_numpy=True, flatten=True,
                      flatten_order='F'):
     """Chop a multivariate time series into sub sequences (matrices).
 
+    The sub matrices are read-only strided views on ``X``. Flattened
+    sub matrices are views as well whenever each flattened window is a
+    single strided run of ``X`` (univariate series, or ``flatten_order='C'``
+    on a row-major ``X``); otherwise they are copied once into the
+    requested layout.
+
     Parameters
     ----------
     X : numpy array of shape (n_samples,)
@@ -77,46 +84,140 @@ def get_sub_matrices(X, window_size, step=1, return_numpy=True, flatten=True,
     X_sub : numpy array of shape (valid_len, window_size*n_sequences)
         The numpy matrix with each row stands for a flattend submatrix.
     """
-    X = check_array(X).astype(np.float)
+    X = check_array(X, dtype=np.float64)
     n_samples, n_sequences = X.shape[0], X.shape[1]
 
     # get the valid length
-    valid_len = get_sub_sequences_length(n_samples, window_size, step)
-
-    X_sub = []
-    X_left_inds = []
-    X_right_inds = []
+    valid_len = max(get_sub_sequences_length(n_samples, window_size, step), 0)
 
     # exclude the edge
-    steps = list(range(0, n_samples, step))
-    steps = steps[:valid_len]
-
-    # print(n_samples, n_sequences)
-    for idx, i in enumerate(steps):
-        X_sub.append(X[i: i + window_size, :])
-        X_left_inds.append(i)
-        X_right_inds.append(i + window_size)
+    X_left_inds = np.arange(valid_len) * step
+    X_right_inds = X_left_inds + window_size
 
-    X_sub = np.asarray(X_sub)
+    row_stride, column_stride = X.strides
+    X_sub = as_strided(X, shape=(valid_len, window_size, n_sequences),
+                       strides=(step * row_stride, row_stride, column_stride),
+                       writeable=False)
 
     if return_numpy:
         if flatten:
-            temp_array = np.zeros([valid_len, window_size * n_sequences])
-            if flatten_order == 'C':
-                for i in range(valid_len):
-                    temp_array[i, :] = X_sub[i, :, :].flatten(order='C')
-
+            if n_sequences == 1 or (flatten_order == 'C' and row_stride == n_sequences * column_stride):
+                # each flattened window is one strided run of X
+                inner_stride = row_stride if n_sequences == 1 else column_stride
+                X_flat = as_strided(X, shape=(valid_len, window_size * n_sequences),
+                                    strides=(step * row_stride, inner_stride),
+                                    writeable=False)
+            elif flatten_order == 'C':
+                X_flat = X_sub.reshape(valid_len, window_size * n_sequences)
             else:
-                for i in range(valid_len):
-                    temp_array[i, :] = X_sub[i, :, :].flatten(order='F')
-            return temp_array, np.asarray(X_left_inds), np.asarray(
-                X_right_inds)
+                X_flat = X_sub.transpose(0, 2, 1).reshape(valid_len, window_size * n_sequences)
+            return X_flat, X_left_inds, X_right_inds
 
         else:
-            return np.asarray(X_sub), np.asarray(X_left_inds), np.asarray(
-                X_right_inds)
+            return X_sub, X_left_inds, X_right_inds
     else:
-        return X_sub, np.asarray(X_left_inds), np.asarray(X_right_inds)
+        return list(X_sub), X_left_inds, X_right_inds
+
+
+def iter_sub_matrices(X, window_size, step=1, batch_size=1024, flatten=True,
+                      flatten_order='F'):
+    """Iterate over the sub matrices of a multivariate time series in
+    batches, so that at most ``batch_size`` windows are materialized at once.
+
+    Parameters
+    ----------
+    X : numpy array of shape (n_samples, n_sequences)
+        The input samples.
+
+    window_size : int
+        The moving window size.
+
+    step : int, optional (default=1)
+        The displacement for moving window.
+
+    batch_size : int, optional (default=1024)
+        The number of windows per batch.
+
+    flatten : bool, optional (default=True)
+        If True, flatten each batch in 2d.
+
+    flatten_order : str, optional (default='F')
+        See ``get_sub_matrices``.
+
+    Yields
+    ------
+    X_sub : numpy array of shape (n_batch, window_size*n_sequences)
+        The sub matrices of the batch, as returned by ``get_sub_matrices``.
+
+    X_left_inds : numpy array of shape (n_batch,)
+        The left indices of the windows in ``X``.
+
+    X_right_inds : numpy array of shape (n_batch,)
+        The right indices of the windows in ``X``.
+    """
+    X = check_array(X, dtype=np.float64)
+    valid_len = max(get_sub_sequences_length(X.shape[0], window_size, step), 0)
+
+    for start in range(0, valid_len, batch_size):
+        stop = min(start + batch_size, valid_len)
+        offset = start * step
+        X_sub, X_left_inds, X_right_inds = get_sub_matrices(
+            X[offset:(stop - 1) * step + window_size],
+            window_size,
+            step,
+            return_numpy=True,
+            flatten=flatten,
+            flatten_order=flatten_order)
+        yield X_sub, X_left_inds + offset, X_right_inds + offset
+
+
+def batch_decision_function(decision_function, X, window_size, step=1,
+                            batch_size=1024, flatten_order='F'):
+    """Score the flattened sub matrices of X batch by batch.
+
+    Parameters
+    ----------
+    decision_function : callable
+        Maps a (n_batch, window_size*n_sequences) array to n_batch scores.
+
+    X : numpy array of shape (n_samples, n_sequences)
+        The input samples.
+
+    window_size : int
+        The moving window size.
+
+    step : int, optional (default=1)
+        The displacement for moving window.
+
+    batch_size : int, optional (default=1024)
+        The number of windows scored at once.
+
+    flatten_order : str, optional (default='F')
+        See ``get_sub_matrices``.
+
+    Returns
+    -------
+    anomaly_scores : numpy array of shape (valid_len,)
+        The scores of all windows.
+
+    X_left_inds : numpy array of shape (valid_len,)
+        The left indices of the windows.
+
+    X_right_inds : numpy array of shape (valid_len,)
+        The right indices of the windows.
+    """
+    scores, left_inds, right_inds = [], [], []
+    for X_sub, X_left_inds, X_right_inds in iter_sub_matrices(
+            X, window_size, step, batch_size=batch_size, flatten=True,
+            flatten_order=flatten_order):
+        scores.append(np.asarray(decision_function(X_sub)).ravel())
+        left_inds.append(X_left_inds)
+        right_inds.append(X_right_inds)
+
+    if not scores:
+        return np.zeros(0), np.zeros(0, dtype=int), np.zeros(0, dtype=int)
+    return np.concatenate(scores), np.concatenate(left_inds), \
+        np.concatenate(right_inds)
 
 
 def get_sub_sequences_length(n_samples, window_size, step):
@@ -1,4 +1,5 @@
 import numpy as np
+from numpy.lib.stride_tricks import as_strided
 import os
 import logging
 
@@ -6,7 +7,7 @@ logger = logging.getLogger('telemanom')
 
 
 class Channel:
-    def __init__(self,n_predictions,l_s):
+    def __init__(self,n_predictions,l_s,dtype=np.float64):
         # , config, chan_id):
         """
         Load and reshape channel values (predicted and actual).
@@ -28,6 +29,10 @@ class Channel:
                 [timesteps, n_predictions, 1)
             train (arr): train data loaded from .npy file
             test(arr): test data loaded from .npy file
+
+        X_train and X_test are read-only strided views of the input streams,
+        their windows share the memory of the streams. dtype is the floating
+        point type of the windows, float32 halves their memory.
         """
 
         # self.id = chan_id
@@ -42,6 +47,32 @@ class Channel:
 
         self._n_predictions = n_predictions
         self._l_s = l_s
+        self._dtype = dtype
+
+    def _shape_data(self, arr):
+        """Windows of l_s timesteps of arr and the n_predictions timesteps
+        following each of them, flattened.
+
+        Args:
+            arr (np array): array of input streams with
+                dimensions [timesteps, input dimensions]
+
+        Returns:
+            X (arr): read-only view of dimensions [windows, l_s, input dimensions]
+            y (arr): dimensions [windows, n_predictions * input dimensions]
+        """
+        arr = np.ascontiguousarray(arr, dtype=self._dtype)
+        n_windows = len(arr) - self._l_s - self._n_predictions
+        if n_windows <= 0:
+            raise ValueError('l_s ({}) + n_predictions ({}) too large for stream length {}.'
+                             .format(self._l_s, self._n_predictions, len(arr)))
+
+        step, feature = arr.strides
+        X = as_strided(arr, shape=(n_windows, self._l_s, arr.shape[1]),
+                       strides=(step, step, feature), writeable=False)
+        y = as_strided(arr[self._l_s:], shape=(n_windows, self._n_predictions, arr.shape[1]),
+                       strides=(step, step, feature), writeable=False)
+        return X, np.reshape(y, (n_windows, self._n_predictions * arr.shape[1]))
 
     def shape_train_data(self, arr):
         # , train=True):
@@ -55,44 +86,13 @@ class Channel:
             train (bool): If shaping training data, this indicates
                 data can be shuffled
         """
-        # print("in shape data")
-        # print("arr shape",arr.shape)
-        # print("ls",self.config.l_s)
-        # print("n_pred",self.config.n_predictions)
-        data = []
-
-        for i in range(len(arr) - self._l_s - self._n_predictions):
-            data.append(arr[i:i + self._l_s + self._n_predictions])
-        data = np.array(data)
-        # print("data shape",data.shape)
-        # assert len(data.shape) == 3
-
-        # if train:
-        #     # np.random.shuffle(data)
-        #     self.X_train = data[:, :-self.config.n_predictions, :]
-        #     self.y_train = data[:, -self.config.n_predictions:, :]  # telemetry value is at position 0
-        #     self.y_train = np.reshape(self.y_train,(self.y_train.shape[0],self.y_train.shape[1]*self.y_train.shape[2]))
-        #     print("X train shape",self.X_train .shape)
-        #     print("Y train shape",self.y_train .shape)
-        # else:
-        
-        self.X_train = data[:, :-self._n_predictions, :]
-        self.y_train = data[:, -self._n_predictions:, :]  # telemetry value is at position 0
-        self.y_train = np.reshape(self.y_train,(self.y_train.shape[0],self.y_train.shape[1]*self.y_train.shape[2]))
-        
-
-        
+        self.X_train, self.y_train = self._shape_data(arr)
 
     def shape_test_data(self, arr):
-        data = []
-
-        for i in range(len(arr) - self._l_s - self._n_predictions):
-            data.append(arr[i:i + self._l_s + self._n_predictions])
-        data = np.array(data)
-        # print("data shape",data.shape)
-        self.X_test = data[:, :-self._n_predictions, :]
-        self.y_test = data[:, -self._n_predictions:, :]  # telemetry value is at position 0
-        self.y_test = np.reshape(self.y_test,(self.y_test.shape[0],self.y_test.shape[1]*self.y_test.shape[2]))
+        """Shape raw input streams into the test windows of the LSTM, see
+        shape_train_data.
+        """
+        self.X_test, self.y_test = self._shape_data(arr)
 
 
     # def load_data(self):
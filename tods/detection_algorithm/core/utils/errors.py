@@ -54,28 +54,19 @@ class Errors:
         self.i_anom = np.array([])
         self.E_seq = []
         self.anom_scores = []
-        channel.y_test = np.reshape(channel.y_test,(channel.X_test.shape[0],self._n_predictions,channel.X_test.shape[2]))
-        # print("*****************************")
-        # print("y_hat shape",channel.y_hat.shape)
-        # print("y_test shape",channel.y_test.shape)
-
-        channel.y_hat = np.reshape(channel.y_hat, (channel.y_hat.shape[0]*channel.y_hat.shape[1]*channel.y_hat.shape[2]))
-        channel.y_test = np.reshape(channel.y_test, (channel.y_test.shape[0]*channel.y_test.shape[1]*channel.y_test.shape[2]))
-
-        # print("after y_hat shape",channel.y_hat.shape)
-        # print(" after y_test shape",channel.y_test.shape)
-        
-        
-        # raw prediction error
-        self.e = [abs(y_h-y_t) for y_h, y_t in
-                  zip(channel.y_hat, channel.y_test)]
-
-        self.e = np.reshape(self.e,(channel.X_test.shape[0],self._n_predictions,channel.X_test.shape[2]))
-        # print("raw shape",self.e.shape)
-
         n_pred = self._n_predictions
         n_feature = channel.X_test.shape[2]
 
+        channel.y_hat = np.reshape(channel.y_hat, (channel.y_hat.size,))
+        channel.y_test = np.reshape(channel.y_test, (channel.y_test.size,))
+        if not len(channel.y_hat) == len(channel.y_test):
+            raise ValueError('len(y_hat) != len(y_test): {}, {}'
+                             .format(len(channel.y_hat), len(channel.y_test)))
+
+        # raw prediction error
+        self.e = np.abs(channel.y_hat - channel.y_test)
+        self.e = np.reshape(self.e,(channel.X_test.shape[0],n_pred,n_feature))
+
         # Aggregation for point wise
         # aggregated_error = np.zeros(n_feature*(len(self.e)+n_pred-1))
         # aggregated_error = np.reshape(aggregated_error,((len(self.e)+n_pred-1),n_feature))
@@ -93,18 +84,10 @@ class Errors:
         #         aggregated_error[i-1] /=n_pred 
 
         # Aggregation sequence wise
-        aggregated_error = []
-        for i in range(0,len(self.e)):
-            aggregated_error.append(np.sum(self.e[i],axis=0))
+        aggregated_error = np.sum(self.e, axis=1)
 
-        aggregated_error = np.asarray(aggregated_error)
-        # print(aggregated_error.shape)
-        
         smoothing_window = int(self._batch_size * self._window_size
                                * self._smoothing_perc)
-        if not len(channel.y_hat) == len(channel.y_test):
-            raise ValueError('len(y_hat) != len(y_test): {}, {}'
-                             .format(len(channel.y_hat), len(channel.y_test)))
 
         # smoothed prediction error
         self.e_s = pd.DataFrame(aggregated_error).ewm(span=smoothing_window)\
@@ -14,7 +14,8 @@ logger = logging.getLogger('telemanom')
 
 class Model:
     def __init__(self, channel,patience,min_delta,layers,dropout,n_predictions,loss_metric,
-                 optimizer,lstm_batch_size,epochs,validation_split,batch_size,l_s
+                 optimizer,lstm_batch_size,epochs,validation_split,batch_size,l_s,
+                 chunk_size=None
                 ):
         """
         Loads/trains RNN and predicts future telemetry values for a channel.
@@ -25,6 +26,8 @@ class Model:
             run_id (str): Datetime referencing set of predictions in use
             channel (obj): Channel class object containing train/test data
                 for X,y for a single channel
+            chunk_size (int): number of test windows predicted per call of
+                the model, all of them at once if None
 
         Attributes:
             config (obj): see Args
@@ -54,6 +57,7 @@ class Model:
         self._validation_split = validation_split
         self._batch_size = batch_size
         self._l_s = l_s
+        self._chunk_size = chunk_size
         
         self.train_new(channel)
 
@@ -199,8 +203,15 @@ class Model:
 
         # return channel
 
-        self.y_hat = self.model.predict(channel.X_test)        
-        self.y_hat = np.reshape(self.y_hat,(channel.X_test.shape[0],self._n_predictions,channel.X_test.shape[2]))
-        # print("shape before ",self.y_hat.shape)
+        # the windows of X_test are views of the channel values, only the
+        # windows of one chunk are copied at a time
+        n_windows = channel.X_test.shape[0]
+        chunk_size = n_windows if self._chunk_size is None else max(self._chunk_size, 1)
+        self.y_hat = np.empty((n_windows,self._n_predictions*channel.X_test.shape[2]), dtype=channel.X_test.dtype)
+        for start in range(0, n_windows, chunk_size):
+            X_test_chunk = np.ascontiguousarray(channel.X_test[start:start + chunk_size])
+            self.y_hat[start:start + chunk_size] = self.model.predict(X_test_chunk)
+
+        self.y_hat = np.reshape(self.y_hat,(n_windows,self._n_predictions,channel.X_test.shape[2]))
         channel.y_hat = self.y_hat
         return channel
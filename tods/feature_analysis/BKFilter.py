@@ -33,6 +33,7 @@ __all__ = ('BKFilterPrimitive',)
 Inputs = container.DataFrame
 Outputs = container.DataFrame
 from tods.utils import construct_primitive_metadata
+from tods.common.parallel import map_columns
 
 class Hyperparams(hyperparams.Hyperparams):
     # Tuning
@@ -57,6 +58,11 @@ class Hyperparams(hyperparams.Hyperparams):
         semantic_types=['https://metadata.datadrivendiscovery.org/types/TuningParameter'],
         description="Lead-lag length of the filter. Baxter and King propose a truncation length of 12 for quarterly data and 3 for annual data.",
     )
+    n_jobs = hyperparams.Hyperparameter[int](
+        default=1,
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/ResourcesUseParameter'],
+        description='Number of worker processes filtering the columns, -1 uses all the CPU cores and 1 filters them one after another.',
+    )
 
     # Control
     columns_using_method= hyperparams.Enumeration(
@@ -119,6 +125,10 @@ class Hyperparams(hyperparams.Hyperparams):
     )
 
     
+def _bkfilter_column(column, low, high, K):
+    return sm.tsa.filters.bkfilter(column, low=low, high=high, K=K)
+
+
 class BKFilterPrimitive(TODSTransformerPrimitiveBase[Inputs, Outputs, Hyperparams]):
     """
     Filter a time series using the Baxter-King bandpass filter.
@@ -132,6 +142,8 @@ Parameters
         Maximum period for oscillations BK suggest that the U.S. business cycle has 32 for quarterly data and 8 for annual data.
     K: int
         Lead-lag length of the filter. Baxter and King propose a truncation length of 12 for quarterly data and 3 for annual data.  
+    n_jobs: int
+        Number of worker processes filtering the columns, -1 uses all the CPU cores.
     
 .. dropdown:: Control Parameter
 
@@ -358,10 +370,7 @@ Parameters
         Returns:
             Dataframe, results of BKFilter
         """
-        transformed_X = utils.pandas.DataFrame()
-        for col in X.columns:
-            cycle = sm.tsa.filters.bkfilter(X[col], low=low, high=high, K=K)
-            cycle_df = utils.pandas.DataFrame(cycle)
-            transformed_X = utils.pandas.concat([transformed_X,cycle_df], axis=1)
+        cycles = map_columns(_bkfilter_column, X, n_jobs=self.hyperparams['n_jobs'], low=low, high=high, K=K)
+        transformed_X = utils.pandas.concat([utils.pandas.DataFrame(cycle) for cycle in cycles], axis=1)
 
         return transformed_X
@@ -15,6 +15,7 @@ from scipy.fft import dct
 from collections import OrderedDict
 from typing import cast, Dict, List, Union, Sequence, Optional, Tuple
 from ..common.TODSBasePrimitives import TODSTransformerPrimitiveBase
+from .core.spectral import windowed_dct_bands
 
 
 from scipy import sparse
@@ -92,6 +93,29 @@ class Hyperparams(hyperparams.Hyperparams):
         semantic_types=['https://metadata.datadrivendiscovery.org/types/ControlParameter'],
     )
 
+    output_dtype = hyperparams.Enumeration(
+        values=['float64', 'float32'],
+        default='float64',
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/ControlParameter'],
+        description="Floating point type of the transform and of its output columns, float32 halves their memory.",
+    )
+
+    window_size = hyperparams.Hyperparameter[int](
+        default=-1,
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/ControlParameter'],
+        description="Size of the sliding windows of the short-time transform, -1 transforms each column at once.",
+    )
+    step_size = hyperparams.Hyperparameter[int](
+        default=1,
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/ControlParameter'],
+        description="Number of samples between the starts of two sliding windows, a time step gets the features of the last window ending at or before it.",
+    )
+    n_bands = hyperparams.Hyperparameter[int](
+        default=8,
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/ControlParameter'],
+        description="Number of frequency bands summarizing the spectrum of every sliding window.",
+    )
+
     # parameters for column
     use_columns = hyperparams.Set(
         elements=hyperparams.Hyperparameter[int](-1),
@@ -135,29 +159,55 @@ class Hyperparams(hyperparams.Hyperparams):
     )
 
 class DCT:
-    def __init__(self,type_,n,axis,overwrite_x,norm,workers):
+    def __init__(self,type_,n,axis,overwrite_x,norm,workers,dtype='float64',window_size=-1,step_size=1,n_bands=8):
         self._type = type_
         self._n = n
         self._axis = axis
         self._overwrite_x = overwrite_x
         self._norm = norm
         self._workers = workers
+        self._dtype = dtype
+        self._window_size = window_size
+        self._step_size = step_size
+        self._n_bands = n_bands
         
     def produce(self, inputs):
 
         dataframe = inputs
+        if self._window_size > 0:
+            return self.produce_windowed(dataframe)
+
         processed_df = utils.pandas.DataFrame()
+        columns = [target_column+"_dct_coeff" for target_column in dataframe.columns]
         try:
-            for target_column in dataframe.columns :
-                dct_input = dataframe[target_column].values
-                dct_output = dct(x=dct_input,type=self._type,n=self._n,axis=self._axis,overwrite_x=self._overwrite_x,norm=self._norm,workers=self._workers)
-                processed_df[target_column+"_dct_coeff"]=pd.Series(dct_output)
+            if self._axis in (0, -1) and len(dataframe.columns) > 0:
+                # all the columns in one 2-D transform along the rows
+                dct_input = dataframe.to_numpy()
+                if self._dtype == 'float32':
+                    dct_input = dct_input.astype(np.float32)
+                dct_output = dct(x=dct_input,type=self._type,n=self._n,axis=0,overwrite_x=self._overwrite_x,norm=self._norm,workers=self._workers)
+            else:
+                dct_output = np.stack([dct(x=dataframe[target_column].values,type=self._type,n=self._n,axis=self._axis,overwrite_x=self._overwrite_x,norm=self._norm,workers=self._workers)
+                                       for target_column in dataframe.columns], axis=1)
+
+            processed_df = utils.pandas.DataFrame(dct_output.astype(self._dtype, copy=False), columns=columns)
             
         except IndexError:
             logging.warning("Index not found in dataframe")
 
         return processed_df;
 
+    def produce_windowed(self, inputs):
+        """
+        Mean absolute DCT coefficient of the bands of the sliding window of every time step,
+        in columns named 'column_name_dct_band<k>'
+        """
+        processed = [windowed_dct_bands(inputs[target_column].values, self._window_size, self._step_size, self._n_bands,
+                                        type_=self._type, norm=self._norm, workers=self._workers, dtype=self._dtype)
+                     for target_column in inputs.columns]
+        columns = [target_column+"_dct_band"+str(band) for target_column in inputs.columns for band in range(self._n_bands)]
+        return utils.pandas.DataFrame(np.concatenate(processed, axis=1), columns=columns)
+
 
         
 
@@ -188,6 +238,18 @@ Parameters
 
     workers: int
         Maximum number of workers to use for parallel computation. If negative, the value wraps around from os.cpu_count(). Defualt is None.
+
+    output_dtype: str
+        Floating point type of the transform and of its output columns, float32 halves their memory. Default is float64.
+
+    window_size: int
+        Size of the sliding windows of the short-time transform, -1 transforms each column at once. Default is -1.
+
+    step_size: int
+        Number of samples between the starts of two sliding windows, a time step gets the features of the last window ending at or before it. Default is 1.
+
+    n_bands: int
+        Number of frequency bands summarizing the spectrum of every sliding window. Default is 8.
     
 .. dropdown:: Control Parameter
 
@@ -226,7 +288,11 @@ Parameters
                         axis=self.hyperparams['axis'],
                         overwrite_x=self.hyperparams['overwrite_x'],
                         norm = self.hyperparams['norm'],
-                        workers = self.hyperparams['workers']
+                        workers = self.hyperparams['workers'],
+                        dtype = self.hyperparams['output_dtype'],
+                        window_size = self.hyperparams['window_size'],
+                        step_size = self.hyperparams['step_size'],
+                        n_bands = self.hyperparams['n_bands']
                         )
 
     def _produce(self, *, inputs: Inputs, timeout: float = None, iterations: int = None) -> base.CallResult[Outputs]:
@@ -18,6 +18,7 @@ from typing import cast, Dict, List, Union, Sequence, Optional, Tuple
 from scipy import sparse
 from numpy import ndarray
 from ..common.TODSBasePrimitives import TODSTransformerPrimitiveBase
+from .core.spectral import windowed_fft_bands
 
 __all__ = ('FastFourierTransformPrimitive',)
 
@@ -81,6 +82,29 @@ class Hyperparams(hyperparams.Hyperparams):
         semantic_types=['https://metadata.datadrivendiscovery.org/types/ControlParameter'],
     )
 
+    output_dtype = hyperparams.Enumeration(
+        values=['float64', 'float32'],
+        default='float64',
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/ControlParameter'],
+        description="Floating point type of the transform and of its output columns, float32 halves their memory.",
+    )
+
+    window_size = hyperparams.Hyperparameter[int](
+        default=-1,
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/ControlParameter'],
+        description="Size of the sliding windows of the short-time transform, -1 transforms each column at once.",
+    )
+    step_size = hyperparams.Hyperparameter[int](
+        default=1,
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/ControlParameter'],
+        description="Number of samples between the starts of two sliding windows, a time step gets the features of the last window ending at or before it.",
+    )
+    n_bands = hyperparams.Hyperparameter[int](
+        default=8,
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/ControlParameter'],
+        description="Number of frequency bands summarizing the spectrum of every sliding window.",
+    )
+
     # TODO: Decide what to do with plan parameter how to work with it
     # plan
 
@@ -127,34 +151,60 @@ class Hyperparams(hyperparams.Hyperparams):
     )
 
 class FFT:
-    def __init__(self,n,axis,overwrite_x,norm,workers):
+    def __init__(self,n,axis,overwrite_x,norm,workers,dtype='float64',window_size=-1,step_size=1,n_bands=8):
         
         self._n = n
         self._axis = axis
         self._overwrite_x = overwrite_x
         self._norm = norm
         self._workers = workers
+        self._dtype = dtype
+        self._window_size = window_size
+        self._step_size = step_size
+        self._n_bands = n_bands
         
     def produce(self, inputs):
 
         dataframe = inputs
+        if self._window_size > 0:
+            return self.produce_windowed(dataframe)
+
         processed_df = utils.pandas.DataFrame()
+        columns = [name for target_column in dataframe.columns
+                   for name in (target_column+"_fft_abs", target_column+"_fft_phse")]
         try:
-            for target_column in dataframe.columns :
-
-                fft_input = dataframe[target_column].values
-                fft_output = fft(x=fft_input,n=self._n,axis=self._axis,overwrite_x=self._overwrite_x,norm=self._norm,workers=self._workers)
-                tuples = [polar(i) for i in fft_output]
-                absolute_values = [i[0] for i in tuples]
-                phase_values = [i[1] for i in tuples]
-                processed_df[target_column+"_fft_abs"]=pd.Series(absolute_values)
-                processed_df[target_column+"_fft_phse"]=pd.Series(phase_values)
+            if self._axis in (0, -1) and len(dataframe.columns) > 0:
+                # all the columns in one 2-D transform along the rows
+                fft_input = dataframe.to_numpy()
+                if self._dtype == 'float32':
+                    fft_input = fft_input.astype(np.float32)
+                fft_output = fft(x=fft_input,n=self._n,axis=0,overwrite_x=self._overwrite_x,norm=self._norm,workers=self._workers)
+            else:
+                fft_output = np.stack([fft(x=dataframe[target_column].values,n=self._n,axis=self._axis,overwrite_x=self._overwrite_x,norm=self._norm,workers=self._workers)
+                                       for target_column in dataframe.columns], axis=1)
+
+            # magnitude and phase of every column side by side
+            processed = np.empty((fft_output.shape[0], 2 * fft_output.shape[1]), dtype=self._dtype)
+            processed[:, 0::2] = np.abs(fft_output)
+            processed[:, 1::2] = np.angle(fft_output)
+            processed_df = utils.pandas.DataFrame(processed, columns=columns)
         
         except IndexError:
             logging.warning("Index not found in dataframe")
 
         return processed_df;
 
+    def produce_windowed(self, inputs):
+        """
+        Mean FFT magnitude of the bands of the sliding window of every time step,
+        in columns named 'column_name_fft_band<k>'
+        """
+        processed = [windowed_fft_bands(inputs[target_column].values, self._window_size, self._step_size, self._n_bands,
+                                        norm=self._norm, workers=self._workers, dtype=self._dtype)
+                     for target_column in inputs.columns]
+        columns = [target_column+"_fft_band"+str(band) for target_column in inputs.columns for band in range(self._n_bands)]
+        return utils.pandas.DataFrame(np.concatenate(processed, axis=1), columns=columns)
+
 
         
 
@@ -177,6 +227,14 @@ Parameters
         If True, the contents of x can be destroyed; the default is False. See the notes below for more details.
     workers: int
         Maximum number of workers to use for parallel computation. If negative, the value wraps around from os.cpu_count(). Defualt is None.
+    output_dtype: str
+        Floating point type of the transform and of its output columns, float32 halves their memory. Default is float64.
+    window_size: int
+        Size of the sliding windows of the short-time transform, -1 transforms each column at once. Default is -1.
+    step_size: int
+        Number of samples between the starts of two sliding windows, a time step gets the features of the last window ending at or before it. Default is 1.
+    n_bands: int
+        Number of frequency bands summarizing the spectrum of every sliding window. Default is 8.
         
 .. dropdown:: Control Parameter
 
@@ -207,7 +265,11 @@ Parameters
                         axis=self.hyperparams['axis'],
                         overwrite_x=self.hyperparams['overwrite_x'],
                         norm = self.hyperparams['norm'],
-                        workers = self.hyperparams['workers']
+                        workers = self.hyperparams['workers'],
+                        dtype = self.hyperparams['output_dtype'],
+                        window_size = self.hyperparams['window_size'],
+                        step_size = self.hyperparams['step_size'],
+                        n_bands = self.hyperparams['n_bands']
                         )
 
     def _produce(self, *, inputs: Inputs, timeout: float = None, iterations: int = None) -> base.CallResult[Outputs]:
@@ -23,9 +23,10 @@ from d3m.primitive_interfaces.base import CallResult, DockerContainer
 
 from ..common.TODSBasePrimitives import TODSTransformerPrimitiveBase
 
-import statsmodels.api as sm
+from functools import lru_cache
+from scipy.linalg import cholesky_banded, cho_solve_banded
 
-__all__ = ('HPFilterPrimitive',)
+__all__ = ('HPFilterPrimitive', 'hpfilter', 'StreamingHPFilter')
 
 Inputs = container.DataFrame
 Outputs = container.DataFrame
@@ -102,6 +103,121 @@ class Hyperparams(hyperparams.Hyperparams):
     )
 
     
+_SECOND_DIFFERENCE = (1., -2., 1.)
+
+
+def _penalty_bands(n, anchored):
+    """
+    Upper banded form of K'K, K being the second differences of n samples.
+    Args:
+        n: Number of samples
+        anchored: The first two differences also involve two fixed samples
+            before the series
+
+    Returns:
+        ndarray of shape (3, n)
+    """
+    bands = numpy.zeros((3, n))
+    rows = numpy.arange(-2 if anchored else 0, n - 2)
+    for i in range(3):
+        for j in range(i, 3):
+            valid = rows + i >= 0
+            numpy.add.at(bands[2 - (j - i)], rows[valid] + j, _SECOND_DIFFERENCE[i] * _SECOND_DIFFERENCE[j])
+    return bands
+
+
+@lru_cache(maxsize=8)
+def _hp_factor(n, lamb, anchored=False):
+    """
+    Banded Cholesky factor of I + lamb K'K, cached per length and lambda.
+    """
+    bands = lamb * _penalty_bands(n, anchored)
+    bands[2] += 1.
+    factor = cholesky_banded(bands, lower=False)
+    factor.flags.writeable = False
+    return factor
+
+
+def hpfilter(X, lamb=1600):
+    """
+    Hodrick-Prescott filter of every column of X.
+
+    The trend solves the banded system (I + lamb K'K) trend = X, K being the
+    second differences. It is factorized once per length and lambda and all
+    the columns are solved together, with the results of statsmodels' hpfilter.
+
+    Args:
+        X: array-like of shape (n_samples,) or (n_samples, n_columns)
+        lamb: The Hodrick-Prescott smoothing parameter
+
+    Returns:
+        cycle, trend: ndarrays of the shape of X
+    """
+    values = numpy.asarray(X, dtype=numpy.float64)
+    trend = cho_solve_banded((_hp_factor(values.shape[0], float(lamb)), False), values, check_finite=False)
+    return values - trend, trend
+
+
+class StreamingHPFilter:
+    """
+    Hodrick-Prescott filter of a series received in chunks.
+
+    The first chunks are filtered exactly. Once more than window samples were
+    received, only the trend of the last window samples and of the appended
+    ones is solved again, the two samples before being held fixed, so an
+    update costs O(window + chunk) whatever the length of the series. The
+    weights of the filter decay geometrically, by e about every lamb ** 0.25
+    samples, and the default window keeps the trend within about 1e-10 of the
+    one of hpfilter on the whole series.
+
+    Args:
+        lamb: The Hodrick-Prescott smoothing parameter
+        window: Number of samples before the appended ones whose trend is
+            revised, 40 * lamb ** 0.25 if None
+    """
+    def __init__(self, lamb=1600, window=None):
+        self.lamb = float(lamb)
+        if window is None:
+            window = int(numpy.ceil(40 * max(self.lamb, 1.) ** 0.25))
+        self.window = window
+        self._values = None
+        self._trend = None
+
+    def update(self, X):
+        """
+        Append samples to the series.
+        Args:
+            X: array-like of shape (n_samples,) or (n_samples, n_columns)
+
+        Returns:
+            cycle, trend: ndarrays of the revised samples, the last
+            min(window + n_samples, length of the series) samples of the series
+        """
+        values = numpy.asarray(X, dtype=numpy.float64)
+        appended = values.shape[0]
+        if self._values is not None:
+            values = numpy.concatenate([self._values, values])
+
+        if self._values is None or self._values.shape[0] < self.window + 2:
+            _, trend = hpfilter(values, self.lamb)
+        else:
+            fixed = self._trend[:2]
+            rhs = values[2:].copy()
+            # Second differences with the fixed samples moved to the right hand side
+            rhs[0] -= self.lamb * (fixed[0] - 2. * fixed[1])
+            if rhs.shape[0] > 1:
+                rhs[0] += 2. * self.lamb * fixed[1]
+                rhs[1] -= self.lamb * fixed[1]
+            factor = _hp_factor(rhs.shape[0], self.lamb, anchored=True)
+            trend = numpy.concatenate([fixed, cho_solve_banded((factor, False), rhs, check_finite=False)])
+
+        self._values = values[-(self.window + 2):]
+        self._trend = trend[-(self.window + 2):]
+
+        revised = min(self.window + appended, values.shape[0])
+        return values[-revised:] - trend[-revised:], trend[-revised:]
+
+
 class HPFilterPrimitive(TODSTransformerPrimitiveBase[Inputs, Outputs, Hyperparams]):
     """
     Filter a time series using the Hodrick-Prescott filter.
@@ -327,10 +443,11 @@ Parameters
         Returns:
             Dataframe, results of HPFilter
         """
-        transformed_X = utils.pandas.DataFrame()
-        for col in X.columns:
-            cycle, trend = sm.tsa.filters.hpfilter(X[col], lamb=lamb)
-            transformed_X[col+"_cycle"] = cycle
-            transformed_X[col+"_trend"] = trend
+        cycle, trend = hpfilter(X, lamb=lamb)
+        values = numpy.empty((cycle.shape[0], 2 * cycle.shape[1]))
+        values[:, 0::2] = cycle
+        values[:, 1::2] = trend
+        columns = [name for col in X.columns for name in (col+"_cycle", col+"_trend")]
+        transformed_X = utils.pandas.DataFrame(values, index=X.index, columns=columns)
 
         return transformed_X
@@ -36,6 +36,7 @@ from d3m import container, utils as d3m_utils
 import stumpy
 
 from sklearn.preprocessing import MinMaxScaler
+from .core.matrix_profile import IncrementalMatrixProfile, approximate_matrix_profile, pad_profile
 # from typing import Union
 
 Inputs = d3m_dataframe
@@ -50,6 +51,37 @@ class Hyperparams(hyperparams.Hyperparams):
         description='The moving window size.',
         semantic_types=['https://metadata.datadrivendiscovery.org/types/TuningParameter']
     )
+    incremental = hyperparams.UniformBool(
+        default=False,
+        description='Keep the matrix profile between calls and only compute the profiles of the new subsequences when the inputs continue the previous ones, e.g. a sliding window over a stream.',
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/ControlParameter']
+    )
+    approximate = hyperparams.UniformBool(
+        default=False,
+        description='Compute an approximate matrix profile from a random subset of the diagonals of the distance matrix, SCRIMP-style, bounded by percentage and time_budget. Takes precedence over incremental.',
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/ControlParameter']
+    )
+    percentage = hyperparams.Uniform(
+        lower=0.,
+        upper=1.,
+        default=0.1,
+        upper_inclusive=True,
+        description='Fraction of the diagonals of the distance matrix visited by the approximate matrix profile, 1 gives the exact profile.',
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/TuningParameter']
+    )
+    time_budget = hyperparams.Union[typing.Union[float, None]](
+        configuration=OrderedDict(
+            limit=hyperparams.Hyperparameter[float](
+                default=1.,
+            ),
+            unlimited=hyperparams.Hyperparameter[None](
+                default=None,
+            ),
+        ),
+        default='unlimited',
+        description='Seconds after which the approximate matrix profile stops visiting diagonals.',
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/ControlParameter']
+    )
 
     # Keep previous
     dataframe_resource = hyperparams.Hyperparameter[typing.Union[str, None]](
@@ -103,8 +135,14 @@ class MP:
     """
     This is the class for matrix profile function
     """
-    def __init__(self, window_size):    #, step_size):
+    def __init__(self, window_size, incremental=False, approximate=False, percentage=0.1, time_budget=None,
+                 random_state=None):    #, step_size):
         self._window_size = window_size
+        self._profile = IncrementalMatrixProfile(window_size) if incremental else None
+        self._approximate = approximate
+        self._percentage = percentage
+        self._time_budget = time_budget
+        self._random_state = random_state
         #self._step_size = step_size
         return
         
@@ -114,23 +152,20 @@ class MP:
         Args:
         	data: dataframe column
         Returns:
-        	nparray
-        """
-        """
-        #only keep first two columns of MP results, the second column is left index, use windowsize to get right index
-        transformed_columns=utils.pandas.DataFrame()
-        for col in data.transpose(): #data.reshape(1,len(data)):
-        	output = stumpy.stump(col, m = self._window_size)
-        	output = pd.DataFrame(output)
-        	output=output.drop(columns=[2,3])
-        	output = self._get_right_inds(output)
-        	transformed_columns=pd.concat([transformed_columns,output], axis=1)
-        return transformed_columns
+        	nparray of shape (n_samples, n_columns), row k of column j is the
+        	(j + 1)-dimensional matrix profile of the subsequence starting at k,
+        	the last window_size - 1 rows repeat the last subsequence
         """
-        matrix_profile, matrix_profile_indices = stumpy.mstump(data, m = self._window_size)
-        print('matrix profile ', matrix_profile)
-        #output = np.concatenate((output, left_inds_, right_inds_),axis=1)
-        return matrix_profile
+        values = np.asarray(data, dtype=np.float64)
+        if self._approximate:
+            matrix_profile, _ = approximate_matrix_profile(values, self._window_size, percentage=self._percentage,
+                                                           time_budget=self._time_budget,
+                                                           random_state=self._random_state)
+        elif self._profile is not None:
+            matrix_profile = self._profile.update(values)
+        else:
+            matrix_profile, _ = stumpy.mstump(values.T, m = self._window_size)
+        return pad_profile(matrix_profile.T, values.shape[0])
 		
 class MatrixProfilePrimitive(transformer.TransformerPrimitiveBase[Inputs, Outputs, Hyperparams]):
     """
@@ -159,7 +194,7 @@ class MatrixProfilePrimitive(transformer.TransformerPrimitiveBase[Inputs, Output
             the right matrix profile indices.
     """
 
-    metadata = construct_primitive_metadata(module='feature_analysis', name='matrix_profile', id='MatrixProfilePrimitive', primitive_family='anomaly_detect', hyperparams=['window_size'], description='Matrix Profile')
+    metadata = construct_primitive_metadata(module='feature_analysis', name='matrix_profile', id='MatrixProfilePrimitive', primitive_family='anomaly_detect', hyperparams=['window_size', 'percentage'], description='Matrix Profile')
     
     
 
@@ -170,7 +205,9 @@ class MatrixProfilePrimitive(transformer.TransformerPrimitiveBase[Inputs, Output
                  docker_containers: Dict[str, DockerContainer] = None) -> None:
         super().__init__(hyperparams=hyperparams, random_seed=random_seed, docker_containers=docker_containers)
 
-        self._clf = MP(window_size=hyperparams['window_size'])  #, step_size=hyperparams['step_size'])
+        self._clf = MP(window_size=hyperparams['window_size'], incremental=hyperparams['incremental'],
+                       approximate=hyperparams['approximate'], percentage=hyperparams['percentage'],
+                       time_budget=hyperparams['time_budget'], random_state=random_seed)  #, step_size=hyperparams['step_size'])
 
 
     def produce(self, *, inputs: Inputs, timeout: float = None, iterations: int = None) -> base.CallResult[Outputs]:
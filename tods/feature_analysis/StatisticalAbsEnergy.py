@@ -21,6 +21,7 @@ from d3m.primitive_interfaces import base, transformer
 from d3m.container import DataFrame as d3m_dataframe
 from d3m.metadata import hyperparams, params, base as metadata_base
 from ..common.TODSBasePrimitives import TODSTransformerPrimitiveBase
+from .core.rolling import rolling_statistics_frame
 
 from d3m.base import utils as base_utils
 from d3m.exceptions import PrimitiveNotFittedError
@@ -314,16 +315,4 @@ Parameters
             DataFrame
             A object with abs_energy
         """
-        if(window_size==-1):
-            window_size = len(X)
-        transformed_X = utils.pandas.DataFrame()
-        for column in X.columns:
-            column_value = X[column].values
-            column_abs_energy = np.zeros(len(column_value))
-            for iter in range(window_size-1,len(column_value)):
-                sequence = column_value[iter-window_size+1:iter+1]
-                column_abs_energy[iter] = np.round(np.sum(sequence*sequence),4)
-            column_abs_energy[:window_size-1] = column_abs_energy[window_size-1]
-            transformed_X[column + "_abs_energy"] = column_abs_energy
-
-        return transformed_X
+        return rolling_statistics_frame(X, window_size, 'abs_energy')
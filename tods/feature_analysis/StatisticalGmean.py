@@ -25,6 +25,7 @@ from d3m.base import utils as base_utils
 from d3m.exceptions import PrimitiveNotFittedError
 from d3m.exceptions import UnexpectedValueError
 from ..common.TODSBasePrimitives import TODSTransformerPrimitiveBase
+from .core.rolling import rolling_statistics_frame
 
 __all__ = ('StatisticalGmeanPrimitive',)
 
@@ -316,19 +317,4 @@ Parameters
             DataFrame
             A object with gmean
         """
-
-
-        if(window_size==-1):
-            window_size = len(X)
-        transformed_X = utils.pandas.DataFrame()
-        for column in X.columns:
-
-            column_value = X[column].values
-            column_gmean = np.zeros(len(column_value))
-            for iter in range(window_size-1,len(column_value)):
-                sequence = column_value[iter-window_size+1:iter+1]
-                column_gmean[iter] = stats.gmean(sequence).round(4)
-            column_gmean[:window_size-1] = column_gmean[window_size-1]
-            transformed_X[column + "_gmean"] = column_gmean
-
-        return transformed_X
+        return rolling_statistics_frame(X, window_size, 'gmean')
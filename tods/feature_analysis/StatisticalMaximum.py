@@ -24,6 +24,7 @@ from d3m.metadata import hyperparams, params, base as metadata_base
 from d3m.base import utils as base_utils
 from d3m.exceptions import PrimitiveNotFittedError
 from ..common.TODSBasePrimitives import TODSTransformerPrimitiveBase
+from .core.rolling import rolling_statistics_frame
 
 __all__ = ('StatisticalMaximumPrimitive',)
 
@@ -313,16 +314,4 @@ Parameters
             DataFrame
             A object with maximum
         """
-        if(window_size==-1):
-            window_size = len(X)
-        transformed_X = utils.pandas.DataFrame()
-        for column in X.columns:
-            column_value = X[column].values
-            column_maximum = np.zeros(len(column_value))
-            for iter in range(window_size-1,len(column_value)):
-                sequence = column_value[iter-window_size+1:iter+1]
-                column_maximum[iter] = np.max(sequence)
-            column_maximum[:window_size-1] = column_maximum[window_size-1]
-            transformed_X[str(column) + "_maximum"] = column_maximum
-
-        return transformed_X
+        return rolling_statistics_frame(X, window_size, 'maximum')
@@ -24,6 +24,7 @@ from d3m.metadata import hyperparams, params, base as metadata_base
 from d3m.base import utils as base_utils
 from d3m.exceptions import PrimitiveNotFittedError
 from ..common.TODSBasePrimitives import TODSTransformerPrimitiveBase
+from .core.rolling import rolling_statistics_frame
 
 __all__ = ('StatisticalWillisonAmplitudePrimitive',)
 
@@ -318,23 +319,4 @@ Parameters
             DataFrame
             A object with willison_amplitude
         """
-        if(window_size==-1):
-            window_size = len(X)
-        transformed_X = utils.pandas.DataFrame()
-        for column in X.columns:
-            column_diff_value = np.zeros(len(X[column])+1)    # array of 1 extra row use to adjust X(t)-X(t-1)
-            column_diff_value[1:] = (X[column].values)
-            column_diff_value = np.abs(np.diff(column_diff_value))
-            willison_func_values = np.zeros(len(X[column]))
-            mask = (column_diff_value>threshold)
-            willison_func_values[mask] = 1
-
-            column_willison_amplitude = np.zeros(len(X[column].values))
-
-            for iter in range(window_size-1,len(column_diff_value)):
-                sequence = willison_func_values[iter-window_size+1:iter+1]
-                column_willison_amplitude[iter] = np.sum(sequence)
-            column_willison_amplitude[:window_size-1] = column_willison_amplitude[window_size-1]
-            transformed_X[column + "_willison_amplitude"] = column_willison_amplitude
-
-        return transformed_X
+        return rolling_statistics_frame(X, window_size, 'willison_amplitude', threshold=threshold)
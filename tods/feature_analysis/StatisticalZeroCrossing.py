@@ -24,6 +24,7 @@ from d3m.metadata import hyperparams, params, base as metadata_base
 from d3m.base import utils as base_utils
 from d3m.exceptions import PrimitiveNotFittedError
 from ..common.TODSBasePrimitives import TODSTransformerPrimitiveBase
+from .core.rolling import rolling_statistics_frame
 
 __all__ = ('StatisticalZeroCrossingPrimitive',)
 
@@ -309,13 +310,4 @@ Parameters
             DataFrame
             A object with zero crossing
         """
-        transformed_X = utils.pandas.DataFrame()
-        for column in X.columns:
-            column_value = X[column].values
-            column_zero_crossing = np.zeros(len(column_value))
-            for iter in range(1,len(column_value)):
-                if(column_value[iter]*column_value[iter-1] < 0.0 ):
-                    column_zero_crossing[iter] = 1
-            transformed_X[column + "_zero_crossing"] = column_zero_crossing
-
-        return transformed_X
+        return rolling_statistics_frame(X, -1, 'zero_crossing')
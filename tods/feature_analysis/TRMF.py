@@ -117,6 +117,18 @@ class Hyperparams(hyperparams.Hyperparams):
         semantic_types=['https://metadata.datadrivendiscovery.org/types/TuningParameter'],
         description="Step of gradient descent when updating matrix W.",
     )
+    tol = hyperparams.Uniform(
+        lower=0,
+        upper=100000000,
+        default=0.,
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/TuningParameter'],
+        description="Stop updating once the steps of matrices F, X and W are all smaller than tol relative to their norms. All max_iter iterations are made if 0.",
+    )
+    warm_start = hyperparams.UniformBool(
+        default=False,
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/ControlParameter'],
+        description="Start each produce from the matrices of the previous one, extended to the appended timeseries and timepoints, instead of random matrices.",
+    )
 
     # Control
     use_columns = hyperparams.Set(
@@ -187,6 +199,11 @@ Parameters
         Step of gradient descent when updating matrix X.
     W_step : float
         Step of gradient descent when updating matrix W.
+    tol : float
+        Stop updating once the relative steps of matrices F, X and W are all smaller than tol.
+    warm_start : bool
+        Start each produce from the matrices of the previous one, extended to the appended
+        timeseries and timepoints, so refits on a growing panel converge in few iterations.
 
 .. dropdown:: Attributes
  
@@ -205,10 +222,14 @@ Parameters
     Which can be found there: http://www.cs.utexas.edu/~rofuyu/papers/tr-mf-nips.pdf
     """
 
-    metadata = construct_primitive_metadata(module='feature_analysis', name='trmf', id='TRMFPrimitive', primitive_family='feature_construct', hyperparams=['lags', 'K', 'lambda_f', 'lambda_x', 'lambda_w', 'alpha', 'eta', 'max_iter', 'F_step', 'X_step', 'W_step'], description='Temporal Regularized Matrix Factorization Primitive')
+    metadata = construct_primitive_metadata(module='feature_analysis', name='trmf', id='TRMFPrimitive', primitive_family='feature_construct', hyperparams=['lags', 'K', 'lambda_f', 'lambda_x', 'lambda_w', 'alpha', 'eta', 'max_iter', 'F_step', 'X_step', 'W_step', 'tol'], description='Temporal Regularized Matrix Factorization Primitive')
     
     
 
+    def __init__(self, *, hyperparams: Hyperparams) -> None:
+        super().__init__(hyperparams=hyperparams)
+
+        self._clf = None
         
     def _produce(self, *, inputs: Inputs, timeout: float = None, iterations: int = None) -> CallResult[Outputs]:
         """
@@ -219,19 +240,22 @@ Parameters
         Returns:
             Container DataFrame after TRMF.
         """
-        self._clf = trmf(
-            lags=self.hyperparams['lags'],
-            K=self.hyperparams['K'],
-            lambda_f=self.hyperparams['lambda_f'],
-            lambda_x=self.hyperparams['lambda_x'],
-            lambda_w=self.hyperparams['lambda_w'],
-            alpha=self.hyperparams['alpha'],
-            eta=self.hyperparams['eta'],
-            max_iter=self.hyperparams['max_iter'],
-            F_step=self.hyperparams['F_step'],
-            X_step=self.hyperparams['X_step'],
-            W_step=self.hyperparams['W_step'],            
-        ) 
+        if self._clf is None or not self.hyperparams['warm_start']:
+            self._clf = trmf(
+                lags=self.hyperparams['lags'],
+                K=self.hyperparams['K'],
+                lambda_f=self.hyperparams['lambda_f'],
+                lambda_x=self.hyperparams['lambda_x'],
+                lambda_w=self.hyperparams['lambda_w'],
+                alpha=self.hyperparams['alpha'],
+                eta=self.hyperparams['eta'],
+                max_iter=self.hyperparams['max_iter'],
+                F_step=self.hyperparams['F_step'],
+                X_step=self.hyperparams['X_step'],
+                W_step=self.hyperparams['W_step'],
+                tol=self.hyperparams['tol'],
+                warm_start=self.hyperparams['warm_start'],
+            )
 
 
         tmp = inputs.copy()
@@ -452,7 +476,7 @@ class trmf:
 
     # Original
     def __init__(self, lags, K, lambda_f, lambda_x, lambda_w, alpha, eta, max_iter=1000, 
-                 F_step=0.0001, X_step=0.0001, W_step=0.0001):
+                 F_step=0.0001, X_step=0.0001, W_step=0.0001, tol=0., warm_start=False):
         self.lags = lags
         self.L = len(lags)
         self.K = K
@@ -465,10 +489,15 @@ class trmf:
         self.F_step = F_step
         self.X_step = X_step
         self.W_step = W_step
+        self.tol = tol
+        self.warm_start = warm_start
         
         self.W = None
         self.F = None
         self.X = None
+        self.n_iter_ = 0
+
+        self._lags = np.asarray(lags, dtype=np.int64)
 
 
     def fit(self, train, resume=False):
@@ -479,7 +508,13 @@ class trmf:
             -   matrix self.X;
             -   matrix self.W.
             
-        Each matrix updated with gradient descent.
+        Each matrix updated with gradient descent, until max_iter rounds are
+        made or the relative size of the steps of all matrices falls below tol.
+
+        With warm_start, a refit on the same panel with new timeseries or
+        timepoints appended starts from the previous factors: the new
+        timepoints of X are forecasted with W and the new rows of F are
+        fitted by ridge regression on X.
 
         Parameters
         ----------
@@ -496,19 +531,60 @@ class trmf:
         """
 
         if not resume:
-            self.Y = train.T
-            mask = np.array((~np.isnan(self.Y)).astype(int))
+            Y = np.array(train, dtype=np.float64).T
+            mask = (~np.isnan(Y)).astype(int)
+            Y[mask == 0] = 0.
+            N, T = Y.shape
+
+            if self.warm_start and self.F is not None and N >= self.N and T >= self.T and self.K == self.F.shape[1]:
+                self._extend_factors(Y, mask)
+            else:
+                self.W = np.random.randn(self.K, self.L) / self.L
+                self.F = np.random.randn(N, self.K)
+                self.X = np.random.randn(self.K, T)
+
+            self.Y = Y
             self.mask = mask
-            self.Y[self.mask == 0] = 0.
-            self.N, self.T = self.Y.shape
-            self.W = np.random.randn(self.K, self.L) / self.L
-            self.F = np.random.randn(self.N, self.K)
-            self.X = np.random.randn(self.K, self.T)
+            self.N, self.T = N, T
+
+        self.n_iter_ = 0
+        for self.n_iter_ in range(1, self.max_iter + 1):
+            change = max(self._update_F(step=self.F_step),
+                         self._update_X(step=self.X_step),
+                         self._update_W(step=self.W_step))
+            if change < self.tol:
+                break
+
+        return self
+
+
+    def _extend_factors(self, Y, mask):
+        """Extend the factors of a previous fit to a panel with appended
+        timeseries or timepoints.
+
+        Parameters
+        ----------
+        Y : ndarray, shape (n_timeseries, n_timepoints)
+            New training data, the previous one being its top left corner.
+
+        mask : ndarray, shape (n_timeseries, n_timepoints)
+            Observed elements of Y.
+
+        Returns
+        -------
+        """
+
+        N, T = Y.shape
+        if T > self.T:
+            self.X = np.hstack([self.X, self._predict_X(T - self.T)])
 
-        for _ in range(self.max_iter):
-            self._update_F(step=self.F_step)
-            self._update_X(step=self.X_step)
-            self._update_W(step=self.W_step)
+        if N > self.N:
+            F_new = np.empty((N - self.N, self.K))
+            regularization = self.lambda_f * np.eye(self.K)
+            for i in range(self.N, N):
+                X_observed = self.X * mask[i]
+                F_new[i - self.N] = np.linalg.solve(np.dot(X_observed, self.X.T) + regularization, np.dot(X_observed, Y[i]))
+            self.F = np.vstack([self.F, F_new])
 
 
     def predict(self, h):
@@ -551,9 +627,7 @@ class trmf:
         X_preds = np.zeros((self.K, h))
         X_adjusted = np.hstack([self.X, X_preds])
         for t in range(self.T, self.T + h):
-            for l in range(self.L):
-                lag = self.lags[l]
-                X_adjusted[:, t] += X_adjusted[:, t - lag] * self.W[:, l]
+            X_adjusted[:, t] = (X_adjusted[:, t - self._lags] * self.W).sum(axis=1)
         return X_adjusted[:, self.T:]
 
     def impute_missings(self):
@@ -589,12 +663,14 @@ class trmf:
 
         Returns
         -------
-        self : objects
-            Returns self.
+        change : float
+            Norm of the last step relative to the norm of matrix F.
         """
 
         for _ in range(n_iter):
-            self.F -= step * self._grad_F()
+            delta = step * self._grad_F()
+            self.F -= delta
+        return np.linalg.norm(delta) / max(np.linalg.norm(self.F), np.finfo(float).tiny)
 
 
     def _update_X(self, step, n_iter=1):
@@ -612,12 +688,14 @@ class trmf:
 
         Returns
         -------
-        self : objects
-            Returns self.
+        change : float
+            Norm of the last step relative to the norm of matrix X.
         """
 
         for _ in range(n_iter):
-            self.X -= step * self._grad_X()
+            delta = step * self._grad_X()
+            self.X -= delta
+        return np.linalg.norm(delta) / max(np.linalg.norm(self.X), np.finfo(float).tiny)
 
 
     def _update_W(self, step, n_iter=1):
@@ -635,12 +713,14 @@ class trmf:
 
         Returns
         -------
-        self : objects
-            Returns self.
+        change : float
+            Norm of the last step relative to the norm of matrix W.
         """
 
         for _ in range(n_iter):
-            self.W -= step * self._grad_W()
+            delta = step * self._grad_W()
+            self.W -= delta
+        return np.linalg.norm(delta) / max(np.linalg.norm(self.W), np.finfo(float).tiny)
 
 
     def _grad_F(self):
@@ -660,10 +740,40 @@ class trmf:
         return - 2 * np.dot((self.Y - np.dot(self.F, self.X)) * self.mask, self.X.T) + 2 * self.lambda_f * self.F
 
 
+    def _lag_residuals(self):
+        """Autoregressive residuals of every lag.
+
+        Evaluating, for all lags at once, the residuals X - W_l * X shifted by
+        the lag, zeroed on the first max(lags) timepoints.
+
+        Parameters
+        ----------
+
+        Returns
+        -------
+        z_1 : ndarray, shape (self.K, self.L, self.T)
+            Residuals of every lag.
+
+        W_l : ndarray, shape (self.K, self.L, 1)
+            Autoregressive coefficients broadcastable against the residuals.
+
+        X_lagged : ndarray, shape (self.K, self.L, self.T)
+            Matrix X shifted by every lag.
+        """
+
+        t = np.arange(self.T)
+        X_lagged = self.X[:, (t - self._lags[:, None]) % self.T]
+        W_l = self.W[:, :, None]
+        z_1 = self.X[:, None, :] - W_l * X_lagged
+        z_1[:, :, :self._lags.max()] = 0.
+        return z_1, W_l, X_lagged
+
+
     def _grad_X(self):
         """Gradient of matrix X.
 
-        Evaluating gradient of matrix X.
+        Evaluating gradient of matrix X, the temporal regularization terms of
+        all lags are evaluated together and summed.
 
         Parameters
         ----------
@@ -674,16 +784,13 @@ class trmf:
             Returns self.
         """
 
-        for l in range(self.L):
-            lag = self.lags[l]
-            W_l = self.W[:, l].repeat(self.T, axis=0).reshape(self.K, self.T)
-            X_l = self.X * W_l
-            z_1 = self.X - np.roll(X_l, lag, axis=1)
-            z_1[:, :max(self.lags)] = 0.
-            z_2 = - (np.roll(self.X, -lag, axis=1) - X_l) * W_l
-            z_2[:, -lag:] = 0.
+        z_1, W_l, _ = self._lag_residuals()
+        t = np.arange(self.T)
+        X_ahead = self.X[:, (t + self._lags[:, None]) % self.T]
+        z_2 = - (X_ahead - self.X[:, None, :] * W_l) * W_l
+        z_2[:, t >= self.T - self._lags[:, None]] = 0.
 
-        grad_T_x = z_1 + z_2
+        grad_T_x = (z_1 + z_2).sum(axis=1)
         return - 2 * np.dot(self.F.T, self.mask * (self.Y - np.dot(self.F, self.X))) + self.lambda_x * grad_T_x + self.eta * self.X
 
 
@@ -701,14 +808,7 @@ class trmf:
             Returns self.
         """
 
-        grad = np.zeros((self.K, self.L))
-        for l in range(self.L):
-            lag = self.lags[l]
-            W_l = self.W[:, l].repeat(self.T, axis=0).reshape(self.K, self.T)
-            X_l = self.X * W_l
-            z_1 = self.X - np.roll(X_l, lag, axis=1)
-            z_1[:, :max(self.lags)] = 0.
-            z_2 = - (z_1 * np.roll(self.X, lag, axis=1)).sum(axis=1)
-            grad[:, l] = z_2
+        z_1, _, X_lagged = self._lag_residuals()
+        grad = - (z_1 * X_lagged).sum(axis=2)
         return grad + self.W * 2 * self.lambda_w / self.lambda_x -\
                self.alpha * 2 * (1 - self.W.sum(axis=1)).repeat(self.L).reshape(self.W.shape)
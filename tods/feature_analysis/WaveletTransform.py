@@ -20,6 +20,7 @@ from scipy import sparse
 import logging
 import uuid
 from ..common.TODSBasePrimitives import TODSTransformerPrimitiveBase
+from .core.spectral import wavelet_level, windowed_wavelet_energies
 
 __all__ = ('WaveletTransformPrimitive',)
 
@@ -97,6 +98,16 @@ class Hyperparams(hyperparams.Hyperparams):
         semantic_types=['https://metadata.datadrivendiscovery.org/types/ControlParameter'],
         description="identification number.",
     )
+    window_size = hyperparams.Hyperparameter[int](
+        default=-1,
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/ControlParameter'],
+        description="Size of the sliding windows whose level energies are computed, -1 transforms each column at once.",
+    )
+    step_size = hyperparams.Hyperparameter[int](
+        default=1,
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/ControlParameter'],
+        description="Number of samples between the starts of two sliding windows, a time step gets the energies of the last window ending at or before it.",
+    )
 
 
 
@@ -163,7 +174,9 @@ Parameters
     axis: int
         Axis over which to compute the DWT. If not given, transforming along columns.
     window_size : int
-        The moving window size.
+        The moving window size. If positive, the energy of every decomposition level of the window of each time step is computed instead of the coefficients of the whole column.
+    step_size : int
+        Number of samples between the starts of two moving windows.
     level: int
         Decomposition level (must be > 0). If level is 0 (default) then it will be calculated using the maximum level.
 
@@ -181,6 +194,8 @@ Parameters
                             mode=self.hyperparams['mode'],
                             axis=self.hyperparams['axis'],
                             level=self.hyperparams['level'],
+                            window_size=self.hyperparams['window_size'],
+                            step_size=self.hyperparams['step_size'],
                             # id=self.hyperparams['id'],
                           )
 
@@ -212,7 +227,7 @@ Parameters
             if sparse.issparse(sk_output): # pragma: no cover
                 sk_output = sk_output.toarray()
             outputs = self._wrap_predictions(inputs, sk_output)
-            if len(outputs.columns) == len(self._input_column_names):
+            if len(outputs.columns) == len(self._input_column_names) and not self._is_windowed():
                 outputs.columns = self._input_column_names
             output_columns = [outputs]
         else: # pragma: no cover
@@ -370,9 +385,15 @@ Parameters
         outputs = container.DataFrame(predictions, generate_metadata=True)
         target_columns_metadata = self._copy_inputs_metadata(inputs.metadata, self._columns_to_produce, outputs.metadata,
                                                              self.hyperparams)
+        if self._is_windowed():
+            for column_name, column_metadata in zip(outputs.columns, target_columns_metadata):
+                column_metadata["name"] = str(column_name)
         outputs.metadata = self._update_predictions_metadata(inputs.metadata, outputs, target_columns_metadata)
         return outputs
 
+    def _is_windowed(self):
+        return self.hyperparams['window_size'] > 0 and self.hyperparams['inverse'] != 1
+
     @classmethod
     def _copy_inputs_metadata(cls, inputs_metadata: metadata_base.DataMetadata, input_indices: List[int],
                               outputs_metadata: metadata_base.DataMetadata, hyperparams): # pragma: no cover
@@ -427,12 +448,14 @@ class Wavelet:
 
     wt_info = dict()
 
-    def __init__(self, wavelet='db1', mode='symmetric', axis=-1, level=1, id=0):
+    def __init__(self, wavelet='db1', mode='symmetric', axis=-1, level=1, id=0, window_size=-1, step_size=1):
         self._wavelet = wavelet
         self._mode = mode
         self._axis = axis
         self._level = level
         self._id = id
+        self._window_size = window_size
+        self._step_size = step_size
         return
 
     def produce(self, data, inverse):
@@ -440,6 +463,9 @@ class Wavelet:
         if inverse == 1:
             output = self.inverse_transform_to_dataframe(coeffs=data)
 
+        elif self._window_size > 0:
+            output = self.transform_windowed_to_dataframe(data)
+
         else:
             output = self.transform_to_dataframe(data)
 
@@ -447,34 +473,39 @@ class Wavelet:
 
 
     def transform_to_dataframe(self, data):
+        """
+        [cA_n, cD_n, cD_n-1, …, cD1] of every column side by side, padded with NaN to the longest coefficients array
+        """
+        values = numpy.asarray(data.values)
+        level = wavelet_level(values.shape[0], self._wavelet, self._level)
 
-        # print(data)
-        coeffs_buf = pandas.DataFrame(columns=[])
-
-
-        for index, data_to_transform in data.iteritems():
-            # data_to_transform = data.squeeze(1)
-            # print(data_to_transform)
-            if self._level == None:
-                wavelet_dec_len = pywt.Wavelet(self._wavelet).dec_len
-                self._level = pywt.dwt_max_level(len(data_to_transform), wavelet_dec_len)
+        # all the columns in one decomposition along the time axis
+        coeffs = pywt.wavedec(data=values, wavelet=self._wavelet, level=level, axis=0)
 
-            coeffs = pywt.wavedec(data=data_to_transform, wavelet=self._wavelet, level=self._level)
-            coeffs_T = pandas.DataFrame(coeffs).T
-            coeffs_buf = pandas.concat([coeffs_buf, coeffs_T], axis=1)
-            # coeffs_T = ndarray(coeffs).T
-            # print(coeffs_T)
+        coeffs_buf = numpy.full((max(len(coeff) for coeff in coeffs), values.shape[1] * len(coeffs)), numpy.nan,
+                                dtype=coeffs[0].dtype)
+        for index, coeff in enumerate(coeffs):
+            coeffs_buf[:len(coeff), index::len(coeffs)] = coeff
 
-        # print(coeffs_buf)
+        return pandas.DataFrame(coeffs_buf, columns=numpy.tile(numpy.arange(len(coeffs)), values.shape[1]))
 
-        return coeffs_buf # coeffs_T
+    def transform_windowed_to_dataframe(self, data):
+        """
+        Energies of [cA_n, cD_n, cD_n-1, …, cD1] of the moving window of every time step,
+        in columns named 'column_name_wavelet_energy<k>'
+        """
+        level = wavelet_level(self._window_size, self._wavelet, self._level)
+        energies = [windowed_wavelet_energies(data[column].values, self._window_size, self._step_size,
+                                              wavelet=self._wavelet, mode=self._mode, level=level)
+                    for column in data.columns]
+        columns = [str(column) + "_wavelet_energy" + str(index) for column in data.columns for index in range(level + 1)]
+        return pandas.DataFrame(np.concatenate(energies, axis=1), columns=columns)
 
     def transform_to_single_dataframe(self, data): # pragma: no cover
 
         # print(data)
         data_to_transform = data.squeeze(1)
-        wavelet_dec_len = pywt.Wavelet(self._wavelet).dec_len
-        self._level = pywt.dwt_max_level(len(data_to_transform), wavelet_dec_len)
+        self._level = wavelet_level(len(data_to_transform), self._wavelet)
 
         coeffs = pywt.wavedec(data=data_to_transform, wavelet=self._wavelet, level=self._level)
 
@@ -503,7 +534,7 @@ class Wavelet:
         # print('level: ', self._level)
         # print(coeffs)
 
-        coeffs_list = [numpy.array(col[~pandas.isnull(col)]) for index, col in coeffs.iteritems()]
+        coeffs_list = [numpy.array(col[~pandas.isnull(col)]) for index, col in coeffs.items()]
         # print(coeffs_list)
         data = pywt.waverec(coeffs=coeffs_list, wavelet=self._wavelet)
 
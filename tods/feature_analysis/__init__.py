@@ -1,30 +1,39 @@
-from tods.feature_analysis.AutoCorrelation import AutoCorrelationPrimitive
-from tods.feature_analysis.BKFilter import BKFilterPrimitive
-from tods.feature_analysis.DiscreteCosineTransform import DiscreteCosineTransformPrimitive
-from tods.feature_analysis.FastFourierTransform import FastFourierTransformPrimitive
-from tods.feature_analysis.HPFilter import HPFilterPrimitive
-from tods.feature_analysis.NonNegativeMatrixFactorization import NonNegativeMatrixFactorizationPrimitive
-from tods.feature_analysis.SKTruncatedSVD import SKTruncatedSVDPrimitive
-from tods.feature_analysis.SpectralResidualTransform import SpectralResidualTransformPrimitive
-from tods.feature_analysis.StatisticalAbsEnergy import StatisticalAbsEnergyPrimitive
-from tods.feature_analysis.StatisticalAbsSum import StatisticalAbsSumPrimitive
-from tods.feature_analysis.StatisticalGmean import StatisticalGmeanPrimitive
-from tods.feature_analysis.StatisticalHmean import StatisticalHmeanPrimitive
-from tods.feature_analysis.StatisticalKurtosis import StatisticalKurtosisPrimitive
-from tods.feature_analysis.StatisticalMaximum import StatisticalMaximumPrimitive
-from tods.feature_analysis.StatisticalMean import StatisticalMeanPrimitive
-from tods.feature_analysis.StatisticalMeanAbs import StatisticalMeanAbsPrimitive
-from tods.feature_analysis.StatisticalMeanAbsTemporalDerivative import StatisticalMeanAbsTemporalDerivativePrimitive
-from tods.feature_analysis.StatisticalMeanTemporalDerivative import StatisticalMeanTemporalDerivativePrimitive
-from tods.feature_analysis.StatisticalMedian import StatisticalMedianPrimitive
-from tods.feature_analysis.StatisticalMedianAbsoluteDeviation import StatisticalMedianAbsoluteDeviationPrimitive
-from tods.feature_analysis.StatisticalMinimum import StatisticalMinimumPrimitive
-from tods.feature_analysis.StatisticalSkew import StatisticalSkewPrimitive
-from tods.feature_analysis.StatisticalStd import StatisticalStdPrimitive
-from tods.feature_analysis.StatisticalVar import StatisticalVarPrimitive
-from tods.feature_analysis.StatisticalVariation import StatisticalVariationPrimitive
-from tods.feature_analysis.StatisticalVecSum import StatisticalVecSumPrimitive
-from tods.feature_analysis.StatisticalWillisonAmplitude import StatisticalWillisonAmplitudePrimitive
-from tods.feature_analysis.StatisticalZeroCrossing import StatisticalZeroCrossingPrimitive
-from tods.feature_analysis.TRMF import TRMFPrimitive
-from tods.feature_analysis.WaveletTransform import WaveletTransformPrimitive
+from tods.common.lazy import lazy_attributes
+
+# The primitives are imported on first access, see tods.common.lazy
+_PRIMITIVES = {
+    'AutoCorrelationPrimitive': 'tods.feature_analysis.AutoCorrelation',
+    'BKFilterPrimitive': 'tods.feature_analysis.BKFilter',
+    'DiscreteCosineTransformPrimitive': 'tods.feature_analysis.DiscreteCosineTransform',
+    'FastFourierTransformPrimitive': 'tods.feature_analysis.FastFourierTransform',
+    'HPFilterPrimitive': 'tods.feature_analysis.HPFilter',
+    'NonNegativeMatrixFactorizationPrimitive': 'tods.feature_analysis.NonNegativeMatrixFactorization',
+    'SKTruncatedSVDPrimitive': 'tods.feature_analysis.SKTruncatedSVD',
+    'SpectralResidualTransformPrimitive': 'tods.feature_analysis.SpectralResidualTransform',
+    'StatisticalAbsEnergyPrimitive': 'tods.feature_analysis.StatisticalAbsEnergy',
+    'StatisticalAbsSumPrimitive': 'tods.feature_analysis.StatisticalAbsSum',
+    'StatisticalFeaturesPrimitive': 'tods.feature_analysis.StatisticalFeatures',
+    'StatisticalGmeanPrimitive': 'tods.feature_analysis.StatisticalGmean',
+    'StatisticalHmeanPrimitive': 'tods.feature_analysis.StatisticalHmean',
+    'StatisticalKurtosisPrimitive': 'tods.feature_analysis.StatisticalKurtosis',
+    'StatisticalMaximumPrimitive': 'tods.feature_analysis.StatisticalMaximum',
+    'StatisticalMeanPrimitive': 'tods.feature_analysis.StatisticalMean',
+    'StatisticalMeanAbsPrimitive': 'tods.feature_analysis.StatisticalMeanAbs',
+    'StatisticalMeanAbsTemporalDerivativePrimitive': 'tods.feature_analysis.StatisticalMeanAbsTemporalDerivative',
+    'StatisticalMeanTemporalDerivativePrimitive': 'tods.feature_analysis.StatisticalMeanTemporalDerivative',
+    'StatisticalMedianPrimitive': 'tods.feature_analysis.StatisticalMedian',
+    'StatisticalMedianAbsoluteDeviationPrimitive': 'tods.feature_analysis.StatisticalMedianAbsoluteDeviation',
+    'StatisticalMinimumPrimitive': 'tods.feature_analysis.StatisticalMinimum',
+    'StatisticalSkewPrimitive': 'tods.feature_analysis.StatisticalSkew',
+    'StatisticalStdPrimitive': 'tods.feature_analysis.StatisticalStd',
+    'StatisticalVarPrimitive': 'tods.feature_analysis.StatisticalVar',
+    'StatisticalVariationPrimitive': 'tods.feature_analysis.StatisticalVariation',
+    'StatisticalVecSumPrimitive': 'tods.feature_analysis.StatisticalVecSum',
+    'StatisticalWillisonAmplitudePrimitive': 'tods.feature_analysis.StatisticalWillisonAmplitude',
+    'StatisticalZeroCrossingPrimitive': 'tods.feature_analysis.StatisticalZeroCrossing',
+    'TRMFPrimitive': 'tods.feature_analysis.TRMF',
+    'WaveletTransformPrimitive': 'tods.feature_analysis.WaveletTransform',
+}
+
+__all__ = list(_PRIMITIVES)
+__getattr__, __dir__ = lazy_attributes(__name__, _PRIMITIVES)
@@ -0,0 +1,237 @@
+# -*- coding: utf-8 -*-
+"""Matrix profile shared by the feature analysis and detection MatrixProfile
+primitives.
+
+The multi-dimensional matrix profile of stumpy.mstump is kept up to date
+between calls: when a series is the previous one with rows appended, and
+possibly rows dropped from its start like a sliding window of the latest
+samples, only the distance profiles of the new subsequences, and of the
+subsequences whose nearest neighbor was dropped, are computed.
+
+The approximate matrix profile is an anytime SCRIMP-style variant of
+mstump: the diagonals of the distance matrix are visited in random order
+and the search stops after a fraction of them or a time budget.
+"""
+import time
+
+import numpy as np
+import stumpy
+
+
+def exclusion_zone(window_size):
+    """Half width of the trivial match exclusion zone of stumpy."""
+    return int(np.ceil(window_size / 4))
+
+
+def pad_profile(profile, n_samples):
+    """Repeat the last row of a profile of shape (n_subsequences, d) up to
+    ``n_samples`` rows.
+    """
+    blank = n_samples - profile.shape[0]
+    if blank <= 0:
+        return profile
+    return np.concatenate([profile, np.repeat(profile[-1:], blank, axis=0)])
+
+
+def _diagonal_distances(T, k, m, means, stds):
+    """z-normalized distances of shape (d, l - k) between the subsequences
+    starting at i and i + k of every dimension of T of shape (d, n).
+    """
+    products = np.zeros((T.shape[0], T.shape[1] - k + 1))
+    np.cumsum(T[:, :T.shape[1] - k] * T[:, k:], axis=1, out=products[:, 1:])
+    QT = products[:, m:] - products[:, :-m]
+
+    mu_Q, sigma_Q = means[:, :means.shape[1] - k], stds[:, :stds.shape[1] - k]
+    mu_T, sigma_T = means[:, k:], stds[:, k:]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rho = (QT / m - mu_Q * mu_T) / (sigma_Q * sigma_T)
+    D = np.sqrt(2 * m * (1 - np.clip(rho, -1, 1)))
+
+    # constant subsequences are equal to each other and at distance sqrt(m)
+    # of the others, like stumpy
+    constant_Q, constant_T = sigma_Q == 0, sigma_T == 0
+    D[constant_Q != constant_T] = np.sqrt(m)
+    D[constant_Q & constant_T] = 0
+    return D
+
+
+def approximate_matrix_profile(T, window_size, percentage=0.1, time_budget=None, random_state=None):
+    """Approximate multi-dimensional matrix profile.
+
+    The distances of the diagonals of the distance matrix are computed in
+    random order and lower the profiles of both of their subsequences, so
+    the profile converges to the one of stumpy.mstump, which it equals
+    when all the diagonals are visited.
+
+    Parameters
+    ----------
+    T : numpy array of shape (n_samples, d)
+        The series.
+
+    window_size : int
+        The subsequence length.
+
+    percentage : float
+        Fraction of the diagonals to visit.
+
+    time_budget : float or None
+        Stop after this many seconds even if ``percentage`` of the diagonals
+        were not visited. At least one diagonal is always visited.
+
+    random_state : int, RandomState instance or None
+        Seed of the order of the diagonals.
+
+    Returns
+    -------
+    P : numpy array of shape (d, n_samples - window_size + 1)
+        The matrix profile. Subsequences not reached by any visited diagonal
+        get the largest profile of their dimension and a -1 index.
+
+    I : numpy array of shape (d, n_samples - window_size + 1)
+        The indices of the nearest neighbors.
+    """
+    start = time.perf_counter()
+    T = np.array(T, dtype=np.float64)
+    if T.ndim == 1:
+        T = T[:, np.newaxis]
+    # centering keeps the sliding dot products of long series accurate
+    T = (T - T.mean(axis=0)).T
+    m = window_size
+    means, stds = stumpy.core.compute_mean_std(T, m)
+
+    d, n_profiles = T.shape[0], T.shape[1] - m + 1
+    P = np.full((d, n_profiles), np.inf)
+    I = np.full((d, n_profiles), -1, dtype=np.int64)
+    denominator = np.arange(1, d + 1)[:, np.newaxis]
+
+    diagonals = np.arange(exclusion_zone(m) + 1, n_profiles)
+    diagonals = np.random.RandomState(random_state).permutation(diagonals)
+    diagonals = diagonals[:max(int(np.ceil(percentage * len(diagonals))), 1)]
+    for count, k in enumerate(diagonals):
+        if count > 0 and time_budget is not None and time.perf_counter() - start > time_budget:
+            break
+        D = _diagonal_distances(T, k, m, means, stds)
+        D.sort(axis=0)
+        D = np.cumsum(D, axis=0) / denominator
+
+        length = n_profiles - k
+        closer = D < P[:, :length]
+        P[:, :length][closer] = D[closer]
+        I[:, :length][closer] = (np.nonzero(closer)[1] + k)
+        closer = D < P[:, k:]
+        P[:, k:][closer] = D[closer]
+        I[:, k:][closer] = np.nonzero(closer)[1]
+
+    unreached = np.isinf(P)
+    if unreached.any():
+        largest = np.max(np.where(unreached, -np.inf, P), axis=1, keepdims=True)
+        P = np.where(unreached, np.where(np.isinf(largest), 0., largest), P)
+    return P, I
+
+
+class IncrementalMatrixProfile:
+    """Multi-dimensional matrix profile of a series updated with its new rows.
+
+    Parameters
+    ----------
+    window_size : int
+        The subsequence length.
+
+    Attributes
+    ----------
+    P_ : numpy array of shape (d, n_samples - window_size + 1)
+        The matrix profile, row ``k`` being the (k + 1)-dimensional profile
+        like stumpy.mstump.
+
+    I_ : numpy array of shape (d, n_samples - window_size + 1)
+        The indices of the nearest neighbors.
+    """
+    def __init__(self, window_size):
+        self.window_size = window_size
+        self.P_ = None
+        self.I_ = None
+        self._T = None
+
+    def update(self, T):
+        """Matrix profile of a series, reusing the one of the previous call
+        when it overlaps with this series.
+
+        Parameters
+        ----------
+        T : numpy array of shape (n_samples, d)
+            The series.
+
+        Returns
+        -------
+        P : numpy array of shape (d, n_samples - window_size + 1)
+        """
+        T = np.array(T, dtype=np.float64)
+        if T.ndim == 1:
+            T = T[:, np.newaxis]
+
+        shift = self._find_shift(T)
+        if shift is None:
+            return self._compute(T)
+
+        n_profiles = T.shape[0] - self.window_size + 1
+        kept = self.P_.shape[1] - shift
+        stale = np.flatnonzero((self.I_[:, shift:] < shift).any(axis=0))
+        if n_profiles - kept + len(stale) > n_profiles // 8:
+            # A distance profile costs about as much as a few rows of mstump
+            return self._compute(T)
+
+        P = np.full((T.shape[1], n_profiles), np.inf)
+        I = np.full((T.shape[1], n_profiles), -1, dtype=np.int64)
+        P[:, :kept] = self.P_[:, shift:]
+        I[:, :kept] = self.I_[:, shift:] - shift
+
+        self._T = T
+        for index in range(kept, n_profiles):
+            self._update_profile(index, P, I)
+        for index in stale:
+            P[:, index] = np.inf
+            self._update_profile(index, P, I)
+
+        self.P_, self.I_ = P, I
+        return self.P_
+
+    def _compute(self, T):
+        self._T = T
+        self.P_, self.I_ = stumpy.mstump(T.T, m=self.window_size)
+        return self.P_
+
+    def _find_shift(self, T):
+        """Number of rows dropped from the start of the previous series if
+        ``T`` continues it, None otherwise.
+        """
+        previous = self._T
+        if previous is None or previous.shape[1] != T.shape[1]:
+            return None
+
+        for shift in np.flatnonzero((previous == T[0]).all(axis=1)):
+            overlap = previous.shape[0] - shift
+            if overlap < self.window_size or overlap > T.shape[0]:
+                continue
+            if np.array_equal(previous[shift:], T[:overlap]):
+                return shift
+        return None
+
+    def _update_profile(self, index, P, I):
+        """Set the profile of a subsequence from its distance profile and
+        lower the profiles of the other subsequences closer to it.
+        """
+        m = self.window_size
+        D = np.stack([stumpy.core.mass(self._T[index:index + m, k], self._T[:, k])
+                      for k in range(self._T.shape[1])])
+        D.sort(axis=0)
+        D = np.cumsum(D, axis=0) / np.arange(1, D.shape[0] + 1)[:, np.newaxis]
+        excl_zone = exclusion_zone(m)
+        D[:, max(index - excl_zone, 0):index + excl_zone + 1] = np.inf
+
+        nearest = np.argmin(D, axis=1)
+        P[:, index] = D[np.arange(D.shape[0]), nearest]
+        I[:, index] = nearest
+
+        closer = D < P
+        P[closer] = D[closer]
+        I[closer] = index
@@ -0,0 +1,280 @@
+# -*- coding: utf-8 -*-
+"""Vectorized rolling-window statistics shared by the Statistical* feature
+analysis primitives.
+
+Every statistic is evaluated over all windows of a column at once, either
+with a cumulative sum (sums and means over long windows) or with a reduction
+over a read-only strided window view processed in bounded-size chunks. The
+output follows the convention of the original per-window loops: position
+``i`` holds the statistic of ``values[i - window_size + 1: i + 1]`` and the
+first ``window_size - 1`` positions are back-filled with the first full
+window.
+"""
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import as_strided
+from scipy import stats
+
+# Number of window elements materialized at once by the chunked reducers.
+_CHUNK_SIZE = 1 << 22
+
+# Sums and means over windows at least this long use a cumulative sum when
+# the windows do not fit in one chunk; otherwise windows are reduced directly
+# so results match ``np.sum`` exactly.
+_CUMSUM_MIN_WINDOW = 1024
+
+
+def window_view(values, window_size):
+    """Read-only strided view of all windows of a 1-d array.
+
+    Parameters
+    ----------
+    values : numpy array of shape (n_samples,)
+        The input series.
+
+    window_size : int
+        The moving window size.
+
+    Returns
+    -------
+    windows : numpy array of shape (n_samples - window_size + 1, window_size)
+        A view sharing memory with ``values``; row ``i`` is
+        ``values[i: i + window_size]``.
+    """
+    values = np.asarray(values)
+    n_windows = values.shape[0] - window_size + 1
+    if n_windows <= 0:
+        return np.empty((0, window_size), dtype=values.dtype)
+    stride = values.strides[0]
+    return as_strided(values, shape=(n_windows, window_size),
+                      strides=(stride, stride), writeable=False)
+
+
+def _median_absolute_deviation(windows):
+    # ``median_absolute_deviation`` was replaced by ``median_abs_deviation``
+    # (with a different default scale) in newer scipy releases.
+    if hasattr(stats, 'median_absolute_deviation'):
+        return stats.median_absolute_deviation(windows, axis=1)
+    return stats.median_abs_deviation(windows, axis=1, scale=1.4826)
+
+
+def _willison_indicator(values, threshold=0):
+    diff = np.abs(np.diff(np.concatenate(([0.], values))))
+    return (diff > threshold).astype(np.float64)
+
+
+# name -> (function, shrinks the window by one sample)
+_SOURCES = {
+    'values': (lambda values, **kwargs: values, False),
+    'abs': (lambda values, **kwargs: np.abs(values), False),
+    'square': (lambda values, **kwargs: values * values, False),
+    'diff': (lambda values, **kwargs: np.diff(values), True),
+    'abs_diff': (lambda values, **kwargs: np.abs(np.diff(values)), True),
+    'willison': (lambda values, threshold=0, **kwargs: _willison_indicator(values, threshold), False),
+}
+
+# name -> reduction over the rows of a (n_windows, window_size) array
+_REDUCERS = {
+    'sum': lambda windows: np.sum(windows, axis=1),
+    'mean': lambda windows: np.mean(windows, axis=1),
+    'max': lambda windows: np.max(windows, axis=1),
+    'min': lambda windows: np.min(windows, axis=1),
+    'median': lambda windows: np.median(windows, axis=1),
+    'std': lambda windows: np.std(windows, axis=1),
+    'var': lambda windows: np.var(windows, axis=1),
+    'skew': lambda windows: stats.skew(windows, axis=1),
+    'kurtosis': lambda windows: stats.kurtosis(windows, axis=1),
+    'gmean': lambda windows: stats.gmean(windows, axis=1),
+    'hmean': lambda windows: stats.hmean(windows, axis=1),
+    'variation': lambda windows: stats.variation(windows, axis=1),
+    'mad': _median_absolute_deviation,
+}
+
+_CUMSUM_REDUCERS = ('sum', 'mean')
+
+# statistic -> (source, reducer, decimals to round to)
+_STATISTICS = OrderedDict([
+    ('mean', ('values', 'mean', None)),
+    ('vec_sum', ('values', 'sum', None)),
+    ('abs_sum', ('abs', 'sum', None)),
+    ('mean_abs', ('abs', 'mean', None)),
+    ('abs_energy', ('square', 'sum', 4)),
+    ('maximum', ('values', 'max', None)),
+    ('minimum', ('values', 'min', None)),
+    ('median', ('values', 'median', None)),
+    ('std', ('values', 'std', None)),
+    ('var', ('values', 'var', None)),
+    ('skew', ('values', 'skew', 4)),
+    ('kurtosis', ('values', 'kurtosis', 4)),
+    ('gmean', ('values', 'gmean', 4)),
+    ('hmean', ('values', 'hmean', 4)),
+    ('variation', ('values', 'variation', 4)),
+    ('median_absolute_deviation', ('values', 'mad', 4)),
+    ('mean_temporal_derivative', ('diff', 'mean', None)),
+    ('mean_abs_temporal_derivative', ('abs_diff', 'mean', None)),
+    ('willison_amplitude', ('willison', 'sum', None)),
+])
+
+
+def zero_crossing(values):
+    """Indicator of a sign change between each sample and its predecessor.
+
+    Parameters
+    ----------
+    values : numpy array of shape (n_samples,)
+        The input series.
+
+    Returns
+    -------
+    crossing : numpy array of shape (n_samples,)
+        1 where ``values[i] * values[i - 1] < 0``, else 0. The first sample
+        is always 0.
+    """
+    values = np.asarray(values)
+    crossing = np.zeros(len(values))
+    if len(values) > 1:
+        crossing[1:] = values[1:] * values[:-1] < 0.0
+    return crossing
+
+
+# statistic -> function of the whole series, not windowed
+_POINTWISE_STATISTICS = {
+    'zero_crossing': zero_crossing,
+}
+
+STATISTICS = tuple(_STATISTICS) + tuple(_POINTWISE_STATISTICS)
+
+
+def _cumsum_reduce(source, window_size, reducer):
+    cumsum = np.concatenate(([0.], np.cumsum(source, dtype=np.float64)))
+    sums = cumsum[window_size:] - cumsum[:-window_size]
+    if reducer == 'mean':
+        return sums / window_size
+    return sums
+
+
+def _rolling_reduce(source, window_size, reducers):
+    """Apply several reducers to every window of ``source`` in one pass."""
+    n_windows = len(source) - window_size + 1
+    results = [np.empty(max(n_windows, 0)) for _ in reducers]
+    if n_windows <= 0:
+        return results
+
+    use_cumsum = window_size >= _CUMSUM_MIN_WINDOW and n_windows * window_size > _CHUNK_SIZE
+    direct = []
+    for index, reducer in enumerate(reducers):
+        if use_cumsum and reducer in _CUMSUM_REDUCERS:
+            results[index][:] = _cumsum_reduce(source, window_size, reducer)
+        else:
+            direct.append(index)
+
+    if direct:
+        windows = window_view(source, window_size)
+        step = max(1, _CHUNK_SIZE // max(window_size, 1))
+        for start in range(0, n_windows, step):
+            chunk = windows[start:start + step]
+            for index in direct:
+                results[index][start:start + step] = _REDUCERS[reducers[index]](chunk)
+
+    return results
+
+
+def rolling_statistics(values, window_size, statistics, **kwargs):
+    """Compute several rolling statistics of a series.
+
+    Statistics reading the same transformed series (raw values, absolute
+    values, differences, ...) share a single pass over its windows.
+
+    Parameters
+    ----------
+    values : numpy array of shape (n_samples,)
+        The input series.
+
+    window_size : int
+        The moving window size, -1 uses the whole series as one window.
+
+    statistics : list of str
+        Names from ``STATISTICS``.
+
+    threshold : float, optional (default=0)
+        Threshold of ``willison_amplitude``.
+
+    Returns
+    -------
+    results : OrderedDict
+        Maps each statistic to a numpy array of shape (n_samples,).
+    """
+    values = np.asarray(values)
+    if window_size == -1:
+        window_size = len(values)
+
+    unknown = [statistic for statistic in statistics if statistic not in STATISTICS]
+    if unknown:
+        raise ValueError("Unknown statistics {}, expected a subset of {}.".format(unknown, STATISTICS))
+
+    by_source = OrderedDict()
+    for statistic in statistics:
+        if statistic in _STATISTICS:
+            by_source.setdefault(_STATISTICS[statistic][0], []).append(statistic)
+
+    computed = {}
+    for source_name, names in by_source.items():
+        source_function, shrinks = _SOURCES[source_name]
+        source_window = window_size - 1 if shrinks else window_size
+        reduced = _rolling_reduce(source_function(values, **kwargs), source_window,
+                                  [_STATISTICS[name][1] for name in names])
+        for name, window_values in zip(names, reduced):
+            decimals = _STATISTICS[name][2]
+            if decimals is not None:
+                window_values = np.round(window_values, decimals)
+            result = np.zeros(len(values))
+            result[window_size - 1:] = window_values
+            result[:window_size - 1] = result[window_size - 1]
+            computed[name] = result
+
+    results = OrderedDict()
+    for statistic in statistics:
+        if statistic in _POINTWISE_STATISTICS:
+            results[statistic] = _POINTWISE_STATISTICS[statistic](values)
+        else:
+            results[statistic] = computed[statistic]
+    return results
+
+
+def rolling_statistic(values, window_size, statistic, **kwargs):
+    """Compute one rolling statistic of a series, see ``rolling_statistics``.
+    """
+    return rolling_statistics(values, window_size, [statistic], **kwargs)[statistic]
+
+
+def rolling_statistics_frame(X, window_size, statistics, **kwargs):
+    """Compute rolling statistics of every column of a DataFrame.
+
+    Parameters
+    ----------
+    X : DataFrame
+        Time series, one column per series.
+
+    window_size : int
+        The moving window size, -1 uses the whole series as one window.
+
+    statistics : str or list of str
+        Names from ``STATISTICS``.
+
+    Returns
+    -------
+    DataFrame
+        One column ``<column>_<statistic>`` per input column and statistic.
+    """
+    if isinstance(statistics, str):
+        statistics = [statistics]
+
+    columns = OrderedDict()
+    for column in X.columns:
+        results = rolling_statistics(X[column].values, window_size, statistics, **kwargs)
+        for statistic, result in results.items():
+            columns[str(column) + "_" + statistic] = result
+
+    return pd.DataFrame(columns)
@@ -0,0 +1,188 @@
+# -*- coding: utf-8 -*-
+"""Short-time spectral features shared by the FFT, DCT and wavelet feature
+analysis primitives.
+
+The windows of a column are transformed in batches of a read-only strided
+window view, so the memory of the transforms stays bounded by the chunk
+size. Every window is summarized by a fixed number of band features and the
+output has one row per time step: position ``i`` holds the features of the
+last window ending at or before ``i`` and the first ``window_size - 1``
+positions are back-filled with the first window, like the rolling statistics.
+"""
+from functools import lru_cache
+
+import numpy as np
+import pywt
+from scipy.fft import rfft, dct
+
+from .rolling import window_view, _CHUNK_SIZE
+
+
+def band_edges(n_bins, n_bands):
+    """Start of each of ``n_bands`` contiguous bands over ``n_bins`` bins.
+
+    Parameters
+    ----------
+    n_bins : int
+        Number of bins of a spectrum.
+
+    n_bands : int
+        Number of bands, at most ``n_bins``.
+
+    Returns
+    -------
+    edges : numpy array of shape (n_bands,)
+    """
+    if n_bands < 1 or n_bands > n_bins:
+        raise ValueError("n_bands must be between 1 and the {} bins of a window, got {}.".format(n_bins, n_bands))
+    return np.linspace(0, n_bins, n_bands + 1).astype(np.int64)[:-1]
+
+
+def band_means(spectrum, n_bands):
+    """Mean of the bins of every band of each row of a spectrum.
+
+    Parameters
+    ----------
+    spectrum : numpy array of shape (n_windows, n_bins)
+
+    n_bands : int
+        Number of bands.
+
+    Returns
+    -------
+    bands : numpy array of shape (n_windows, n_bands)
+    """
+    edges = band_edges(spectrum.shape[1], n_bands)
+    sizes = np.diff(np.append(edges, spectrum.shape[1]))
+    return np.add.reduceat(spectrum, edges, axis=1) / sizes.astype(spectrum.dtype)
+
+
+def to_time_steps(features, n_samples, window_size, step_size=1):
+    """Repeat the features of windows starting every ``step_size`` samples
+    on the time steps they cover.
+
+    Parameters
+    ----------
+    features : numpy array of shape (n_windows, n_features)
+
+    n_samples : int
+        Length of the series.
+
+    window_size : int
+        The sliding window size.
+
+    step_size : int
+        Number of samples between the starts of two windows.
+
+    Returns
+    -------
+    features : numpy array of shape (n_samples, n_features)
+    """
+    last_window = np.maximum(np.arange(n_samples) - (window_size - 1), 0) // step_size
+    return features[last_window]
+
+
+def windowed_transform(values, window_size, step_size, transform, n_features, dtype='float64'):
+    """Apply a batched transform to the windows of a series.
+
+    Parameters
+    ----------
+    values : numpy array of shape (n_samples,)
+        The input series.
+
+    window_size : int
+        The sliding window size.
+
+    step_size : int
+        Number of samples between the starts of two windows.
+
+    transform : callable
+        Maps an array of windows of shape (n, window_size) to features of
+        shape (n, n_features).
+
+    n_features : int
+        Number of features of a window.
+
+    dtype : str
+        Floating point type of the windows and features.
+
+    Returns
+    -------
+    features : numpy array of shape (n_samples, n_features)
+    """
+    values = np.asarray(values, dtype=dtype)
+    if window_size < 1 or step_size < 1:
+        raise ValueError("window_size and step_size must be positive, got {} and {}.".format(window_size, step_size))
+    if window_size > values.shape[0]:
+        raise ValueError("window_size {} is larger than the {} samples of the series.".format(window_size, values.shape[0]))
+
+    windows = window_view(values, window_size)[::step_size]
+    features = np.empty((windows.shape[0], n_features), dtype=dtype)
+    chunk = max(1, _CHUNK_SIZE // window_size)
+    for start in range(0, windows.shape[0], chunk):
+        features[start:start + chunk] = transform(windows[start:start + chunk])
+
+    return to_time_steps(features, values.shape[0], window_size, step_size)
+
+
+def windowed_fft_bands(values, window_size, step_size=1, n_bands=8, norm=None, workers=None, dtype='float64'):
+    """Mean FFT magnitude of ``n_bands`` frequency bands of every window.
+
+    Returns
+    -------
+    features : numpy array of shape (n_samples, n_bands)
+    """
+    band_edges(window_size // 2 + 1, n_bands)
+
+    def transform(windows):
+        spectrum = np.abs(rfft(windows, axis=1, norm=norm, workers=workers))
+        return band_means(spectrum, n_bands)
+
+    return windowed_transform(values, window_size, step_size, transform, n_bands, dtype=dtype)
+
+
+def windowed_dct_bands(values, window_size, step_size=1, n_bands=8, type_=2, norm=None, workers=None, dtype='float64'):
+    """Mean absolute DCT coefficient of ``n_bands`` bands of every window.
+
+    Returns
+    -------
+    features : numpy array of shape (n_samples, n_bands)
+    """
+    band_edges(window_size, n_bands)
+
+    def transform(windows):
+        spectrum = np.abs(dct(windows, type=type_, axis=1, norm=norm, workers=workers))
+        return band_means(spectrum, n_bands)
+
+    return windowed_transform(values, window_size, step_size, transform, n_bands, dtype=dtype)
+
+
+@lru_cache(maxsize=None)
+def _max_wavelet_level(length, wavelet):
+    return pywt.dwt_max_level(length, pywt.Wavelet(wavelet).dec_len)
+
+
+def wavelet_level(length, wavelet, level=None):
+    """Decomposition level of a series of ``length`` samples, the maximum one
+    if ``level`` is None. The maximum level is cached per length and wavelet.
+    """
+    if level is None:
+        return _max_wavelet_level(length, wavelet)
+    return level
+
+
+def windowed_wavelet_energies(values, window_size, step_size=1, wavelet='db8', mode='symmetric', level=None, dtype='float64'):
+    """Energy of the approximation and of every detail level of the
+    multilevel DWT of every window, ordered as ``[cA_n, cD_n, ..., cD_1]``.
+
+    Returns
+    -------
+    features : numpy array of shape (n_samples, level + 1)
+    """
+    level = wavelet_level(window_size, wavelet, level)
+
+    def transform(windows):
+        coeffs = pywt.wavedec(windows, wavelet=wavelet, mode=mode, level=level, axis=1)
+        return np.stack([np.sum(coeff * coeff, axis=1) for coeff in coeffs], axis=1)
+
+    return windowed_transform(values, window_size, step_size, transform, level + 1, dtype=dtype)
@@ -21,7 +21,8 @@ from d3m.primitive_interfaces.base import CallResult, DockerContainer
 
 
 import os.path
-import re
+
+from .core.rule import compile_rules
 
 
 Inputs = container.DataFrame
@@ -33,7 +34,7 @@ class Hyperparams(hyperparams.Hyperparams):   # pragma: no cover
     rule = hyperparams.Hyperparameter[str](
         default='',
         semantic_types=['https://metadata.datadrivendiscovery.org/types/ControlParameter'],
-        description='The rule of filtering.'
+        description='The rule of filtering, several rules separated by ";" give one result column each.'
     )
 
     # Control
@@ -88,6 +89,8 @@ class RuleBasedFilter(transformer.TransformerPrimitiveBase[Inputs, Outputs, Hype
         The rule to follow when performing the filter. Write it like how we write 'if' in python. And wrap column index with two '#': #col_num#.
         e.g. "#1# > 10" means that the numbers in column 1 must be greater than 10.
         The indicies of columns should be same with those in 'use_columns'. 
+        Only numbers, arithmetic, comparisons, 'and', 'or' and 'not' are supported. Several rules separated by ';'
+        are evaluated in one pass and give one result column each.
     use_columns: Set
         A set of column indices to force primitive to operate on. If any specified column cannot be parsed, it is skipped.
         The indicies of columns should be same with those in 'rule'.
@@ -125,7 +128,7 @@ class RuleBasedFilter(transformer.TransformerPrimitiveBase[Inputs, Outputs, Hype
         self._input_column_names = self._training_inputs.columns
 
 
-        operated_col = [int(x.strip('#')) for x in re.findall(r'#\d*#', self.hyperparams['rule'])]
+        operated_col = compile_rules(self.hyperparams['rule']).columns
 
         
         if set(operated_col) != set(self._training_indices):
@@ -317,13 +320,9 @@ class RuleBasedFilter(transformer.TransformerPrimitiveBase[Inputs, Outputs, Hype
         Returns:
             Dataframe, results of Rule-Based Filter
         """
-        list_result = [0] * X.shape[0]
-
-        rule = re.sub(r'#\d*#', lambda x: 'row[' + x.group(0).strip('#') + ']', rule)
-        
-        for index, row in X.iterrows():
-            if not eval(rule):
-                list_result[index] = 1
-
-        return utils.pandas.DataFrame({'result': list_result})
+        rules = compile_rules(rule)
+        list_result = numpy.logical_not(rules(X)).astype(int)
 
+        if list_result.shape[1] == 1:
+            return utils.pandas.DataFrame({'result': list_result[:, 0]})
+        return utils.pandas.DataFrame(list_result, columns=['result_{}'.format(index) for index in range(list_result.shape[1])])
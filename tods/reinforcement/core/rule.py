@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""Vectorized evaluation of the rules of RuleBasedFilter.
+
+A rule is a Python boolean expression over columns written ``#N#`` for the
+column at position N, e.g. ``#4# % 2 == 0 and #2# <= 0.3``. It is parsed
+once into a tree of NumPy operations evaluated over whole columns, so all
+the rows are filtered in one pass. Only numeric constants, arithmetic,
+comparisons, ``and``, ``or`` and ``not`` are accepted, anything else is
+rejected when the rule is compiled.
+
+Several rules separated by ``;`` are compiled together and their common
+subexpressions are evaluated once.
+"""
+import ast
+import re
+from functools import lru_cache, reduce
+
+import numpy as np
+
+_COLUMN = re.compile(r'#(\d+)#')
+_COLUMN_NAME = '_column_{}'
+
+_BINARY_OPERATORS = {
+    ast.Add: np.add,
+    ast.Sub: np.subtract,
+    ast.Mult: np.multiply,
+    ast.Div: np.true_divide,
+    ast.FloorDiv: np.floor_divide,
+    ast.Mod: np.mod,
+    ast.Pow: np.float_power,
+}
+
+_COMPARISONS = {
+    ast.Eq: np.equal,
+    ast.NotEq: np.not_equal,
+    ast.Lt: np.less,
+    ast.LtE: np.less_equal,
+    ast.Gt: np.greater,
+    ast.GtE: np.greater_equal,
+}
+
+
+def _truth(value):
+    """Truth value of every element like bool() of a Python scalar."""
+    return np.asarray(value).astype(bool)
+
+
+def _literal(node):
+    """Value of a numeric or boolean literal node, None for other nodes."""
+    if isinstance(node, ast.Constant):
+        value = node.value
+    elif type(node).__name__ == 'Num':  # Python 3.7
+        value = node.n
+    elif type(node).__name__ == 'NameConstant':  # Python 3.7
+        value = node.value
+    else:
+        return None
+    return value if type(value) in (int, float, bool) else None
+
+
+def _logical_not(value):
+    return np.logical_not(_truth(value))
+
+
+_UNARY_OPERATORS = {
+    ast.USub: np.negative,
+    ast.UAdd: np.positive,
+    ast.Not: _logical_not,
+}
+
+
+class Rules:
+    """Rules compiled into NumPy operations over columns.
+
+    Parameters
+    ----------
+    rules : str
+        One rule or several rules separated by ``;``.
+
+    Attributes
+    ----------
+    rules : list of str
+        The rules.
+
+    columns : list of int
+        Sorted positions of the columns the rules refer to.
+    """
+    def __init__(self, rules):
+        self.rules = [rule.strip() for rule in rules.split(';') if rule.strip()]
+        if len(self.rules) == 0:
+            raise ValueError("No rule to compile in {!r}.".format(rules))
+
+        self.columns = sorted({int(index) for index in _COLUMN.findall(rules)})
+        self._names = {_COLUMN_NAME.format(index): index for index in self.columns}
+        self._trees = [self._compile(self._parse(rule)) for rule in self.rules]
+
+    def __call__(self, X):
+        """Evaluate the rules on every row of X.
+
+        Parameters
+        ----------
+        X : DataFrame or numpy array of shape (n_samples, n_columns)
+
+        Returns
+        -------
+        results : numpy array of bool of shape (n_samples, n_rules)
+        """
+        if hasattr(X, 'iloc'):
+            columns = {index: X.iloc[:, index].to_numpy() for index in self.columns}
+        else:
+            X = np.asarray(X)
+            columns = {index: X[:, index] for index in self.columns}
+
+        memo = {}
+        results = np.empty((X.shape[0], len(self._trees)), dtype=bool)
+        with np.errstate(all='ignore'):
+            for position, tree in enumerate(self._trees):
+                results[:, position] = _truth(tree(columns, memo))
+        return results
+
+    def _parse(self, rule):
+        expression = _COLUMN.sub(lambda match: _COLUMN_NAME.format(int(match.group(1))), rule)
+        try:
+            return ast.parse(expression, mode='eval').body
+        except SyntaxError as error:
+            raise ValueError("Invalid rule {!r}: {}".format(rule, error.msg)) from None
+
+    def _compile(self, node):
+        """Function of the columns and of the memo of the evaluated
+        subexpressions computing a node.
+        """
+        value = _literal(node)
+        if value is not None:
+            evaluate = lambda columns, memo: value
+        elif isinstance(node, ast.Name) and node.id in self._names:
+            index = self._names[node.id]
+            evaluate = lambda columns, memo: columns[index]
+        elif isinstance(node, ast.BoolOp):
+            combine = np.logical_and if isinstance(node.op, ast.And) else np.logical_or
+            operands = [self._compile(value) for value in node.values]
+            evaluate = lambda columns, memo: reduce(combine, (_truth(operand(columns, memo)) for operand in operands))
+        elif isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPERATORS:
+            function, operand = _UNARY_OPERATORS[type(node.op)], self._compile(node.operand)
+            evaluate = lambda columns, memo: function(operand(columns, memo))
+        elif isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+            function = _BINARY_OPERATORS[type(node.op)]
+            left, right = self._compile(node.left), self._compile(node.right)
+            evaluate = lambda columns, memo: function(left(columns, memo), right(columns, memo))
+        elif isinstance(node, ast.Compare) and all(type(op) in _COMPARISONS for op in node.ops):
+            # a < b < c is a < b and b < c
+            operands = [self._compile(operand) for operand in [node.left] + node.comparators]
+            functions = [_COMPARISONS[type(op)] for op in node.ops]
+
+            def evaluate(columns, memo):
+                values = [operand(columns, memo) for operand in operands]
+                return reduce(np.logical_and, (function(values[position], values[position + 1])
+                                               for position, function in enumerate(functions)))
+        else:
+            raise ValueError("Unsupported syntax in rule: {}.".format(ast.dump(node)))
+
+        key = ast.dump(node)
+
+        def memoized(columns, memo):
+            if key not in memo:
+                memo[key] = evaluate(columns, memo)
+            return memo[key]
+
+        return memoized
+
+
+@lru_cache(maxsize=128)
+def compile_rules(rules):
+    """Compiled rules, cached per rule string across calls."""
+    return Rules(rules)
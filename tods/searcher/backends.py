@@ -0,0 +1,154 @@
+# Execution of search trials without Ray
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+
+def grid_search(values):
+    """
+    Grid search specification in the format of ``ray.tune.grid_search``
+
+    Parameters
+    ----------
+    values: list
+        The values to search
+
+    Returns
+    -------
+    dict
+    """
+    return {'grid_search': list(values)}
+
+
+def resolve_grid_search(search_space):
+    """
+    List all the configs of a search space whose values may contain
+    ``grid_search`` specifications at any depth, like Ray Tune does.
+
+    Parameters
+    ----------
+    search_space: dict
+        A search space of the searcher
+
+    Returns
+    -------
+    configs: list of dict
+    """
+    if isinstance(search_space, dict):
+        if list(search_space.keys()) == ['grid_search']:
+            return list(itertools.chain.from_iterable(resolve_grid_search(value)
+                                                      for value in search_space['grid_search']))
+        keys = list(search_space.keys())
+        values = [resolve_grid_search(search_space[key]) for key in keys]
+        return [dict(zip(keys, combination)) for combination in itertools.product(*values)]
+
+    if isinstance(search_space, list):
+        values = [resolve_grid_search(item) for item in search_space]
+        return [list(combination) for combination in itertools.product(*values)]
+
+    return [search_space]
+
+
+class TrialAnalysis():
+    """
+    Results of the trials run by a process pool, with the methods of the
+    Ray Tune analysis used by the searcher.
+
+    Parameters
+    ----------
+    configs: list of dict
+        The config of each trial
+    results: list of dict
+        The metrics reported by each trial
+    """
+    def __init__(self, configs, results):
+        self.configs = configs
+        self.results = results
+
+    def dataframe(self, metric=None, mode=None):
+        """
+        One row per trial with the reported metrics and a ``config/<key>`` column per config key
+        """
+        rows = []
+        for config, result in zip(self.configs, self.results):
+            row = dict(result)
+            for key, value in config.items():
+                row['config/' + str(key)] = value
+            rows.append(row)
+        return pd.DataFrame(rows)
+
+    def get_best_config(self, metric, mode):
+        """
+        Config of the trial with the minimum or maximum ``metric``
+        """
+        scores = [result[metric] for result in self.results]
+        if mode == 'min':
+            best = min(range(len(scores)), key=scores.__getitem__)
+        else:
+            best = max(range(len(scores)), key=scores.__getitem__)
+        return self.configs[best]
+
+
+_worker_searcher = None
+_worker_kwargs = {}
+
+
+def _init_worker(searcher, evaluate_kwargs):
+    global _worker_searcher, _worker_kwargs
+    _worker_searcher = searcher
+    _worker_kwargs = evaluate_kwargs
+
+
+def _run_trial(config):
+    return _worker_searcher._evaluate_config(config, **_worker_kwargs)
+
+
+def evaluate_in_process_pool(searcher, configs, num_workers=None, **evaluate_kwargs):
+    """
+    Evaluate configs on a pool of processes.
+    The searcher and the keyword arguments, including datasets, are sent once
+    to every worker instead of once per trial.
+
+    Parameters
+    ----------
+    searcher: RaySearcher
+    configs: list of dict
+        The configs to evaluate
+    num_workers: int
+        Number of worker processes, defaults to the number of CPU cores
+    evaluate_kwargs:
+        Keyword arguments of ``searcher._evaluate_config``
+
+    Returns
+    -------
+    outcomes: list of tuple
+        (metrics, fitted_pipeline_id, pipeline) of each config
+    """
+    with ProcessPoolExecutor(max_workers=num_workers, initializer=_init_worker,
+                             initargs=(searcher, evaluate_kwargs)) as executor:
+        return list(executor.map(_run_trial, configs))
+
+
+def run_in_process_pool(searcher, search_space, num_samples=1, num_workers=None):
+    """
+    Run the trials of a grid search space on a pool of processes.
+
+    Parameters
+    ----------
+    searcher: RaySearcher
+    search_space: dict
+        A search space of the searcher
+    num_samples: int
+        Number of times each config of the grid is evaluated
+    num_workers: int
+        Number of worker processes, defaults to the number of CPU cores
+
+    Returns
+    -------
+    trials: list of tuple
+        (config, metrics, fitted_pipeline_id, pipeline) of each trial, in grid order
+    """
+    configs = resolve_grid_search(search_space) * num_samples
+    outcomes = evaluate_in_process_pool(searcher, configs, num_workers=num_workers)
+    return [(config,) + tuple(outcome) for config, outcome in zip(configs, outcomes)]
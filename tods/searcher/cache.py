@@ -0,0 +1,342 @@
+# Content-addressed cache of pipeline step outputs shared by the trials of a search
+import os
+import sys
+import json
+import pickle
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+
+import pandas as pd
+
+from tods.utils import get_primitive_list, get_primitives_hyperparam_list
+
+# Steps added by build_pipeline before the searched modules
+PREPROCESSING_STEPS = [
+    ('data_processing.dataset_to_dataframe', None),
+    ('data_processing.column_parser', None),
+    ('data_processing.extract_columns_by_semantic_types',
+     {'semantic_types': ['https://metadata.datadrivendiscovery.org/types/Attribute']}),
+]
+
+# Modules whose steps only depend on the steps before them, in pipeline order
+CACHED_MODULES = ['timeseries_processing', 'feature_analysis']
+
+
+def dataset_fingerprint(dataframe):
+    """
+    Hash the content of a dataset
+
+    Parameters
+    ----------
+    dataframe: pandas.DataFrame
+        The raw data the dataset was generated from
+
+    Returns
+    -------
+    fingerprint: str
+    """
+    hashed = pd.util.hash_pandas_object(dataframe, index=True).values
+    digest = hashlib.sha1(hashed.tobytes())
+    digest.update(json.dumps([str(column) for column in dataframe.columns]).encode())
+    return digest.hexdigest()
+
+
+def step_key(upstream_key, primitive_path, hyperparams=None):
+    """
+    Key of the output of a step
+
+    Parameters
+    ----------
+    upstream_key: str
+        Key of the step input, the dataset fingerprint for the first step
+    primitive_path: str
+        A Python path under ``d3m.primitives.tods`` namespace of a primitive.
+    hyperparams: dict
+        The hyperparams given to the primitive
+
+    Returns
+    -------
+    key: str
+    """
+    content = json.dumps([upstream_key, primitive_path, hyperparams or {}], sort_keys=True, default=str)
+    return hashlib.sha1(content.encode()).hexdigest()
+
+
+def _nbytes(value):
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    return sys.getsizeof(value)
+
+
+class StepCache():
+    """
+    LRU cache of step outputs with a memory budget, backed by a directory
+    shared by all the processes of a search when ``cache_dir`` is set.
+
+    Every output put in the cache is written to ``cache_dir`` under its
+    content key, through a temporary file renamed in place, so the workers
+    of a search read the outputs computed by the others and never see a
+    partially written file. A key missing from memory is looked up by the
+    existence of its file. The least recently used files are removed beyond
+    ``disk_limit``, whichever process wrote them.
+
+    Parameters
+    ----------
+    memory_limit: int
+        Maximum number of bytes of step outputs kept in the memory of each process.
+    cache_dir: str
+        Directory of the step outputs shared by the processes, None keeps
+        outputs in the memory of the process only.
+    disk_limit: int
+        Maximum number of bytes of step outputs kept in ``cache_dir``.
+    """
+    def __init__(self, memory_limit=1 << 30, cache_dir=None, disk_limit=1 << 32):
+        self.memory_limit = memory_limit
+        self.cache_dir = cache_dir
+        self.disk_limit = disk_limit
+
+        self._memory = OrderedDict()
+        self._memory_size = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if self.cache_dir is not None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+
+    def __getstate__(self):
+        # Workers of a search receive a copy of the cache without its lock
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def __contains__(self, key):
+        return key in self._memory or (self.cache_dir is not None and os.path.exists(self._path(key)))
+
+    def __len__(self):
+        if self.cache_dir is None:
+            return len(self._memory)
+        return len(set(self._memory) | set(key for key, _, _ in self._disk_entries()))
+
+    def get(self, key):
+        """
+        Return the cached output of a step and mark it as recently used,
+        None if it is not cached.
+        """
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return self._memory[key][0]
+
+            value = self._read(key)
+            if value is not None:
+                self._insert(key, value, _nbytes(value))
+                self.hits += 1
+                return value
+
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        """
+        Cache the output of a step, evicting the least recently used outputs
+        beyond the budgets.
+        """
+        with self._lock:
+            if key in self._memory:
+                self._memory_size -= self._memory.pop(key)[1]
+            self._insert(key, value, _nbytes(value))
+            if self.cache_dir is not None:
+                self._write(key, value)
+                self._evict_from_disk()
+
+    def clear(self):
+        """
+        Remove all the cached outputs, including the files of ``cache_dir``,
+        and reset the statistics.
+        """
+        with self._lock:
+            for key, _, _ in self._disk_entries():
+                self._remove_from_disk(key)
+            self._memory.clear()
+            self._memory_size = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def stats(self):
+        """
+        Returns
+        -------
+        stats: dict
+            Hits, misses, hit rate, evictions and the size of each tier.
+        """
+        requests = self.hits + self.misses
+        disk_entries = self._disk_entries()
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / requests if requests else 0.,
+            'evictions': self.evictions,
+            'memory_entries': len(self._memory),
+            'memory_bytes': self._memory_size,
+            'disk_entries': len(disk_entries),
+            'disk_bytes': sum(size for _, size, _ in disk_entries),
+        }
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key + '.pkl')
+
+    def _insert(self, key, value, size):
+        self._memory[key] = (value, size)
+        self._memory_size += size
+        while self._memory_size > self.memory_limit and len(self._memory) > 1:
+            _, (_, evicted_size) = self._memory.popitem(last=False)
+            self._memory_size -= evicted_size
+            # Outputs stay available in cache_dir
+            if self.cache_dir is None:
+                self.evictions += 1
+
+    def _read(self, key):
+        if self.cache_dir is None:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+            # The access time orders the files for eviction
+            os.utime(path)
+        except FileNotFoundError:
+            # Not computed yet, or removed by another process
+            return None
+        return value
+
+    def _write(self, key, value):
+        descriptor, temporary_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(descriptor, 'wb') as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_path, self._path(key))
+        except BaseException:
+            os.remove(temporary_path)
+            raise
+
+    def _disk_entries(self):
+        """
+        (key, size, modification time) of the outputs in ``cache_dir``, least recently used first
+        """
+        if self.cache_dir is None:
+            return []
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith('.pkl'):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.cache_dir, name))
+            except FileNotFoundError:
+                continue
+            entries.append((name[:-len('.pkl')], stat.st_size, stat.st_mtime))
+        return sorted(entries, key=lambda entry: entry[2])
+
+    def _evict_from_disk(self):
+        entries = self._disk_entries()
+        disk_size = sum(size for _, size, _ in entries)
+        for key, size, _ in entries:
+            if disk_size <= self.disk_limit:
+                break
+            self._remove_from_disk(key)
+            disk_size -= size
+            self.evictions += 1
+
+    def _remove_from_disk(self, key):
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+
+def run_step(primitive_path, inputs, hyperparams=None, random_seed=0):
+    """
+    Fit a primitive on its input and produce on the same input,
+    as the runtime does when fitting a pipeline.
+
+    Parameters
+    ----------
+    primitive_path: str
+        A Python path under ``d3m.primitives.tods`` namespace of a primitive.
+    inputs:
+        The step input
+    hyperparams: dict
+        The hyperparams given to the primitive, in the format of ``build_step``
+    random_seed: int
+
+    Returns
+    -------
+    outputs:
+        The output of the produce method
+    """
+    from d3m import index
+    from d3m.primitive_interfaces.transformer import TransformerPrimitiveBase
+
+    primitive_class = index.get_primitive('d3m.primitives.tods.' + primitive_path)
+    hyperparams_class = primitive_class.metadata.get_hyperparams()
+    values = {}
+    for name, value in (hyperparams or {}).items():
+        values[name] = hyperparams_class.configuration[name].value_from_json_structure(value)
+    primitive = primitive_class(hyperparams=hyperparams_class.defaults().replace(values), random_seed=random_seed)
+
+    if not isinstance(primitive, TransformerPrimitiveBase):
+        primitive.set_training_data(inputs=inputs)
+        primitive.fit()
+    return primitive.produce(inputs=inputs).value
+
+
+def produce_with_cache(dataset, config, cache, fingerprint, random_seed=0):
+    """
+    Compute the detection output of the pipeline ``build_pipeline(config)``
+    on its training data, reading and filling the cache for every step before
+    the detection algorithm.
+
+    Parameters
+    ----------
+    dataset: Dataset
+        The dataset the pipeline is fitted on
+    config: dict
+        A config of ``build_pipeline``
+    cache: StepCache
+    fingerprint: str
+        ``dataset_fingerprint`` of the dataset
+    random_seed: int
+
+    Returns
+    -------
+    outputs:
+        The output of the detection algorithm step
+    """
+    key = fingerprint
+    outputs = dataset
+    steps = list(PREPROCESSING_STEPS)
+    for module in CACHED_MODULES:
+        steps.extend(('{}.{}'.format(module, primitive), hyperparams) for primitive, hyperparams in
+                     zip(get_primitive_list(config, module), get_primitives_hyperparam_list(config, module)))
+
+    for primitive_path, hyperparams in steps:
+        key = step_key(key, primitive_path, hyperparams)
+        cached = cache.get(key)
+        if cached is None:
+            cached = run_step(primitive_path, outputs, hyperparams, random_seed)
+            cache.put(key, cached)
+        outputs = cached
+
+    detection_algorithm = get_primitive_list(config, 'detection_algorithm')[0]
+    detection_hyperparams = get_primitives_hyperparam_list(config, 'detection_algorithm')[0]
+    return run_step('detection_algorithm.' + detection_algorithm, outputs, detection_hyperparams, random_seed)
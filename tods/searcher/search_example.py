@@ -25,6 +25,9 @@ def argsparser():
     parser.add_argument('--ignore_hyperparameters', help = 'if you want to ignore hyperparmeter when reading search space from json', type = bool, default = True)
 
     parser.add_argument('--run_mode', help = 'mode of tune.run', type = str, default = 'min', choices = ['min', 'max'])
+    parser.add_argument('--backend', help = 'execution backend of the trials', type = str, default = None, choices = ['ray', 'process'])
+    parser.add_argument('--num_workers', help = 'number of trials run at the same time', type = int, default = None)
+    parser.add_argument('--search_mode', help = 'evaluate every config on the whole data, or use successive halving over data fractions', type = str, default = 'grid', choices = ['grid', 'successive_halving'])
 
     return parser
 
@@ -37,7 +40,8 @@ def run(args):
     dataframe=pd.read_csv(args.data_dir)
     
     # initialize the searcher
-    searcher = RaySearcher(dataframe,args.target_index,dataset, args.metric,args.beta)
+    searcher = RaySearcher(dataframe,args.target_index,dataset, args.metric,args.beta,
+                           backend=args.backend, num_workers=args.num_workers)
 
     # get the ray searcher config
     config = {
@@ -46,7 +50,8 @@ def run(args):
     "num_samples": args.num_samples,
     "mode": args.run_mode,
     "use_all_combinations": args.use_all_combinations,
-    "ignore_hyperparameters": args.ignore_hyperparameters
+    "ignore_hyperparameters": args.ignore_hyperparameters,
+    "search_mode": args.search_mode
     }
 
     import time
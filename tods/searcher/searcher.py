@@ -1,7 +1,13 @@
-from ray import tune
-import ray
+try:
+  from ray import tune
+  import ray
+except ImportError: # pragma: no cover
+  ray = None
 import uuid
+import time
 import random
+import shutil
+import tempfile
 from d3m.metadata.pipeline import Pipeline
 from axolotl.algorithms.base import PipelineSearchBase
 from axolotl.utils import  schemas as schemas_utils
@@ -23,8 +29,10 @@ import json
 from sklearn.metrics import precision_recall_curve,fbeta_score
 from tods.data_processing import DatasetToDataframe
 from tods.utils import build_pipeline
+from tods.searcher.cache import StepCache, dataset_fingerprint, produce_with_cache
+from tods.searcher.backends import grid_search, resolve_grid_search, run_in_process_pool, evaluate_in_process_pool, TrialAnalysis
+from tods.searcher.successive_halving import halving_fractions, slice_length, promote, estimate_exhaustive_cpu_time
 
-@ray.remote
 class GlobalStats:
 
   def __init__(self):
@@ -52,17 +60,53 @@ class GlobalStats:
 
 
 
+def _ray_trainable(search_space, searcher=None):
+  # The searcher is put in the object store once by tune.with_parameters
+  yield from searcher._evaluate(search_space)
+
+
+def _evaluate_remote(searcher, search_space, evaluate_kwargs):
+  return searcher._evaluate_config(search_space, **evaluate_kwargs)
+
+
 class RaySearcher():
   """
   A class to tune scalable hypermeters by Ray Tune
+
+  Parameters
+  ----------
+  backend: str
+    ``ray`` runs the trials on Ray workers, ``process`` on a ``concurrent.futures`` process pool.
+    Defaults to ``ray`` when Ray is installed.
+  num_workers: int
+    Number of trials run at the same time, defaults to the number of CPU cores.
+  resources_per_trial: dict
+    Ray resources of each trial, defaults to ``{"cpu": 1}``.
+  local_mode: bool
+    Run the Ray trials one by one in the searcher process, for debugging.
   """
-  def __init__(self,dataframe,target_index,dataset, metric, beta):
-    ray.init(local_mode=True, ignore_reinit_error=True)
+  def __init__(self,dataframe,target_index,dataset, metric, beta, backend=None, num_workers=None, resources_per_trial=None, local_mode=False):
+    if backend is None:
+      backend = 'process' if ray is None else 'ray'
+    if backend not in ('ray', 'process'):
+      raise ValueError('The backend {} not supported.'.format(backend))
+    if backend == 'ray' and ray is None: # pragma: no cover
+      raise ImportError('The ray backend requires ray to be installed.')
+
+    self.backend = backend
+    self.num_workers = num_workers
+    self.resources_per_trial = resources_per_trial if resources_per_trial is not None else {"cpu": 1}
+    if self.backend == 'ray':
+      ray.init(local_mode=local_mode, num_cpus=num_workers, ignore_reinit_error=True)
+      self.stats = ray.remote(GlobalStats).remote()
+    else:
+      self.stats = GlobalStats()
     self.dataframe = dataframe
     self.metric = metric
     self.beta = beta
-    self.stats = GlobalStats.remote()
     self.dataset = dataset
+    self.target_index = target_index
+    self.cache = None
     # self.dataset = generate_dataset(self.dataframe,target_index)
 
 
@@ -85,6 +129,20 @@ class RaySearcher():
         - ``use_all_combinations`` : Boolean. If True, use exhaustive search all the primitive combination with default hyperparams. If False, use simple search space.
         - ``ignore_hyperparameters`` : Boolean.  If False, search hyperparam combinations of the output of the primitive search process.
 
+        Optional arguments of the step output cache:
+
+        - ``use_cache`` : Boolean. If True, the outputs of the steps before the detection algorithm are computed once per search and shared by the trials with the same prefix. Only the best pipeline is fitted with the runtime and saved. Defaults to False.
+        - ``cache_memory_limit`` : Maximum number of bytes of step outputs kept in memory. Defaults to 1GB.
+        - ``cache_dir`` : Directory of the step outputs, read and written by all the trials. Must be on a filesystem shared by the nodes of a multi-node Ray cluster. Defaults to a temporary directory removed at the end of the search.
+        - ``cache_disk_limit`` : Maximum number of bytes of step outputs kept in ``cache_dir``. Defaults to 4GB.
+
+        Optional arguments of the successive halving search:
+
+        - ``search_mode`` : ``grid`` (default) evaluates every config on the whole dataset. ``successive_halving`` first scores all the configs on the leading ``min_fraction`` of the rows, and only promotes the best ``1 / reduction_factor`` of them to ``reduction_factor`` times more rows, until the whole dataset.
+        - ``min_fraction`` : Fraction of the rows used by the first rung. Defaults to 1/9.
+        - ``reduction_factor`` : Defaults to 3.
+        - ``min_samples`` : Minimum number of rows of a rung. Defaults to 10.
+
     .. code-block:: python
 
         #define search process
@@ -104,20 +162,36 @@ class RaySearcher():
 
     primitive_search_space = self.json_to_primitive_searchspace(search_space, is_exhaustive=config["use_all_combinations"])
 
-    # set the number of CPU cores
-    import multiprocessing
-    num_cores =  multiprocessing.cpu_count()
+    temporary_cache_dir = None
+    if config.get("use_cache", False):
+      cache_dir = config.get("cache_dir", None)
+      if cache_dir is None:
+        # The trials run in worker processes with their own copy of the cache,
+        # they share the step outputs through its directory
+        cache_dir = temporary_cache_dir = tempfile.mkdtemp(prefix='tods_step_cache_')
+      self.cache = StepCache(memory_limit=config.get("cache_memory_limit", 1 << 30),
+                             cache_dir=cache_dir,
+                             disk_limit=config.get("cache_disk_limit", 1 << 32))
+      self.fingerprint = dataset_fingerprint(self.dataframe)
+    else:
+      self.cache = None
+
+    try:
+      return self._search(search_space, primitive_search_space, config)
+    finally:
+      if temporary_cache_dir is not None:
+        shutil.rmtree(temporary_cache_dir, ignore_errors=True)
+
+
+  def _search(self, search_space, primitive_search_space, config):
+    """
+    Run the primitive search and the hyperparam search of ``search``
+    """
+    if config.get("search_mode", "grid") == "successive_halving":
+      return self._successive_halving_search(search_space, primitive_search_space, config)
 
     # Launch searcher
-    primitive_analysis = ray.tune.run(
-      self._evaluate,
-      metric = config['metric'],
-      config = primitive_search_space,
-      num_samples = 1,
-      # resources_per_trial = {"cpu": num_cores, "gpu": 1},
-      resources_per_trial={"cpu": 3, "gpu": 1},
-      mode = config["mode"],
-    )
+    primitive_analysis = self._run(primitive_search_space, config, num_samples=1)
 
     best_primitive_config = primitive_analysis.get_best_config(metric=config['metric'], mode=config["mode"])
     best_primitive_list =  primitive_analysis.dataframe(metric=config['metric'], mode=config["mode"])
@@ -130,21 +204,153 @@ class RaySearcher():
     print("Best primitive config: ", best_primitive_config )
     # hyperparam_searcher = self.set_search_algorithm(config["searching_algorithm"])
     # from ray.tune.suggest.hyperopt import HyperOptSearch
-    hyperparam_analysis = ray.tune.run(
-      self._evaluate,
+    hyperparam_analysis = self._run(hyperparm_search_space, config, num_samples=config["num_samples"])
+
+    # best_config = hyperparam_analysis.get_best_config(metric='F_beta', mode=config["mode"])
+
+    return [self.get_search_result(primitive_analysis,config),self.get_search_result(hyperparam_analysis,config)]
+
+
+  def _run(self, search_space, config, num_samples):
+    """
+    Run all the trials of a search space on the execution backend
+
+    Returns
+    -------
+      analysis:
+        Ray Tune analysis, or TrialAnalysis for the process backend
+    """
+    if self.backend == 'process':
+      trials = run_in_process_pool(self, search_space, num_samples=num_samples, num_workers=self.num_workers)
+      for _, _, fitted_pipeline_id, pipeline in trials:
+        self.stats.append_fitted_pipeline_id(fitted_pipeline_id)
+        self.stats.append_pipeline_description(pipeline)
+      return TrialAnalysis([trial[0] for trial in trials], [trial[1] for trial in trials])
+
+    return ray.tune.run(
+      tune.with_parameters(_ray_trainable, searcher=self),
       metric = config['metric'],
-      config = hyperparm_search_space,
-      num_samples = config["num_samples"],
-      # resources_per_trial = {"cpu": num_cores, "gpu": 1},
-      resources_per_trial={"cpu": 3, "gpu": 1},
+      config = search_space,
+      num_samples = num_samples,
+      resources_per_trial = self.resources_per_trial,
       mode = config["mode"],
       # search_alg=hyperparam_searcher
     )
 
-    # best_config = hyperparam_analysis.get_best_config(metric='F_beta', mode=config["mode"])
 
-    return [self.get_search_result(primitive_analysis,config),self.get_search_result(hyperparam_analysis,config)]
+  def _evaluate_configs(self, configs, **evaluate_kwargs):
+    """
+    Evaluate configs in parallel on the execution backend
+
+    Returns
+    -------
+      outcomes: list of tuple
+        (eval_metric, fitted_pipeline_id, pipeline) of each config
+    """
+    if self.backend == 'process':
+      return evaluate_in_process_pool(self, configs, num_workers=self.num_workers, **evaluate_kwargs)
+
+    resources = dict(self.resources_per_trial)
+    evaluate = ray.remote(num_cpus=resources.pop("cpu", 1), num_gpus=resources.pop("gpu", 0),
+                          resources=resources or None)(_evaluate_remote)
+    searcher_ref, kwargs_ref = ray.put(self), ray.put(evaluate_kwargs)
+    return ray.get([evaluate.remote(searcher_ref, search_space, kwargs_ref) for search_space in configs])
+
+
+  def _successive_halving_search(self, search_space, primitive_search_space, config):
+    """
+    Successive halving over the primitive combinations, then over the
+    hyperparams of the best combination unless ``ignore_hyperparameters``.
+
+    Returns
+    -------
+      result:
+        The result of ``_successive_halving``, or the results of both searches
+    """
+    primitive_result = self._successive_halving(resolve_grid_search(primitive_search_space), config)
+
+    best_primitive_config = primitive_result['best_config']
+    hyperparm_search_space,is_hyperparam = self.hyperparam_searchspace(search_space, primitive_result['search_history'], best_primitive_config)
+    if config["ignore_hyperparameters"] is True or is_hyperparam is False:
+      return primitive_result
+
+    hyperparam_result = self._successive_halving(resolve_grid_search(hyperparm_search_space), config)
+    return [primitive_result, hyperparam_result]
+
+
+  def _successive_halving(self, configs, config):
+    """
+    Score the configs on growing time-contiguous slices of the data, keeping
+    the best ``1 / reduction_factor`` of them after each rung.
+
+    Parameters
+    ----------
+    configs: list of dict
+      The configs to search
+    config:
+      The searcher config
+
+    Returns
+    -------
+      result:
+        best_config, best_pipeline_id, search_history with one row per trial,
+        and the CPU time of the search against the estimated CPU time of the exhaustive grid
+    """
+    metric, mode = config['metric'], config['mode']
+    reduction_factor = config.get("reduction_factor", 3)
+    fractions = halving_fractions(config.get("min_fraction", 1. / reduction_factor ** 2), reduction_factor)
+    min_samples = config.get("min_samples", 10)
+
+    history = []
+    cpu_times, reached_fractions = {}, {}
+    survivors = list(range(len(configs)))
+    for rung, fraction in enumerate(fractions):
+      if rung == len(fractions) - 1:
+        fraction = 1.
+        dataset, dataframe = self.dataset, self.dataframe
+      else:
+        n_samples = slice_length(len(self.dataframe), fraction, min_samples)
+        fraction = n_samples / len(self.dataframe)
+        dataframe = self.dataframe.iloc[:n_samples].reset_index(drop=True)
+        dataset = generate_dataset(dataframe, self.target_index)
+
+      # Only the pipelines fitted on the whole data are kept
+      evaluate_kwargs = {'dataset': dataset, 'dataframe': dataframe, 'save': rung == len(fractions) - 1}
+      if self.cache is not None:
+        evaluate_kwargs['fingerprint'] = dataset_fingerprint(dataframe)
+      outcomes = self._evaluate_configs([configs[index] for index in survivors], **evaluate_kwargs)
+
+      for index, (eval_metric, fitted_pipeline_id, _) in zip(survivors, outcomes):
+        cpu_times[index], reached_fractions[index] = eval_metric['cpu_time'], fraction
+        row = dict(eval_metric, rung=rung, fraction=fraction)
+        for key, value in configs[index].items():
+          row['config/' + str(key)] = value
+        history.append(row)
+
+      if rung < len(fractions) - 1:
+        scores = [eval_metric[metric] for eval_metric, _, _ in outcomes]
+        survivors = [survivors[position] for position in promote(scores, mode, reduction_factor)]
+
+    final = history[-len(survivors):]
+    best = promote([row[metric] for row in final], mode, len(final))[0]
+    best_config = configs[survivors[best]]
 
+    result = {}
+    result['best_config'] = best_config
+    result['search_history'] = pd.DataFrame(history)
+    fitted_pipeline_id = final[best]['fitted_pipeline_id']
+    if fitted_pipeline_id is None:
+      fitted_pipeline = fit_pipeline(self.dataset, build_pipeline(best_config), self.metric)
+      fitted_pipeline_id = save_fitted_pipeline(fitted_pipeline[0])
+    result['best_pipeline_id'] = fitted_pipeline_id
+    result['cpu_time'] = sum(row['cpu_time'] for row in history)
+    result['estimated_exhaustive_cpu_time'] = estimate_exhaustive_cpu_time(cpu_times, reached_fractions)
+    result['cpu_time_saved'] = result['estimated_exhaustive_cpu_time'] - result['cpu_time']
+    if self.cache is not None:
+      hits, misses = int(result['search_history']['cache_hits'].sum()), int(result['search_history']['cache_misses'].sum())
+      result['cache_stats'] = dict(self.cache.stats(), hits=hits, misses=misses,
+                                   hit_rate=hits / (hits + misses) if hits + misses else 0.)
+    return result
 
 
 
@@ -162,6 +368,7 @@ class RaySearcher():
     -------
       result: 
         A dataframe that contains search result: scores[name, score], pipeline_id, pipeline_config, search_history
+        and cache_stats[hits, misses, hit_rate, ...] when the step output cache is used
         
 
     """
@@ -174,6 +381,11 @@ class RaySearcher():
     df.to_csv('out.csv')
     result['search_history'] = df
     result['best_pipeline_id'] = self.find_best_pipeline(best_config, df)
+    if self.cache is not None:
+      # Trials report the hits and misses of the cache of the process running them
+      hits, misses = int(df['cache_hits'].sum()), int(df['cache_misses'].sum())
+      result['cache_stats'] = dict(self.cache.stats(), hits=hits, misses=misses,
+                                   hit_rate=hits / (hits + misses) if hits + misses else 0.)
     # result['scores'] = best_result[config['metric']]
     return result
 
@@ -196,21 +408,7 @@ class RaySearcher():
     -------
 
     """
-
-    # build pipeline
-    pipeline = build_pipeline(search_space)
-
-    # print('='*50)
-    # print(pipeline.to_json_structure())
-    # print('='*50)
-    
-    
-    # Train the pipeline with the specified metric and dataset.
-    # And get the result
-    fitted_pipeline = fit_pipeline(self.dataset, pipeline, self.metric)
-
-    # Save fitted pipeline id
-    fitted_pipeline_id = save_fitted_pipeline(fitted_pipeline[0])
+    eval_metric, fitted_pipeline_id, pipeline = self._evaluate_config(search_space)
 
     # Add fitted_pipeline_id to fitted_pipeline_list
     self.stats.append_fitted_pipeline_id.remote(fitted_pipeline_id)
@@ -218,17 +416,6 @@ class RaySearcher():
     # Add d3m.metadata.pipeline.Pipeline object to pipeline_description_list
     self.stats.append_pipeline_description.remote(pipeline)
 
-
-    df = self.dataframe
-
-    y_true = df['anomaly']
-    # print(pipeline_result.__dict__)
-    y_pred = fitted_pipeline[1].exposed_outputs['outputs.0']['anomaly']
-    # print(y_pred,type(y_pred))
-    # self.stats.append_score.remote(score)
-
-    eval_metric = get_evaluate_metric(y_true,y_pred, self.beta, self.metric)
-
     # ray.tune.report(score = score * 100)
     # ray.tune.report(accuracy=1)
 
@@ -246,6 +433,73 @@ class RaySearcher():
     yield eval_metric
 
 
+  def _evaluate_config(self, search_space, dataset=None, dataframe=None, fingerprint=None, save=True):
+    """
+    Fit and score the pipeline of one config, shared by the execution backends
+
+    Parameters
+    ----------
+    search_space:
+      A config of the search space
+    dataset, dataframe:
+      The data to fit and score on, defaults to the data of the searcher
+    fingerprint: str
+      ``dataset_fingerprint`` of ``dataframe`` when the cache is used
+    save: bool
+      Save the fitted pipeline, its id is None otherwise
+
+    Returns
+    -------
+      eval_metric: dict
+        The metrics, the fitted pipeline id, the CPU time and the cache hits and misses of the trial
+      fitted_pipeline_id: str
+      pipeline: d3m.metadata.pipeline.Pipeline
+    """
+    if dataset is None:
+      dataset, dataframe, fingerprint = self.dataset, self.dataframe, getattr(self, 'fingerprint', None)
+    start_time = time.process_time()
+
+    # build pipeline
+    pipeline = build_pipeline(search_space)
+
+    # print('='*50)
+    # print(pipeline.to_json_structure())
+    # print('='*50)
+    
+    
+    if self.cache is not None:
+      # Reuse the outputs of the steps shared with previous trials,
+      # the pipeline is fitted with the runtime only if it is the best one
+      hits, misses = self.cache.hits, self.cache.misses
+      detection_output = produce_with_cache(dataset, search_space, self.cache, fingerprint)
+      fitted_pipeline_id = None
+      y_pred = pd.Series(detection_output.iloc[:, 0].values)
+    else:
+      # Train the pipeline with the specified metric and dataset.
+      # And get the result
+      fitted_pipeline = fit_pipeline(dataset, pipeline, self.metric)
+
+      # Save fitted pipeline id
+      fitted_pipeline_id = save_fitted_pipeline(fitted_pipeline[0]) if save else None
+      y_pred = fitted_pipeline[1].exposed_outputs['outputs.0']['anomaly']
+
+    df = dataframe
+
+    y_true = df['anomaly']
+    # print(pipeline_result.__dict__)
+    # print(y_pred,type(y_pred))
+    # self.stats.append_score.remote(score)
+
+    eval_metric = get_evaluate_metric(y_true,y_pred, self.beta, self.metric)
+    eval_metric['fitted_pipeline_id'] = fitted_pipeline_id
+    eval_metric['cpu_time'] = time.process_time() - start_time
+    if self.cache is not None:
+      eval_metric['cache_hits'] = self.cache.hits - hits
+      eval_metric['cache_misses'] = self.cache.misses - misses
+
+    return eval_metric, fitted_pipeline_id, pipeline
+
+
 
   def find_best_pipeline(self, best_config, results_dataframe):
     """
@@ -270,7 +524,13 @@ class RaySearcher():
       results_dataframe = results_dataframe.loc[results_dataframe['config/' + str(key)].apply(lambda x: x == value)]
       # print(results_dataframe)
       
-    return ray.get(self.stats.get_fitted_pipeline_list.remote())[results_dataframe.index[0]]
+    # Trials report their fitted pipeline id, they may finish in any order
+    fitted_pipeline_id = results_dataframe['fitted_pipeline_id'].iloc[0]
+    if fitted_pipeline_id is None or pd.isna(fitted_pipeline_id):
+      # Trials evaluated with the step output cache are not saved
+      fitted_pipeline = fit_pipeline(self.dataset, build_pipeline(best_config), self.metric)
+      fitted_pipeline_id = save_fitted_pipeline(fitted_pipeline[0])
+    return fitted_pipeline_id
 
 
   def json_to_primitive_searchspace(self,json,is_exhaustive = 1):
@@ -294,7 +554,7 @@ class RaySearcher():
       for key,value in json.items():
         # only support one detection algorithm per pipeline
         if key == 'detection_algorithm' and value:
-          primitive_searchspace['detection_algorithm'] = ray.tune.grid_search([[[detection_algo,]] for detection_algo in value.keys()])
+          primitive_searchspace['detection_algorithm'] = grid_search([[[detection_algo,]] for detection_algo in value.keys()])
           continue
         primitive_searchspace[key] = self.exhaustive_searchspace(list(value.keys()))
 
@@ -302,7 +562,7 @@ class RaySearcher():
       for key,value in json.items():
         # only support one detection algorithm per pipeline
         if key == 'detection_algorithm' and value:
-          primitive_searchspace['detection_algorithm'] = ray.tune.grid_search([[[detection_algo,]] for detection_algo in value.keys()])
+          primitive_searchspace['detection_algorithm'] = grid_search([[[detection_algo,]] for detection_algo in value.keys()])
           continue
         primitive_searchspace[key] = self.simple_searchspace(list(value.keys()))
 
@@ -326,7 +586,7 @@ class RaySearcher():
         primitive_combination.pop()
 
     backtracking(primitive_list, 0)
-    return ray.tune.grid_search(search_space_list)
+    return grid_search(search_space_list)
 
 
   def simple_searchspace(self,list):
@@ -337,7 +597,7 @@ class RaySearcher():
       path.append([i,])
       res.append(path[:])
     # use test search space just change res to path
-    return ray.tune.grid_search(res)
+    return grid_search(res)
 
   # TODO provide choices of search algorithms
   def hyperparam_searchspace(self,json_data,primitive_df,primitive_config):
@@ -361,7 +621,7 @@ class RaySearcher():
               continue
             
             # TODO define search space using search space API, need to be customized according to search algorithm
-            data = ray.tune.grid_search(data)
+            data = grid_search(data)
             hyperparam_list[hyperparam] = data
             is_hyperparam = True
           primitives.append(hyperparam_list)
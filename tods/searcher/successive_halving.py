@@ -0,0 +1,76 @@
+# Scheduling of the successive halving search
+import math
+
+
+def halving_fractions(min_fraction, reduction_factor):
+    """
+    Fractions of the data used by each rung, growing by ``reduction_factor``
+    from ``min_fraction`` up to the whole data.
+
+    Parameters
+    ----------
+    min_fraction: float
+        Fraction of the data used by the first rung, in (0, 1]
+    reduction_factor: int
+        Growth of the data fraction and shrink of the configs between two rungs
+
+    Returns
+    -------
+    fractions: list of float
+    """
+    if not 0 < min_fraction <= 1:
+        raise ValueError('min_fraction should be in (0, 1], got {}.'.format(min_fraction))
+    if reduction_factor < 2:
+        raise ValueError('reduction_factor should be at least 2, got {}.'.format(reduction_factor))
+
+    fractions = [1.]
+    while fractions[0] / reduction_factor >= min_fraction * (1 - 1e-9):
+        fractions.insert(0, fractions[0] / reduction_factor)
+    return fractions
+
+
+def slice_length(n_samples, fraction, min_samples=1):
+    """
+    Number of leading samples of a rung
+    """
+    return min(n_samples, max(min_samples, int(math.ceil(n_samples * fraction))))
+
+
+def promote(scores, mode, reduction_factor):
+    """
+    Indices of the configs promoted to the next rung, best first.
+
+    Parameters
+    ----------
+    scores: list of float
+        Score of each config on the current rung
+    mode: str
+        ``min`` or ``max``, whether lower or higher scores are better
+    reduction_factor: int
+        Keep the best ``1 / reduction_factor`` of the configs, at least one
+
+    Returns
+    -------
+    promoted: list of int
+    """
+    order = sorted(range(len(scores)), key=scores.__getitem__, reverse=(mode == 'max'))
+    return order[:max(1, int(math.ceil(len(scores) / reduction_factor)))]
+
+
+def estimate_exhaustive_cpu_time(cpu_times, fractions):
+    """
+    CPU time the exhaustive grid would have spent on the whole data, assuming
+    the cost of a trial grows linearly with the data size.
+
+    Parameters
+    ----------
+    cpu_times: dict
+        Maps each config index to its CPU time on the last rung it reached
+    fractions: dict
+        Maps each config index to the data fraction of the last rung it reached
+
+    Returns
+    -------
+    cpu_time: float
+    """
+    return sum(cpu_times[index] / fractions[index] for index in cpu_times)
@@ -1,4 +1,12 @@
-from tods.sk_interface.data_ensemble import *
-from tods.sk_interface.feature_analysis import *
-from tods.sk_interface.detection_algorithm import *
-from tods.sk_interface.timeseries_processing import *
+from tods.common.lazy import lazy_attributes, package_attributes
+
+# The interfaces are imported on first access, see tods.common.lazy
+_INTERFACES = package_attributes([
+    'tods.sk_interface.data_ensemble',
+    'tods.sk_interface.feature_analysis',
+    'tods.sk_interface.detection_algorithm',
+    'tods.sk_interface.timeseries_processing',
+])
+
+__all__ = list(_INTERFACES)
+__getattr__, __dir__ = lazy_attributes(__name__, _INTERFACES)
@@ -1,5 +1,7 @@
 from d3m import container
+from d3m.metadata import base as metadata_base
 import numpy as np
+from joblib import Parallel, delayed
 
 def get_default_hyperparameter(primitive, hyperparameter):
 
@@ -19,8 +21,64 @@ def get_default_hyperparameter(primitive, hyperparameter):
 
     return hyperparams
 
+def to_container(X, generate_metadata=True):
+    """
+    Convert a 2D ndarray to a d3m DataFrame with columns named by their index.
+    Without generate_metadata, only the table, row and column metadata that
+    generate_metadata would produce for a numeric array is set, in time
+    linear in the number of columns instead of the number of cells.
+    """
+    column_name = [str(col_index) for col_index in range(X.shape[1])]
+    if generate_metadata:
+        return container.DataFrame(X, columns=column_name, generate_metadata=True)
+
+    df = container.DataFrame(X, columns=column_name, generate_metadata=False)
+    metadata = df.metadata.update((), {
+        'schema': metadata_base.CONTAINER_SCHEMA_VERSION,
+        'structural_type': container.DataFrame,
+        'semantic_types': ['https://metadata.datadrivendiscovery.org/types/Table'],
+        'dimension': {
+            'name': 'rows',
+            'semantic_types': ['https://metadata.datadrivendiscovery.org/types/TabularRow'],
+            'length': X.shape[0],
+        },
+    })
+    metadata = metadata.update((metadata_base.ALL_ELEMENTS,), {
+        'dimension': {
+            'name': 'columns',
+            'semantic_types': ['https://metadata.datadrivendiscovery.org/types/TabularColumn'],
+            'length': X.shape[1],
+        },
+    })
+    for col_index, name in enumerate(column_name):
+        metadata = metadata.update((metadata_base.ALL_ELEMENTS, col_index), {
+            'name': name,
+            'structural_type': df.dtypes.iloc[col_index].type,
+        })
+    df.metadata = metadata
+    return df
+
+def _fit_system(primitive, data, generate_metadata):
+    primitive.set_training_data(inputs=to_container(data, generate_metadata))
+    primitive.fit()
+    return primitive
+
+def _forward_system(primitive, data, method, generate_metadata):
+    forward_method = getattr(primitive, method, None)
+    return forward_method(inputs=to_container(data, generate_metadata)).value.values
+
 class BaseSKI:
-    def __init__(self, primitive, system_num=1, **hyperparameter):
+    """
+    Sklearn-style interface of a primitive, with one primitive per system.
+
+    Args:
+        primitive: The primitive class
+        system_num: Number of systems
+        system_n_jobs: Number of worker processes fitting and scoring the
+            systems, -1 uses all the CPU cores, 1 runs them in this process
+        **hyperparameter: Hyperparams of the primitive
+    """
+    def __init__(self, primitive, system_num=1, system_n_jobs=1, **hyperparameter):
 
         self.fit_available = True if 'fit' in primitive.__dict__ else False
         self.predict_available = True if 'produce' in primitive.__dict__ else False
@@ -30,7 +88,10 @@ class BaseSKI:
         # print(primitive, self.fit_available, self.predict_available, self.predict_score_available, self.produce_available)
 
         self.system_num = system_num
+        self.system_n_jobs = system_n_jobs
         hyperparams = get_default_hyperparameter(primitive, hyperparameter)
+        # Primitives selecting columns by index do not read the generated metadata
+        self.generate_metadata = bool(hyperparams.get('use_semantic_types', True))
 
         if system_num >= 1:
             self.primitives = [primitive(hyperparams=hyperparams) for sys_idx in range(system_num)]
@@ -47,11 +108,17 @@ class BaseSKI:
 
         data = self._sys_data_check(data)
 
-        for sys_idx, primitive in enumerate(self.primitives):
-            sys_data = data[sys_idx]
-            sys_data = self._transform(sys_data)
-            primitive.set_training_data(inputs=sys_data)
-            primitive.fit()
+        if self._parallel():
+            # Primitives are fitted in the workers and sent back
+            self.primitives = Parallel(n_jobs=self.system_n_jobs)(
+                delayed(_fit_system)(primitive, data[sys_idx], self.generate_metadata)
+                for sys_idx, primitive in enumerate(self.primitives))
+        else:
+            for sys_idx, primitive in enumerate(self.primitives):
+                sys_data = data[sys_idx]
+                sys_data = self._transform(sys_data)
+                primitive.set_training_data(inputs=sys_data)
+                primitive.fit()
 
         return
     
@@ -109,14 +176,23 @@ class BaseSKI:
 
         return data
 
+    def _parallel(self):
+        return self.system_n_jobs not in (None, 1) and self.system_num > 1
+
     def _forward(self, data, method):
         output_data = []
-        for sys_idx, primitive in enumerate(self.primitives):
-            sys_data = data[sys_idx]
-            sys_data = self._transform(sys_data)
-            forward_method = getattr(primitive, method, None)
-            output_data.append(forward_method(inputs=sys_data).value.values)
-            # print(forward_method(inputs=sys_data).value.values.shape)
+        if self._parallel():
+            # Results are returned in system order
+            output_data = Parallel(n_jobs=self.system_n_jobs)(
+                delayed(_forward_system)(primitive, data[sys_idx], method, self.generate_metadata)
+                for sys_idx, primitive in enumerate(self.primitives))
+        else:
+            for sys_idx, primitive in enumerate(self.primitives):
+                sys_data = data[sys_idx]
+                sys_data = self._transform(sys_data)
+                forward_method = getattr(primitive, method, None)
+                output_data.append(forward_method(inputs=sys_data).value.values)
+                # print(forward_method(inputs=sys_data).value.values.shape)
 
         # print(type(output_data), len(output_data), output_data[0].shape)
         # print(np.array(output_data))
@@ -134,8 +210,7 @@ class BaseSKI:
 
 
     def _transform(self, X):     #transform the ndarray to d3m dataframe, select columns to use
-        column_name = [str(col_index) for col_index in range(X.shape[1])]
-        return container.DataFrame(X, columns=column_name, generate_metadata=True)
+        return to_container(X, self.generate_metadata)
 
     # def set_training_data(self, data):
     #     return self.primitive.set_training_data(inputs=data)
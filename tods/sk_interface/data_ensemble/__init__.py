@@ -1 +1,9 @@
-from tods.sk_interface.data_ensemble.Ensemble_skinterface import EnsembleSKI
+from tods.common.lazy import lazy_attributes
+
+# The primitives are imported on first access, see tods.common.lazy
+_PRIMITIVES = {
+    'EnsembleSKI': 'tods.sk_interface.data_ensemble.Ensemble_skinterface',
+}
+
+__all__ = list(_PRIMITIVES)
+__getattr__, __dir__ = lazy_attributes(__name__, _PRIMITIVES)
@@ -0,0 +1,10 @@
+import numpy as np 
+from ..base import BaseSKI
+from tods.data_processing.TimeSeriesIngestion import TimeSeriesIngestionPrimitive
+
+class TimeSeriesIngestionSKI(BaseSKI):
+	def __init__(self, **hyperparams):
+		super().__init__(primitive=TimeSeriesIngestionPrimitive, **hyperparams)
+		self.fit_available = False
+		self.predict_available = False
+		self.produce_available = True
@@ -1,22 +1,30 @@
-from tods.sk_interface.detection_algorithm.ABOD_skinterface import ABODSKI
-from tods.sk_interface.detection_algorithm.AutoEncoder_skinterface import AutoEncoderSKI
-from tods.sk_interface.detection_algorithm.AutoRegODetector_skinterface import AutoRegODetectorSKI
-from tods.sk_interface.detection_algorithm.CBLOF_skinterface import CBLOFSKI
-from tods.sk_interface.detection_algorithm.COF_skinterface import COFSKI
-from tods.sk_interface.detection_algorithm.DeepLog_skinterface import DeepLogSKI
-from tods.sk_interface.detection_algorithm.HBOS_skinterface import HBOSSKI
-from tods.sk_interface.detection_algorithm.IsolationForest_skinterface import IsolationForestSKI
-from tods.sk_interface.detection_algorithm.KDiscordODetector_skinterface import KDiscordODetectorSKI
-from tods.sk_interface.detection_algorithm.KNN_skinterface import KNNSKI
-from tods.sk_interface.detection_algorithm.LODA_skinterface import LODASKI
-from tods.sk_interface.detection_algorithm.LOF_skinterface import LOFSKI
-from tods.sk_interface.detection_algorithm.LSTMODetector_skinterface import LSTMODetectorSKI
-from tods.sk_interface.detection_algorithm.MatrixProfile_skinterface import MatrixProfileSKI
-from tods.sk_interface.detection_algorithm.Mo_Gaal_skinterface import Mo_GaalSKI
-from tods.sk_interface.detection_algorithm.OCSVM_skinterface import OCSVMSKI
-from tods.sk_interface.detection_algorithm.PCAODetector_skinterface import PCAODetectorSKI
-from tods.sk_interface.detection_algorithm.SOD_skinterface import SODSKI
-from tods.sk_interface.detection_algorithm.So_Gaal_skinterface import So_GaalSKI
-from tods.sk_interface.detection_algorithm.SystemWiseDetection_skinterface import SystemWiseDetectionSKI
-from tods.sk_interface.detection_algorithm.Telemanom_skinterface import TelemanomSKI
-from tods.sk_interface.detection_algorithm.VariationalAutoEncoder_skinterface import VariationalAutoEncoderSKI
+from tods.common.lazy import lazy_attributes
+
+# The primitives are imported on first access, see tods.common.lazy
+_PRIMITIVES = {
+    'ABODSKI': 'tods.sk_interface.detection_algorithm.ABOD_skinterface',
+    'AutoEncoderSKI': 'tods.sk_interface.detection_algorithm.AutoEncoder_skinterface',
+    'AutoRegODetectorSKI': 'tods.sk_interface.detection_algorithm.AutoRegODetector_skinterface',
+    'CBLOFSKI': 'tods.sk_interface.detection_algorithm.CBLOF_skinterface',
+    'COFSKI': 'tods.sk_interface.detection_algorithm.COF_skinterface',
+    'DeepLogSKI': 'tods.sk_interface.detection_algorithm.DeepLog_skinterface',
+    'HBOSSKI': 'tods.sk_interface.detection_algorithm.HBOS_skinterface',
+    'IsolationForestSKI': 'tods.sk_interface.detection_algorithm.IsolationForest_skinterface',
+    'KDiscordODetectorSKI': 'tods.sk_interface.detection_algorithm.KDiscordODetector_skinterface',
+    'KNNSKI': 'tods.sk_interface.detection_algorithm.KNN_skinterface',
+    'LODASKI': 'tods.sk_interface.detection_algorithm.LODA_skinterface',
+    'LOFSKI': 'tods.sk_interface.detection_algorithm.LOF_skinterface',
+    'LSTMODetectorSKI': 'tods.sk_interface.detection_algorithm.LSTMODetector_skinterface',
+    'MatrixProfileSKI': 'tods.sk_interface.detection_algorithm.MatrixProfile_skinterface',
+    'Mo_GaalSKI': 'tods.sk_interface.detection_algorithm.Mo_Gaal_skinterface',
+    'OCSVMSKI': 'tods.sk_interface.detection_algorithm.OCSVM_skinterface',
+    'PCAODetectorSKI': 'tods.sk_interface.detection_algorithm.PCAODetector_skinterface',
+    'SODSKI': 'tods.sk_interface.detection_algorithm.SOD_skinterface',
+    'So_GaalSKI': 'tods.sk_interface.detection_algorithm.So_Gaal_skinterface',
+    'SystemWiseDetectionSKI': 'tods.sk_interface.detection_algorithm.SystemWiseDetection_skinterface',
+    'TelemanomSKI': 'tods.sk_interface.detection_algorithm.Telemanom_skinterface',
+    'VariationalAutoEncoderSKI': 'tods.sk_interface.detection_algorithm.VariationalAutoEncoder_skinterface',
+}
+
+__all__ = list(_PRIMITIVES)
+__getattr__, __dir__ = lazy_attributes(__name__, _PRIMITIVES)
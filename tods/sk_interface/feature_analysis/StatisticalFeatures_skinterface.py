@@ -0,0 +1,10 @@
+import numpy as np 
+from ..base import BaseSKI
+from tods.feature_analysis.StatisticalFeatures import StatisticalFeaturesPrimitive
+
+class StatisticalFeaturesSKI(BaseSKI):
+	def __init__(self, **hyperparams):
+		super().__init__(primitive=StatisticalFeaturesPrimitive, **hyperparams)
+		self.fit_available = False
+		self.predict_available = False
+		self.produce_available = True
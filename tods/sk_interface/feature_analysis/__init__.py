@@ -1,30 +1,39 @@
-from tods.sk_interface.feature_analysis.AutoCorrelation_skinterface import AutoCorrelationSKI
-from tods.sk_interface.feature_analysis.BKFilter_skinterface import BKFilterSKI
-from tods.sk_interface.feature_analysis.DiscreteCosineTransform_skinterface import DiscreteCosineTransformSKI
-from tods.sk_interface.feature_analysis.FastFourierTransform_skinterface import FastFourierTransformSKI
-from tods.sk_interface.feature_analysis.HPFilter_skinterface import HPFilterSKI
-from tods.sk_interface.feature_analysis.NonNegativeMatrixFactorization_skinterface import NonNegativeMatrixFactorizationSKI
-from tods.sk_interface.feature_analysis.SKTruncatedSVD_skinterface import SKTruncatedSVDSKI
-from tods.sk_interface.feature_analysis.SpectralResidualTransform_skinterface import SpectralResidualTransformSKI
-from tods.sk_interface.feature_analysis.StatisticalAbsEnergy_skinterface import StatisticalAbsEnergySKI
-from tods.sk_interface.feature_analysis.StatisticalAbsSum_skinterface import StatisticalAbsSumSKI
-from tods.sk_interface.feature_analysis.StatisticalGmean_skinterface import StatisticalGmeanSKI
-from tods.sk_interface.feature_analysis.StatisticalHmean_skinterface import StatisticalHmeanSKI
-from tods.sk_interface.feature_analysis.StatisticalKurtosis_skinterface import StatisticalKurtosisSKI
-from tods.sk_interface.feature_analysis.StatisticalMaximum_skinterface import StatisticalMaximumSKI
-from tods.sk_interface.feature_analysis.StatisticalMeanAbsTemporalDerivative_skinterface import StatisticalMeanAbsTemporalDerivativeSKI
-from tods.sk_interface.feature_analysis.StatisticalMeanAbs_skinterface import StatisticalMeanAbsSKI
-from tods.sk_interface.feature_analysis.StatisticalMeanTemporalDerivative_skinterface import StatisticalMeanTemporalDerivativeSKI
-from tods.sk_interface.feature_analysis.StatisticalMean_skinterface import StatisticalMeanSKI
-from tods.sk_interface.feature_analysis.StatisticalMedianAbsoluteDeviation_skinterface import StatisticalMedianAbsoluteDeviationSKI
-from tods.sk_interface.feature_analysis.StatisticalMedian_skinterface import StatisticalMedianSKI
-from tods.sk_interface.feature_analysis.StatisticalMinimum_skinterface import StatisticalMinimumSKI
-from tods.sk_interface.feature_analysis.StatisticalSkew_skinterface import StatisticalSkewSKI
-from tods.sk_interface.feature_analysis.StatisticalStd_skinterface import StatisticalStdSKI
-from tods.sk_interface.feature_analysis.StatisticalVar_skinterface import StatisticalVarSKI
-from tods.sk_interface.feature_analysis.StatisticalVariation_skinterface import StatisticalVariationSKI
-from tods.sk_interface.feature_analysis.StatisticalVecSum_skinterface import StatisticalVecSumSKI
-from tods.sk_interface.feature_analysis.StatisticalWillisonAmplitude_skinterface import StatisticalWillisonAmplitudeSKI
-from tods.sk_interface.feature_analysis.StatisticalZeroCrossing_skinterface import StatisticalZeroCrossingSKI
-from tods.sk_interface.feature_analysis.TRMF_skinterface import TRMFSKI
-from tods.sk_interface.feature_analysis.WaveletTransform_skinterface import WaveletTransformSKI
+from tods.common.lazy import lazy_attributes
+
+# The primitives are imported on first access, see tods.common.lazy
+_PRIMITIVES = {
+    'AutoCorrelationSKI': 'tods.sk_interface.feature_analysis.AutoCorrelation_skinterface',
+    'BKFilterSKI': 'tods.sk_interface.feature_analysis.BKFilter_skinterface',
+    'DiscreteCosineTransformSKI': 'tods.sk_interface.feature_analysis.DiscreteCosineTransform_skinterface',
+    'FastFourierTransformSKI': 'tods.sk_interface.feature_analysis.FastFourierTransform_skinterface',
+    'HPFilterSKI': 'tods.sk_interface.feature_analysis.HPFilter_skinterface',
+    'NonNegativeMatrixFactorizationSKI': 'tods.sk_interface.feature_analysis.NonNegativeMatrixFactorization_skinterface',
+    'SKTruncatedSVDSKI': 'tods.sk_interface.feature_analysis.SKTruncatedSVD_skinterface',
+    'SpectralResidualTransformSKI': 'tods.sk_interface.feature_analysis.SpectralResidualTransform_skinterface',
+    'StatisticalAbsEnergySKI': 'tods.sk_interface.feature_analysis.StatisticalAbsEnergy_skinterface',
+    'StatisticalAbsSumSKI': 'tods.sk_interface.feature_analysis.StatisticalAbsSum_skinterface',
+    'StatisticalFeaturesSKI': 'tods.sk_interface.feature_analysis.StatisticalFeatures_skinterface',
+    'StatisticalGmeanSKI': 'tods.sk_interface.feature_analysis.StatisticalGmean_skinterface',
+    'StatisticalHmeanSKI': 'tods.sk_interface.feature_analysis.StatisticalHmean_skinterface',
+    'StatisticalKurtosisSKI': 'tods.sk_interface.feature_analysis.StatisticalKurtosis_skinterface',
+    'StatisticalMaximumSKI': 'tods.sk_interface.feature_analysis.StatisticalMaximum_skinterface',
+    'StatisticalMeanAbsTemporalDerivativeSKI': 'tods.sk_interface.feature_analysis.StatisticalMeanAbsTemporalDerivative_skinterface',
+    'StatisticalMeanAbsSKI': 'tods.sk_interface.feature_analysis.StatisticalMeanAbs_skinterface',
+    'StatisticalMeanTemporalDerivativeSKI': 'tods.sk_interface.feature_analysis.StatisticalMeanTemporalDerivative_skinterface',
+    'StatisticalMeanSKI': 'tods.sk_interface.feature_analysis.StatisticalMean_skinterface',
+    'StatisticalMedianAbsoluteDeviationSKI': 'tods.sk_interface.feature_analysis.StatisticalMedianAbsoluteDeviation_skinterface',
+    'StatisticalMedianSKI': 'tods.sk_interface.feature_analysis.StatisticalMedian_skinterface',
+    'StatisticalMinimumSKI': 'tods.sk_interface.feature_analysis.StatisticalMinimum_skinterface',
+    'StatisticalSkewSKI': 'tods.sk_interface.feature_analysis.StatisticalSkew_skinterface',
+    'StatisticalStdSKI': 'tods.sk_interface.feature_analysis.StatisticalStd_skinterface',
+    'StatisticalVarSKI': 'tods.sk_interface.feature_analysis.StatisticalVar_skinterface',
+    'StatisticalVariationSKI': 'tods.sk_interface.feature_analysis.StatisticalVariation_skinterface',
+    'StatisticalVecSumSKI': 'tods.sk_interface.feature_analysis.StatisticalVecSum_skinterface',
+    'StatisticalWillisonAmplitudeSKI': 'tods.sk_interface.feature_analysis.StatisticalWillisonAmplitude_skinterface',
+    'StatisticalZeroCrossingSKI': 'tods.sk_interface.feature_analysis.StatisticalZeroCrossing_skinterface',
+    'TRMFSKI': 'tods.sk_interface.feature_analysis.TRMF_skinterface',
+    'WaveletTransformSKI': 'tods.sk_interface.feature_analysis.WaveletTransform_skinterface',
+}
+
+__all__ = list(_PRIMITIVES)
+__getattr__, __dir__ = lazy_attributes(__name__, _PRIMITIVES)
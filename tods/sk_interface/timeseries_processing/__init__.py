@@ -1,10 +1,18 @@
-from tods.sk_interface.timeseries_processing.HoltSmoothing_skinterface import HoltSmoothingSKI
-from tods.sk_interface.timeseries_processing.HoltWintersExponentialSmoothing_skinterface import HoltWintersExponentialSmoothingSKI
-from tods.sk_interface.timeseries_processing.MovingAverageTransformer_skinterface import MovingAverageTransformerSKI
-from tods.sk_interface.timeseries_processing.SKAxiswiseScaler_skinterface import SKAxiswiseScalerSKI
-from tods.sk_interface.timeseries_processing.SKPowerTransformer_skinterface import SKPowerTransformerSKI
-from tods.sk_interface.timeseries_processing.SKQuantileTransformer_skinterface import SKQuantileTransformerSKI
-from tods.sk_interface.timeseries_processing.SKStandardScaler_skinterface import SKStandardScalerSKI
-from tods.sk_interface.timeseries_processing.SimpleExponentialSmoothing_skinterface import SimpleExponentialSmoothingSKI
-from tods.sk_interface.timeseries_processing.SubsequenceSegmentation_skinterface import SubsequenceSegmentationSKI 
-from tods.sk_interface.timeseries_processing.TimeSeriesSeasonalityTrendDecomposition_skinterface import TimeSeriesSeasonalityTrendDecompositionSKI
+from tods.common.lazy import lazy_attributes
+
+# The primitives are imported on first access, see tods.common.lazy
+_PRIMITIVES = {
+    'HoltSmoothingSKI': 'tods.sk_interface.timeseries_processing.HoltSmoothing_skinterface',
+    'HoltWintersExponentialSmoothingSKI': 'tods.sk_interface.timeseries_processing.HoltWintersExponentialSmoothing_skinterface',
+    'MovingAverageTransformerSKI': 'tods.sk_interface.timeseries_processing.MovingAverageTransformer_skinterface',
+    'SKAxiswiseScalerSKI': 'tods.sk_interface.timeseries_processing.SKAxiswiseScaler_skinterface',
+    'SKPowerTransformerSKI': 'tods.sk_interface.timeseries_processing.SKPowerTransformer_skinterface',
+    'SKQuantileTransformerSKI': 'tods.sk_interface.timeseries_processing.SKQuantileTransformer_skinterface',
+    'SKStandardScalerSKI': 'tods.sk_interface.timeseries_processing.SKStandardScaler_skinterface',
+    'SimpleExponentialSmoothingSKI': 'tods.sk_interface.timeseries_processing.SimpleExponentialSmoothing_skinterface',
+    'SubsequenceSegmentationSKI': 'tods.sk_interface.timeseries_processing.SubsequenceSegmentation_skinterface',
+    'TimeSeriesSeasonalityTrendDecompositionSKI': 'tods.sk_interface.timeseries_processing.TimeSeriesSeasonalityTrendDecomposition_skinterface',
+}
+
+__all__ = list(_PRIMITIVES)
+__getattr__, __dir__ = lazy_attributes(__name__, _PRIMITIVES)
@@ -0,0 +1,37 @@
+import subprocess
+import sys
+import unittest
+
+
+def _imported_modules(code):
+    output = subprocess.run([sys.executable, '-c', code + '\nimport sys\nprint(" ".join(sys.modules))'],
+                            check=True, stdout=subprocess.PIPE, universal_newlines=True).stdout
+    return set(output.strip().splitlines()[-1].split())
+
+
+class LazyImportTestCase(unittest.TestCase):
+    def test_import_tods(self):
+        modules = _imported_modules('import tods')
+        self.assertNotIn('tensorflow', modules)
+        self.assertNotIn('tods.detection_algorithm.Telemanom', modules)
+
+    def test_import_primitive(self):
+        modules = _imported_modules('from tods.detection_algorithm import IsolationForestPrimitive\n'
+                                    'from tods import StatisticalMeanPrimitive')
+        self.assertIn('tods.detection_algorithm.PyodIsolationForest', modules)
+        self.assertNotIn('tensorflow', modules)
+
+    def test_attributes(self):
+        import tods
+        import tods.detection_algorithm
+        from tods.detection_algorithm.PyodIsolationForest import IsolationForestPrimitive
+
+        self.assertIs(tods.detection_algorithm.IsolationForestPrimitive, IsolationForestPrimitive)
+        self.assertIs(tods.IsolationForestPrimitive, IsolationForestPrimitive)
+        self.assertIn('TelemanomPrimitive', dir(tods.detection_algorithm))
+        with self.assertRaises(AttributeError):
+            tods.detection_algorithm.MissingPrimitive
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+
+import numpy as np
+from d3m import container
+
+from tods.common.system_wise import PackedSystems, is_system_wise, map_systems, collect_systems
+from tods.detection_algorithm.PyodIsolationForest import IsolationForestPrimitive
+
+
+def _scale(primitive, inputs, factor):
+    return inputs * factor
+
+
+class SystemWiseTestCase(unittest.TestCase):
+    def setUp(self):
+        random_state = np.random.RandomState(0)
+        self.systems = [container.DataFrame(random_state.randn(length, 2), columns=['a', 'b'], generate_metadata=True)
+                        for length in (40, 55, 60)]
+        self.data = container.DataFrame({'system': self.systems}, columns=['system'], generate_metadata=False)
+
+    def test_packed(self):
+        packed = PackedSystems.from_system_frame(self.data)
+        self.assertTrue(is_system_wise(packed))
+        self.assertTrue(is_system_wise(self.data))
+        self.assertFalse(is_system_wise(self.systems[0]))
+        self.assertEqual(len(packed), 3)
+        np.testing.assert_array_equal(packed.offsets, [0, 40, 95, 155])
+        np.testing.assert_array_equal(packed.system(1).values, self.systems[1].values)
+        self.assertTrue(np.shares_memory(packed.system_values(2), packed.values))
+
+        with self.assertRaises(ValueError):
+            PackedSystems(packed.values, [0, 40, 100])
+
+    def test_map_systems(self):
+        packed = PackedSystems.from_system_frame(self.data)
+        for n_jobs in [1, 2]:
+            outputs = collect_systems(packed, map_systems(_scale, None, packed, n_jobs=n_jobs, factor=2))
+            np.testing.assert_allclose(outputs.values, 2 * packed.values)
+            np.testing.assert_array_equal(outputs.offsets, packed.offsets)
+
+        outputs = collect_systems(self.data, map_systems(_scale, None, self.data, factor=2))
+        np.testing.assert_allclose(outputs.iat[0, 0].values, 2 * self.systems[0].values)
+        self.assertIs(self.data.iat[0, 0], self.systems[0])
+
+    def test_fit_per_system(self):
+        hyperparams = IsolationForestPrimitive.metadata.get_hyperparams().defaults().replace({'system_n_jobs': 2})
+        primitive = IsolationForestPrimitive(hyperparams=hyperparams)
+        primitive.set_training_data(inputs=PackedSystems.from_system_frame(self.data))
+        primitive.fit()
+        self.assertEqual(len(primitive._system_primitives), 3)
+
+        scores = primitive.produce_score(inputs=PackedSystems.from_system_frame(self.data)).value
+        np.testing.assert_array_equal(scores.lengths, [40, 55, 60])
+        for index, system in enumerate(self.systems):
+            expected = primitive._system_primitives[index]._produce_score(inputs=system).value
+            np.testing.assert_allclose(scores.system_values(index), expected.values)
+
+    def test_params_per_system(self):
+        hyperparams = IsolationForestPrimitive.metadata.get_hyperparams().defaults()
+        primitive = IsolationForestPrimitive(hyperparams=hyperparams)
+        primitive.set_training_data(inputs=PackedSystems.from_system_frame(self.data))
+        primitive.fit()
+        expected = primitive.produce_score(inputs=PackedSystems.from_system_frame(self.data)).value
+
+        # The runtime keeps the params and rebuilds the primitive from them
+        restored = IsolationForestPrimitive(hyperparams=hyperparams)
+        restored.set_params(params=primitive.get_params())
+        self.assertEqual(len(restored._system_primitives), 3)
+        scores = restored.produce_score(inputs=PackedSystems.from_system_frame(self.data)).value
+        np.testing.assert_allclose(scores.values, expected.values)
+
+
+if __name__ == '__main__':
+    unittest.main()
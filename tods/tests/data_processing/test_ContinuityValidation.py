@@ -185,6 +185,29 @@ class ContinuityValidationTest(unittest.TestCase):
         }])
 
 
+    def test_gaps(self):
+        main = container.DataFrame({'d3mIndex': list(range(8)),
+                                    'timestamp': [0., 1., 2., 4., 6., 8., 10., 11.],
+                                    'a': [0., 1., 2., 4., 6., 8., 10., 11.],
+                                    'ground_truth': [0, 0, 0, 1, 0, 0, 1, 0]},
+                                    columns=['d3mIndex', 'timestamp', 'a', 'ground_truth'],
+                                    generate_metadata=True)
+
+        hyperparams_class = ContinuityValidation.ContinuityValidationPrimitive.metadata.get_hyperparams()
+        primitive = ContinuityValidation.ContinuityValidationPrimitive(hyperparams=hyperparams_class.defaults())
+        new_main = primitive.produce(inputs=main.copy()).value
+        self.assertEqual(new_main['d3mIndex'].tolist(), list(range(12)))
+        self.assertEqual(new_main['timestamp'].tolist(), [float(i) for i in range(12)])
+        self.assertEqual(new_main['a'].tolist(), [float(i) for i in range(12)])
+        self.assertEqual(new_main['ground_truth'].tolist(), [0, 0, 0, 1, 1, 0, 0, 0, 0, 1, 1, 0])
+
+        hyperparams = hyperparams_class.defaults().replace({'continuity_option': 'ablation'})
+        primitive = ContinuityValidation.ContinuityValidationPrimitive(hyperparams=hyperparams)
+        new_main = primitive.produce(inputs=main.copy()).value
+        self.assertEqual(new_main['d3mIndex'].tolist(), list(range(6)))
+        self.assertEqual(new_main['timestamp'].tolist(), [0., 2., 4., 6., 8., 10.])
+        self._test_continuity(new_main)
+
 
     def _test_continuity(self, data_value):
         tmp_col = data_value['timestamp']
@@ -0,0 +1,63 @@
+import unittest
+
+from d3m import container
+
+from tods.data_processing import TimeSeriesIngestion, TimeStampValidation, DuplicationValidation, TimeIntervalTransform
+
+
+class TimeSeriesIngestionTest(unittest.TestCase):
+    def setUp(self):
+        self.main = container.DataFrame({'d3mIndex': [0, 1, 2, 3, 4, 5],
+                                         'timestamp': [1472918700, 1472918400, 1472918700, 1472919600, 1472919000, 1472919000],
+                                         'value': [1., 0., 3., 5., 2., 4.],
+                                         'ground_truth': [0, 0, 1, 0, 1, 0]},
+                                        columns=['d3mIndex', 'timestamp', 'value', 'ground_truth'],
+                                        generate_metadata=True)
+
+    def _chain(self, keep_option, time_interval):
+        primitive = TimeStampValidation.TimeStampValidationPrimitive(
+            hyperparams=TimeStampValidation.TimeStampValidationPrimitive.metadata.get_hyperparams().defaults())
+        outputs = primitive.produce(inputs=self.main.copy()).value
+
+        hyperparams_class = DuplicationValidation.DuplicationValidationPrimitive.metadata.get_hyperparams()
+        primitive = DuplicationValidation.DuplicationValidationPrimitive(
+            hyperparams=hyperparams_class.defaults().replace({'keep_option': keep_option}))
+        outputs = primitive.produce(inputs=outputs).value
+
+        if time_interval is None:
+            return outputs.reset_index(drop=True)
+
+        hyperparams_class = TimeIntervalTransform.TimeIntervalTransformPrimitive.metadata.get_hyperparams()
+        primitive = TimeIntervalTransform.TimeIntervalTransformPrimitive(
+            hyperparams=hyperparams_class.defaults().replace({'time_interval': time_interval}))
+        return primitive.produce(inputs=outputs).value
+
+    def test_matches_chain(self):
+        hyperparams_class = TimeSeriesIngestion.TimeSeriesIngestionPrimitive.metadata.get_hyperparams()
+        for keep_option in ['first', 'average']:
+            for time_interval in [None, '10T']:
+                primitive = TimeSeriesIngestion.TimeSeriesIngestionPrimitive(
+                    hyperparams=hyperparams_class.defaults().replace({'keep_option': keep_option,
+                                                                      'time_interval': time_interval}))
+                outputs = primitive.produce(inputs=self.main).value
+                expected = self._chain(keep_option, time_interval)
+
+                self.assertEqual(outputs.values.tolist(), expected.values.tolist())
+                self.assertEqual(list(outputs.columns), list(expected.columns))
+                self.assertEqual(outputs.metadata.query(())['dimension']['length'], len(expected))
+
+        # The inputs are left untouched
+        self.assertEqual(self.main['timestamp'].tolist()[:2], [1472918700, 1472918400])
+        self.assertEqual(self.main['value'].tolist(), [1., 0., 3., 5., 2., 4.])
+
+    def test_averages(self):
+        hyperparams_class = TimeSeriesIngestion.TimeSeriesIngestionPrimitive.metadata.get_hyperparams()
+        primitive = TimeSeriesIngestion.TimeSeriesIngestionPrimitive(
+            hyperparams=hyperparams_class.defaults().replace({'keep_option': 'average'}))
+        outputs = primitive.produce(inputs=self.main).value
+        self.assertEqual(outputs['timestamp'].tolist(), [1472918400, 1472918700, 1472919000, 1472919600])
+        self.assertEqual(outputs['value'].tolist(), [0., 2., 3., 5.])
+
+
+if __name__ == '__main__':
+    unittest.main()
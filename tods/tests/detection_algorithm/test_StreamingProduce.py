@@ -0,0 +1,81 @@
+import unittest
+
+from d3m.container import DataFrame as d3m_dataframe
+
+from tods.detection_algorithm.KDiscordODetect import KDiscordODetectorPrimitive
+from tods.detection_algorithm.AutoRegODetect import AutoRegODetectorPrimitive
+from tods.detection_algorithm.PyodIsolationForest import IsolationForestPrimitive
+
+import numpy as np
+
+
+class StreamingProduceTestCase(unittest.TestCase):
+    def setUp(self):
+        self.X_train = d3m_dataframe({'data': [3., 4., 8., 16, 18, 13., 22., 36., 59., 128, 62, 67, 78, 100]},
+                                      columns=['data'], generate_metadata=True)
+        self.test_values = [3., 4., 8.6, 13.4, 22.5, 17, 19.2, 36.1, 127, -23, 59.2, 61., 70.3, 12., 18.5, 90.]
+        self.X_test = d3m_dataframe({'data': self.test_values}, columns=['data'], generate_metadata=True)
+        self.chunks = [(0, 3), (3, 4), (4, 9), (9, 10), (10, 16)]
+
+    def _fit(self, primitive_class, **replace):
+        hyperparams_default = primitive_class.metadata.get_hyperparams().defaults()
+        hyperparams = hyperparams_default.replace({'window_size': 3, 'return_subseq_inds': True})
+        hyperparams = hyperparams.replace(replace)
+        primitive = primitive_class(hyperparams=hyperparams)
+        primitive.set_training_data(inputs=self.X_train)
+        primitive.fit()
+        return primitive
+
+    def _stream(self, primitive, score):
+        outputs = []
+        for start, end in self.chunks:
+            chunk = d3m_dataframe({'data': self.test_values[start:end]}, columns=['data'], generate_metadata=True)
+            if score:
+                outputs.append(primitive.partial_produce_score(inputs=chunk).value.values)
+            else:
+                outputs.append(primitive.partial_produce(inputs=chunk).value.values)
+        return np.concatenate(outputs, axis=0)
+
+    def _assert_matches_batch(self, primitive, complete_windows=False):
+        for score in [True, False]:
+            if score:
+                batch = primitive.produce_score(inputs=self.X_test).value.values
+            else:
+                batch = primitive.produce(inputs=self.X_test).value.values
+            # Padding entries of the batch output are not emitted by the stream.
+            batch = batch[batch[:, 2] > batch[:, 1]]
+            if complete_windows:
+                # Nor the rows whose window is cut by the end of the stream.
+                batch = batch[batch[:, 2] - batch[:, 1] == primitive.window_size]
+
+            primitive.reset_stream()
+            stream = self._stream(primitive, score)
+            np.testing.assert_allclose(stream, batch)
+
+    def test_point_detector(self):
+        primitive = self._fit(IsolationForestPrimitive)
+        self._assert_matches_batch(primitive, complete_windows=True)
+
+    def test_collective_detector(self):
+        primitive = self._fit(KDiscordODetectorPrimitive)
+        self._assert_matches_batch(primitive)
+
+    def test_collective_detector_step(self):
+        primitive = self._fit(KDiscordODetectorPrimitive, step_size=2)
+        self._assert_matches_batch(primitive)
+
+    def test_forecasting_detector(self):
+        primitive = self._fit(AutoRegODetectorPrimitive)
+        self._assert_matches_batch(primitive)
+
+    def test_fit_resets_stream(self):
+        primitive = self._fit(KDiscordODetectorPrimitive)
+        self._stream(primitive, True)
+        primitive._fitted = False
+        primitive.fit()
+        self.assertEqual(primitive._stream_seen, 0)
+        self.assertIsNone(primitive._stream_buffer)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+
+import numpy as np
+
+from tods.detection_algorithm.core.AutoRegOD import AutoRegOD
+from tods.detection_algorithm.core.utility import get_sub_matrices, iter_sub_matrices, batch_decision_function
+
+
+def _window_loop(X, window_size, step, flatten_order):
+    windows = [X[i: i + window_size, :] for i in range(0, len(X) - window_size + 1, step)]
+    return np.asarray([window.flatten(order=flatten_order) for window in windows])
+
+
+class SubMatricesTestCase(unittest.TestCase):
+    def setUp(self):
+        random_state = np.random.RandomState(42)
+        self.X_uni = random_state.rand(30, 1)
+        self.X_multi = random_state.rand(30, 3)
+
+    def test_flatten_matches_window_loop(self):
+        for X in [self.X_uni, self.X_multi, np.asfortranarray(self.X_multi)]:
+            for flatten_order in ['C', 'F']:
+                for step in [1, 2, 3]:
+                    X_sub, left_inds, right_inds = get_sub_matrices(X, 4, step, flatten_order=flatten_order)
+                    np.testing.assert_array_equal(X_sub, _window_loop(X, 4, step, flatten_order))
+                    np.testing.assert_array_equal(left_inds, np.arange(0, 27, step))
+                    np.testing.assert_array_equal(right_inds, np.arange(0, 27, step) + 4)
+
+    def test_views(self):
+        X_sub, _, _ = get_sub_matrices(self.X_uni, 4)
+        self.assertTrue(np.shares_memory(X_sub, self.X_uni))
+        self.assertFalse(X_sub.flags.writeable)
+
+        X_sub, _, _ = get_sub_matrices(self.X_multi, 4, flatten_order='C')
+        self.assertTrue(np.shares_memory(X_sub, self.X_multi))
+
+        X_sub, _, _ = get_sub_matrices(self.X_multi, 4, flatten=False)
+        self.assertEqual(X_sub.shape, (27, 4, 3))
+        self.assertTrue(np.shares_memory(X_sub, self.X_multi))
+
+    def test_batches(self):
+        X_sub, left_inds, right_inds = get_sub_matrices(self.X_multi, 4, 2)
+        batches = list(iter_sub_matrices(self.X_multi, 4, 2, batch_size=5))
+        self.assertEqual([len(batch[0]) for batch in batches], [5, 5, 4])
+        np.testing.assert_array_equal(np.concatenate([batch[0] for batch in batches]), X_sub)
+        np.testing.assert_array_equal(np.concatenate([batch[1] for batch in batches]), left_inds)
+        np.testing.assert_array_equal(np.concatenate([batch[2] for batch in batches]), right_inds)
+
+        scores, batch_left_inds, batch_right_inds = batch_decision_function(
+            lambda windows: windows.sum(axis=1), self.X_multi, 4, 2, batch_size=5)
+        np.testing.assert_allclose(scores, X_sub.sum(axis=1))
+        np.testing.assert_array_equal(batch_left_inds, left_inds)
+        np.testing.assert_array_equal(batch_right_inds, right_inds)
+
+    def test_autoreg_batches(self):
+        for step in [1, 2, 3]:
+            scores = AutoRegOD(window_size=4, step_size=step).fit(self.X_uni).decision_function(self.X_uni)
+            batch_scores = AutoRegOD(window_size=4, step_size=step, batch_size=5).fit(self.X_uni).decision_function(self.X_uni)
+            for expected, result in zip(scores, batch_scores):
+                np.testing.assert_allclose(result, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
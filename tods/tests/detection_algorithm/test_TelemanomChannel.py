@@ -0,0 +1,45 @@
+import unittest
+
+import numpy as np
+
+from tods.detection_algorithm.core.utils.channel import Channel
+
+
+def _loop_windows(arr, l_s, n_predictions):
+    data = np.array([arr[i:i + l_s + n_predictions] for i in range(len(arr) - l_s - n_predictions)])
+    X = data[:, :-n_predictions, :]
+    y = data[:, -n_predictions:, :]
+    return X, np.reshape(y, (y.shape[0], y.shape[1] * y.shape[2]))
+
+
+class TelemanomChannelTestCase(unittest.TestCase):
+    def setUp(self):
+        self.arr = np.random.RandomState(0).randn(120, 3)
+
+    def test_shape_data(self):
+        for l_s, n_predictions in [(10, 5), (1, 1), (20, 30)]:
+            channel = Channel(n_predictions=n_predictions, l_s=l_s)
+            channel.shape_train_data(self.arr)
+            channel.shape_test_data(self.arr)
+            X, y = _loop_windows(self.arr, l_s, n_predictions)
+            np.testing.assert_array_equal(channel.X_train, X)
+            np.testing.assert_array_equal(channel.y_train, y)
+            np.testing.assert_array_equal(channel.X_test, X)
+            np.testing.assert_array_equal(channel.y_test, y)
+            self.assertFalse(channel.X_test.flags.writeable)
+
+    def test_float32(self):
+        channel = Channel(n_predictions=5, l_s=10, dtype=np.float32)
+        channel.shape_test_data(self.arr)
+        X, y = _loop_windows(self.arr.astype(np.float32), 10, 5)
+        self.assertEqual(channel.X_test.dtype, np.float32)
+        np.testing.assert_array_equal(channel.X_test, X)
+        np.testing.assert_array_equal(channel.y_test, y)
+
+    def test_too_short(self):
+        with self.assertRaises(ValueError):
+            Channel(n_predictions=5, l_s=10).shape_test_data(self.arr[:15])
+
+
+if __name__ == '__main__':
+    unittest.main()
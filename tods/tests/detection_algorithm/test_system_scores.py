@@ -0,0 +1,52 @@
+import unittest
+
+import numpy as np
+
+from tods.detection_algorithm.core import system_scores
+
+
+def _loop_votes(systems, window_size, reduce):
+    max_time_points = max(len(system) for system in systems)
+    scores = []
+    for system in systems:
+        column_value = np.full(max_time_points, system[-1])
+        column_value[:len(system)] = system
+        scores.append([reduce(column_value[end - window_size + 1:end + 1])
+                       for end in range(window_size - 1, max_time_points)])
+    scores = np.asarray(scores)
+    return (scores == scores.max(axis=0)[None, :]).astype(int).sum(axis=1)
+
+
+class SystemScoresTest(unittest.TestCase):
+    def setUp(self):
+        random_state = np.random.RandomState(0)
+        # rounded scores and constant systems make ties between the windows
+        self.systems = [np.abs(np.round(random_state.randn(length), 1)) for length in random_state.randint(12, 40, 30)]
+        self.systems += [np.full(15, 1.), np.full(25, 1.)]
+        self.values = np.concatenate(self.systems)
+        self.offsets = np.concatenate([[0], np.cumsum([len(system) for system in self.systems])])
+
+    def test_segments(self):
+        np.testing.assert_array_equal(system_scores.segment_max(self.values, self.offsets),
+                                      [np.max(system) for system in self.systems])
+        np.testing.assert_array_equal(system_scores.segment_mean(self.values, self.offsets),
+                                      [np.mean(system) for system in self.systems])
+
+        scores, window_offsets = system_scores.window_scores(self.values, self.offsets, 5, 'sum')
+        for index, system in enumerate(self.systems):
+            np.testing.assert_array_equal(scores[window_offsets[index]:window_offsets[index + 1]],
+                                          [np.sum(system[end - 4:end + 1]) for end in range(4, len(system))])
+
+    def test_majority_votes(self):
+        for window_size in [1, 5, 13]:
+            np.testing.assert_array_equal(system_scores.majority_votes(self.values, self.offsets, window_size, 'sum'),
+                                          _loop_votes(self.systems, window_size, np.sum))
+            np.testing.assert_array_equal(system_scores.majority_votes(self.values, self.offsets, window_size, 'max'),
+                                          _loop_votes(self.systems, window_size, np.max))
+
+        with self.assertRaises(ValueError):
+            system_scores.majority_votes(self.values, self.offsets, 41, 'sum')
+
+
+if __name__ == '__main__':
+    unittest.main()
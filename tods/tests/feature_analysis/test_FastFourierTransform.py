@@ -127,6 +127,24 @@ class FftTestCase(unittest.TestCase):
             },
         }])
 
+    def test_columns(self):
+        main = container.DataFrame({'A': np.random.rand(20), 'B': np.random.rand(20), 'C': np.arange(20)},
+                                    columns=['A', 'B', 'C'], generate_metadata=True)
+
+        hyperparams_class = FastFourierTransform.FastFourierTransformPrimitive.metadata.get_hyperparams()
+        primitive = FastFourierTransform.FastFourierTransformPrimitive(hyperparams=hyperparams_class.defaults())
+        new_main = primitive._produce(inputs=main).value
+        self.assertEqual(list(new_main.columns), ['A_fft_abs', 'A_fft_phse', 'B_fft_abs', 'B_fft_phse', 'C_fft_abs', 'C_fft_phse'])
+        for column in ['A', 'B', 'C']:
+            tuples = [polar(i) for i in fft(main[column].values)]
+            np.testing.assert_allclose(new_main[column + '_fft_abs'].values, [i[0] for i in tuples])
+            np.testing.assert_allclose(new_main[column + '_fft_phse'].values, [i[1] for i in tuples], atol=1e-12)
+
+        primitive = FastFourierTransform.FastFourierTransformPrimitive(hyperparams=hyperparams_class.defaults().replace({'output_dtype': 'float32'}))
+        float32_main = primitive._produce(inputs=main).value
+        self.assertTrue(all(dtype == np.float32 for dtype in float32_main.dtypes))
+        np.testing.assert_allclose(float32_main['A_fft_abs'].values, new_main['A_fft_abs'].values, rtol=1e-4)
+
 
 if __name__ == '__main__':
     unittest.main()
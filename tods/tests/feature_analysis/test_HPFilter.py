@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+import statsmodels.api as sm
 from d3m import container, utils
 from d3m.metadata import base as metadata_base
 from tods.feature_analysis import HPFilter
@@ -143,6 +145,23 @@ class HPFilterTest(unittest.TestCase):
         }])
 
 
+    def test_banded(self):
+        values = np.cumsum(np.random.RandomState(0).randn(2000, 3), axis=0)
+        cycle, trend = HPFilter.hpfilter(values, lamb=1600)
+        for column in range(3):
+            expected_cycle, expected_trend = sm.tsa.filters.hpfilter(values[:, column], lamb=1600)
+            np.testing.assert_allclose(cycle[:, column], expected_cycle)
+            np.testing.assert_allclose(trend[:, column], expected_trend)
+
+        stream = HPFilter.StreamingHPFilter(lamb=1600)
+        streamed = np.empty_like(trend)
+        end = 0
+        for chunk in np.array_split(values, 40):
+            _, revised = stream.update(chunk)
+            end += len(chunk)
+            streamed[end - len(revised):end] = revised
+        np.testing.assert_allclose(streamed, trend, rtol=0, atol=1e-8 * np.abs(trend).max())
+
 
 if __name__ == '__main__':
     unittest.main()
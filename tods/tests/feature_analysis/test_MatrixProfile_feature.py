@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+import stumpy
 from d3m import container, utils
 from d3m.metadata import base as metadata_base
 from tods.feature_analysis.MatrixProfile import MatrixProfilePrimitive
@@ -97,6 +99,35 @@ class MatrixProfileTest(unittest.TestCase):
             'metadata': {'structural_type': 'numpy.float64', 'name': 'c'}
         }])
 
+    def test_incremental(self):
+        values = np.cumsum(np.random.RandomState(0).randn(230, 2), axis=0)
+        hyperparams_class = MatrixProfilePrimitive.metadata.get_hyperparams()
+        primitive = MatrixProfilePrimitive(hyperparams=hyperparams_class.defaults().replace({
+            'window_size': 8, 'incremental': True}))
+
+        for start, stop in [(0, 200), (0, 201), (3, 210), (30, 230)]:
+            main = container.DataFrame({'a': values[start:stop, 0], 'b': values[start:stop, 1]},
+                                       columns=['a', 'b'], generate_metadata=True)
+            outputs = primitive.produce(inputs=main).value
+            expected, _ = stumpy.mstump(values[start:stop].T, m=8)
+            self.assertEqual(outputs.shape, (stop - start, 2))
+            np.testing.assert_allclose(outputs.values[:stop - start - 7], expected.T, atol=1e-6)
+
+    def test_approximate(self):
+        values = np.cumsum(np.random.RandomState(0).randn(200, 2), axis=0)
+        main = container.DataFrame({'a': values[:, 0], 'b': values[:, 1]}, columns=['a', 'b'], generate_metadata=True)
+        expected, _ = stumpy.mstump(values.T, m=8)
+        hyperparams_class = MatrixProfilePrimitive.metadata.get_hyperparams()
+
+        for percentage in [1., 0.2]:
+            primitive = MatrixProfilePrimitive(hyperparams=hyperparams_class.defaults().replace({
+                'window_size': 8, 'approximate': True, 'percentage': percentage}))
+            outputs = primitive.produce(inputs=main).value.values[:193]
+            if percentage == 1.:
+                np.testing.assert_allclose(outputs, expected.T, atol=1e-6)
+            else:
+                self.assertTrue(np.all(outputs >= expected.T - 1e-6))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+
+import numpy as np
+from scipy import stats
+
+from tods.feature_analysis.core import rolling
+
+
+def _median_absolute_deviation(sequence):
+    if hasattr(stats, 'median_absolute_deviation'):
+        return stats.median_absolute_deviation(sequence)
+    return stats.median_abs_deviation(sequence, scale=1.4826)
+
+
+# Per-window reference implementations, as in the original primitive loops.
+REFERENCES = {
+    'mean': np.mean,
+    'vec_sum': np.sum,
+    'abs_sum': lambda sequence: np.sum(np.abs(sequence)),
+    'mean_abs': lambda sequence: np.mean(np.abs(sequence)),
+    'abs_energy': lambda sequence: np.round(np.sum(sequence * sequence), 4),
+    'maximum': np.max,
+    'minimum': np.min,
+    'median': np.median,
+    'std': np.std,
+    'var': np.var,
+    'skew': lambda sequence: round(stats.skew(sequence), 4),
+    'kurtosis': lambda sequence: round(stats.kurtosis(sequence), 4),
+    'gmean': lambda sequence: stats.gmean(sequence).round(4),
+    'hmean': lambda sequence: stats.hmean(sequence).round(4),
+    'variation': lambda sequence: stats.variation(sequence).round(4),
+    'median_absolute_deviation': lambda sequence: _median_absolute_deviation(sequence).round(4),
+    'mean_temporal_derivative': lambda sequence: np.mean(np.diff(sequence)),
+    'mean_abs_temporal_derivative': lambda sequence: np.mean(np.abs(np.diff(sequence))),
+}
+
+
+def _reference(values, window_size, function):
+    if window_size == -1:
+        window_size = len(values)
+    result = np.zeros(len(values))
+    for iter in range(window_size - 1, len(values)):
+        result[iter] = function(values[iter - window_size + 1:iter + 1])
+    result[:window_size - 1] = result[window_size - 1]
+    return result
+
+
+class RollingStatisticsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.values = np.random.RandomState(0).rand(500) + 0.5
+
+    def test_matches_window_loops(self):
+        for window_size in [2, 3, 17, 500, -1]:
+            for statistic, function in REFERENCES.items():
+                np.testing.assert_allclose(rolling.rolling_statistic(self.values, window_size, statistic),
+                                           _reference(self.values, window_size, function),
+                                           rtol=1e-12, atol=1e-12, err_msg=statistic)
+
+    def test_chunked_and_cumsum_paths(self):
+        chunk_size, min_window = rolling._CHUNK_SIZE, rolling._CUMSUM_MIN_WINDOW
+        rolling._CHUNK_SIZE, rolling._CUMSUM_MIN_WINDOW = 64, 8
+        try:
+            for window_size in [2, 9, 40]:
+                for statistic, function in REFERENCES.items():
+                    np.testing.assert_allclose(rolling.rolling_statistic(self.values, window_size, statistic),
+                                               _reference(self.values, window_size, function),
+                                               rtol=1e-10, atol=1e-10, err_msg=statistic)
+        finally:
+            rolling._CHUNK_SIZE, rolling._CUMSUM_MIN_WINDOW = chunk_size, min_window
+
+    def test_willison_amplitude(self):
+        indicator = (np.abs(np.diff(np.concatenate(([0.], self.values)))) > 0.3).astype(float)
+        np.testing.assert_array_equal(rolling.rolling_statistic(self.values, 4, 'willison_amplitude', threshold=0.3),
+                                      _reference(indicator, 4, np.sum))
+
+    def test_zero_crossing(self):
+        values = np.array([1.0, -2.0, -3.0, 0.0, 4.0, -1.0])
+        np.testing.assert_array_equal(rolling.zero_crossing(values), [0, 1, 0, 0, 0, 1])
+
+    def test_frame(self):
+        import pandas as pd
+        X = pd.DataFrame({'values': [1.0, 2.0, 3.0, 4.0], 'b': [1.0, 4.0, 5.0, 6.0]})
+        output = rolling.rolling_statistics_frame(X, 2, ['mean', 'maximum'])
+        self.assertEqual(list(output.columns), ['values_mean', 'values_maximum', 'b_mean', 'b_maximum'])
+        self.assertEqual(output['values_mean'].tolist(), [1.5, 1.5, 2.5, 3.5])
+        self.assertEqual(output['b_maximum'].tolist(), [4.0, 4.0, 5.0, 6.0])
+
+    def test_unknown_statistic(self):
+        with self.assertRaises(ValueError):
+            rolling.rolling_statistic(self.values, 3, 'entropy')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import unittest
+
+import numpy as np
+import pywt
+from scipy.fft import dct
+from d3m import container
+
+from tods.feature_analysis.core import spectral
+from tods.feature_analysis import FastFourierTransform, WaveletTransform
+
+
+def _reference_window(values, index, window_size, step_size):
+    start = max(index - window_size + 1, 0) // step_size * step_size
+    return values[start:start + window_size]
+
+
+def _reference_bands(spectrum, n_bands):
+    edges = np.linspace(0, len(spectrum), n_bands + 1).astype(int)
+    return [np.mean(spectrum[edges[band]:edges[band + 1]]) for band in range(n_bands)]
+
+
+class SpectralFeaturesTest(unittest.TestCase):
+    def setUp(self):
+        self.values = np.random.RandomState(0).randn(300)
+
+    def test_windowed_bands(self):
+        for window_size, step_size in [(32, 1), (32, 5), (17, 4)]:
+            fft_bands = spectral.windowed_fft_bands(self.values, window_size, step_size, n_bands=4)
+            dct_bands = spectral.windowed_dct_bands(self.values, window_size, step_size, n_bands=3)
+            self.assertEqual(fft_bands.shape, (300, 4))
+            self.assertEqual(dct_bands.shape, (300, 3))
+
+            for index in [0, window_size - 1, 150, 299]:
+                window = _reference_window(self.values, index, window_size, step_size)
+                np.testing.assert_allclose(fft_bands[index], _reference_bands(np.abs(np.fft.rfft(window)), 4))
+                np.testing.assert_allclose(dct_bands[index], _reference_bands(np.abs(dct(window)), 3))
+
+    def test_windowed_wavelet_energies(self):
+        energies = spectral.windowed_wavelet_energies(self.values, 32, 3, wavelet='db2')
+        level = pywt.dwt_max_level(32, pywt.Wavelet('db2').dec_len)
+        self.assertEqual(energies.shape, (300, level + 1))
+        window = _reference_window(self.values, 200, 32, 3)
+        np.testing.assert_allclose(energies[200], [np.sum(coeff ** 2) for coeff in pywt.wavedec(window, 'db2', level=level)])
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            spectral.windowed_fft_bands(self.values, 8, 1, n_bands=6)
+        with self.assertRaises(ValueError):
+            spectral.windowed_dct_bands(self.values, 400, 1, n_bands=2)
+
+    def test_primitives(self):
+        main = container.DataFrame({'A': self.values, 'B': self.values[::-1].copy()},
+                                    columns=['A', 'B'], generate_metadata=True)
+
+        hyperparams_class = FastFourierTransform.FastFourierTransformPrimitive.metadata.get_hyperparams()
+        primitive = FastFourierTransform.FastFourierTransformPrimitive(hyperparams=hyperparams_class.defaults().replace({
+            'window_size': 32, 'step_size': 2, 'n_bands': 4}))
+        outputs = primitive._produce(inputs=main).value
+        self.assertEqual(outputs.shape, (300, 8))
+        self.assertEqual(list(outputs.columns[:4]), ['A_fft_band0', 'A_fft_band1', 'A_fft_band2', 'A_fft_band3'])
+
+        hyperparams_class = WaveletTransform.WaveletTransformPrimitive.metadata.get_hyperparams()
+        primitive = WaveletTransform.WaveletTransformPrimitive(hyperparams=hyperparams_class.defaults().replace({
+            'wavelet': 'db2', 'window_size': 32}))
+        outputs = primitive._produce(inputs=main).value
+        level = pywt.dwt_max_level(32, pywt.Wavelet('db2').dec_len)
+        self.assertEqual(outputs.shape, (300, 2 * (level + 1)))
+        self.assertEqual(outputs.metadata.query_column(0)['name'], 'A_wavelet_energy0')
+
+
+if __name__ == '__main__':
+    unittest.main()
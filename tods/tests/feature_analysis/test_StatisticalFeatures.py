@@ -0,0 +1,53 @@
+import unittest
+
+from d3m import container, utils
+from d3m.metadata import base as metadata_base
+
+from tods.feature_analysis import StatisticalFeatures, StatisticalMean, StatisticalMaximum, StatisticalKurtosis
+
+class StatisticalFeaturesTestCase(unittest.TestCase):
+    def test_basic(self):
+        self.maxDiff=None
+        main = container.DataFrame({'timestamp': [1, 3, 2, 5, 7, 9], 'values': [1.0, 2.0, 3.0, 4.0, -1.0, 0.5], 'b': [1.0, 4.0, 5.0, 6.0, 2.0, 3.0]},
+                                   columns=['timestamp', 'values', 'b'],
+                                   generate_metadata=True)
+
+        hyperparams_class = StatisticalFeatures.StatisticalFeaturesPrimitive.metadata.get_hyperparams()
+        hp = hyperparams_class.defaults().replace({
+            'use_columns': [1,2],
+            'use_semantic_types' : True,
+            'window_size':3,
+            'statistics': ('mean', 'maximum', 'kurtosis'),
+        })
+        primitive = StatisticalFeatures.StatisticalFeaturesPrimitive(hyperparams=hp)
+        output_main = primitive._produce(inputs=main).value
+
+        self.assertEqual(list(output_main.columns),
+                         ['timestamp', 'values', 'b', 'values_mean', 'values_maximum', 'values_kurtosis',
+                          'b_mean', 'b_maximum', 'b_kurtosis'])
+        self.assertEqual(output_main['values_mean'].values.tolist(), [2.0, 2.0, 2.0, 3.0, 2.0, 1.1666666666666667])
+
+        # Same columns as the individual primitives
+        for module, primitive_class in [(StatisticalMean, StatisticalMean.StatisticalMeanPrimitive),
+                                        (StatisticalMaximum, StatisticalMaximum.StatisticalMaximumPrimitive),
+                                        (StatisticalKurtosis, StatisticalKurtosis.StatisticalKurtosisPrimitive)]:
+            single_hp = primitive_class.metadata.get_hyperparams().defaults().replace({
+                'use_columns': [1,2],
+                'use_semantic_types' : True,
+                'window_size':3,
+            })
+            single_output = primitive_class(hyperparams=single_hp)._produce(inputs=main).value
+            for column in single_output.columns[3:]:
+                self.assertEqual(output_main[column].values.tolist(), single_output[column].values.tolist())
+
+        self.assertEqual(utils.to_json_structure(output_main.metadata.query_column(3)),
+                         {'name': 'values_mean',
+                          'semantic_types': ['https://metadata.datadrivendiscovery.org/types/Attribute'],
+                          'structural_type': 'numpy.float64'})
+
+        params = primitive.get_params()
+        primitive.set_params(params=params)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 
+import numpy as np
 from d3m import container, utils
 from d3m.metadata import base as metadata_base
 from tods.feature_analysis import TRMF
@@ -117,6 +118,25 @@ class TRMFTest(unittest.TestCase):
         }])
 
 
+    def test_warm_start(self):
+        np.random.seed(0)
+        panel = np.cumsum(np.random.randn(1060, 30), axis=0) / 30
+
+        model = TRMF.trmf(lags=(1, 2), K=4, lambda_f=1., lambda_x=1., lambda_w=1., alpha=1000., eta=1.,
+                          tol=1e-3, warm_start=True)
+        model.fit(panel[:1000, :25])
+        cold_iter = model.n_iter_
+
+        # Appended timepoints and timeseries start from the previous factors
+        model.fit(panel[:, :30])
+        self.assertEqual(model.F.shape, (30, 4))
+        self.assertEqual(model.X.shape, (4, 1060))
+        self.assertLess(model.n_iter_, cold_iter / 2)
+
+        model = TRMF.trmf(lags=(1, 2), K=4, lambda_f=1., lambda_x=1., lambda_w=1., alpha=1000., eta=1., max_iter=10)
+        model.fit(panel[:100, :5])
+        self.assertEqual(model.n_iter_, 10)
+
 
 if __name__ == '__main__':
     unittest.main()
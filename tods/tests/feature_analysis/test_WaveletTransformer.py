@@ -130,6 +130,27 @@ class WaveletTransformerTestCase(unittest.TestCase):
         params = primitive.get_params()
         primitive.set_params(params=params)
 
+    def test_columns(self):
+        import pywt
+        from tods.feature_analysis.WaveletTransform import Wavelet
+
+        data = pd.DataFrame(np.random.RandomState(0).randn(200, 3), columns=['a', 'b', 'c'])
+        wavelet = Wavelet(wavelet='db2', level=None)
+        coeffs_buf = wavelet.transform_to_dataframe(data)
+
+        level = pywt.dwt_max_level(200, pywt.Wavelet('db2').dec_len)
+        self.assertEqual(list(coeffs_buf.columns), list(range(level + 1)) * 3)
+        for column_index, column in enumerate(data.columns):
+            coeffs = pywt.wavedec(data[column].values.copy(), 'db2', level=level)
+            for coeff_index, coeff in enumerate(coeffs):
+                output = coeffs_buf.iloc[:, column_index * (level + 1) + coeff_index].values
+                np.testing.assert_allclose(output[:len(coeff)], coeff)
+                self.assertTrue(np.isnan(output[len(coeff):]).all())
+
+        # The maximum level follows the length of the data
+        shorter = wavelet.transform_to_dataframe(data.iloc[:20])
+        self.assertEqual(shorter.shape[1], 3 * (pywt.dwt_max_level(20, pywt.Wavelet('db2').dec_len) + 1))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,41 @@
+import re
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from tods.reinforcement.core.rule import compile_rules
+
+
+def _eval_rows(X, rule):
+    rule = re.sub(r'#\d*#', lambda x: 'row[' + x.group(0).strip('#') + ']', rule)
+    return np.array([bool(eval(rule)) for row in X.to_numpy()])
+
+
+class RuleBasedFilterTest(unittest.TestCase):
+    def setUp(self):
+        random_state = np.random.RandomState(0)
+        self.X = pd.DataFrame({'a': random_state.randint(0, 10, 500), 'b': random_state.rand(500),
+                               'c': random_state.randn(500), 'd': random_state.randint(-3, 3, 500)})
+        self.X.iloc[::7, 2] = np.nan
+
+    def test_rules(self):
+        rules = ['#0# % 2 == 0 and #1# <= 0.3', 'not (#2# > 0 or #3# == 0)', '0 < #1# * 2 - #2# < 1.5',
+                 '#0# // 3 != #3# ** 2', '#3#', '-#2# >= +#1# and True']
+        for rule in rules:
+            np.testing.assert_array_equal(compile_rules(rule)(self.X)[:, 0], _eval_rows(self.X, rule))
+
+        results = compile_rules('; '.join(rules))(self.X)
+        self.assertEqual(results.shape, (500, len(rules)))
+        np.testing.assert_array_equal(results[:, 2], _eval_rows(self.X, rules[2]))
+        self.assertEqual(compile_rules('; '.join(rules)).columns, [0, 1, 2, 3])
+        self.assertIs(compile_rules(rules[0]), compile_rules(rules[0]))
+
+    def test_unsupported(self):
+        for rule in ['__import__("os")', '#1#.real', '#1# if #2# else 3', 'abs(#1#)', '#1# >', '']:
+            with self.assertRaises(ValueError):
+                compile_rules(rule)
+
+
+if __name__ == '__main__':
+    unittest.main()
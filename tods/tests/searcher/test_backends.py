@@ -0,0 +1,78 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from tods.searcher.backends import grid_search, resolve_grid_search, evaluate_in_process_pool, TrialAnalysis
+from tods.searcher.cache import StepCache, step_key
+
+
+class _PrefixSearcher():
+    """
+    Searcher whose trials compute a shared prefix step through the cache,
+    like produce_with_cache
+    """
+    def __init__(self, cache):
+        self.cache = cache
+
+    def _evaluate_config(self, config):
+        hits, misses = self.cache.hits, self.cache.misses
+        key = step_key('fingerprint', config['prefix'])
+        outputs = self.cache.get(key)
+        if outputs is None:
+            outputs = pd.DataFrame({'value': np.arange(10, dtype=float)})
+            self.cache.put(key, outputs)
+        eval_metric = {'cache_hits': self.cache.hits - hits, 'cache_misses': self.cache.misses - misses,
+                       'pid': os.getpid()}
+        return eval_metric, None, None
+
+
+class BackendsTest(unittest.TestCase):
+    def test_resolve_grid_search(self):
+        search_space = {
+            'timeseries_processing': grid_search([[['moving_average_transform']], [['standard_scaler']]]),
+            'detection_algorithm': [['pyod_loda', {'n_bins': grid_search([10, 15])}]],
+            'feature_analysis': [['statistical_maximum']],
+        }
+        configs = resolve_grid_search(search_space)
+        self.assertEqual(len(configs), 4)
+        self.assertIn({
+            'timeseries_processing': [['standard_scaler']],
+            'detection_algorithm': [['pyod_loda', {'n_bins': 15}]],
+            'feature_analysis': [['statistical_maximum']],
+        }, configs)
+        self.assertEqual(resolve_grid_search({'window_size': 3}), [{'window_size': 3}])
+
+    def test_trial_analysis(self):
+        configs = [{'detection_algorithm': [['pyod_loda']]}, {'detection_algorithm': [['pyod_ae']]}]
+        results = [{'F1_MACRO': 0.4, 'fitted_pipeline_id': 'a'}, {'F1_MACRO': 0.6, 'fitted_pipeline_id': 'b'}]
+        analysis = TrialAnalysis(configs, results)
+        self.assertEqual(analysis.get_best_config(metric='F1_MACRO', mode='max'), configs[1])
+        self.assertEqual(analysis.get_best_config(metric='F1_MACRO', mode='min'), configs[0])
+
+        df = analysis.dataframe(metric='F1_MACRO', mode='max')
+        self.assertEqual(list(df['fitted_pipeline_id']), ['a', 'b'])
+        self.assertEqual(df['config/detection_algorithm'][1], [['pyod_ae']])
+
+    def test_shared_cache(self):
+        cache_dir = tempfile.mkdtemp()
+        try:
+            searcher = _PrefixSearcher(StepCache(cache_dir=cache_dir))
+            configs = [{'prefix': 'feature_analysis.statistical_maximum', 'detection_algorithm': 'pyod_loda'},
+                       {'prefix': 'feature_analysis.statistical_maximum', 'detection_algorithm': 'pyod_ae'}]
+            # Every call runs its trial in a new worker process with its own copy of the cache
+            (first, _, _), = evaluate_in_process_pool(searcher, configs[:1], num_workers=2)
+            (second, _, _), = evaluate_in_process_pool(searcher, configs[1:], num_workers=2)
+            self.assertNotEqual(first['pid'], second['pid'])
+            self.assertEqual(first['cache_misses'], 1)
+            self.assertEqual(second['cache_hits'], 1)
+            self.assertEqual(second['cache_misses'], 0)
+        finally:
+            shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from tods.searcher.cache import StepCache, step_key, dataset_fingerprint
+
+
+def _frame(n):
+    return pd.DataFrame({'value': np.arange(n, dtype=float)})
+
+
+class StepCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.size = int(_frame(100).memory_usage(deep=True).sum())
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+    def test_hit_rate(self):
+        cache = StepCache()
+        self.assertIsNone(cache.get('a'))
+        cache.put('a', _frame(10))
+        pd.testing.assert_frame_equal(cache.get('a'), _frame(10))
+        cache.get('a')
+        stats = cache.stats()
+        self.assertEqual(stats['hits'], 2)
+        self.assertEqual(stats['misses'], 1)
+        self.assertAlmostEqual(stats['hit_rate'], 2 / 3)
+
+    def test_memory_eviction(self):
+        cache = StepCache(memory_limit=2 * self.size)
+        cache.put('a', _frame(100))
+        cache.put('b', _frame(100))
+        cache.get('a')
+        cache.put('c', _frame(100))
+        self.assertIn('a', cache)
+        self.assertNotIn('b', cache)
+        self.assertIn('c', cache)
+        self.assertEqual(cache.stats()['evictions'], 1)
+
+    def test_disk_write_through(self):
+        cache = StepCache(memory_limit=2 * self.size, cache_dir=self.cache_dir)
+        for key in ['a', 'b', 'c']:
+            cache.put(key, _frame(100))
+        self.assertEqual(sorted(os.listdir(self.cache_dir)), ['a.pkl', 'b.pkl', 'c.pkl'])
+        self.assertEqual(cache.stats()['memory_entries'], 2)
+        pd.testing.assert_frame_equal(cache.get('a'), _frame(100))
+        self.assertEqual(cache.stats()['disk_entries'], 3)
+        self.assertEqual(cache.stats()['evictions'], 0)
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_shared_disk(self):
+        # Caches of different processes share the outputs through cache_dir
+        writer = StepCache(cache_dir=self.cache_dir)
+        reader = pickle.loads(pickle.dumps(StepCache(cache_dir=self.cache_dir)))
+        self.assertIsNone(reader.get('a'))
+        writer.put('a', _frame(10))
+        self.assertIn('a', reader)
+        pd.testing.assert_frame_equal(reader.get('a'), _frame(10))
+        self.assertEqual(reader.stats()['hits'], 1)
+
+        os.remove(os.path.join(self.cache_dir, 'a.pkl'))
+        self.assertIsNone(StepCache(cache_dir=self.cache_dir).get('a'))
+
+    def test_disk_eviction(self):
+        cache = StepCache(memory_limit=self.size, cache_dir=self.cache_dir, disk_limit=1)
+        for key in ['a', 'b', 'c']:
+            cache.put(key, _frame(100))
+        self.assertEqual(os.listdir(self.cache_dir), [])
+        self.assertEqual(cache.stats()['evictions'], 3)
+
+    def test_keys(self):
+        self.assertEqual(step_key('x', 'feature_analysis.statistical_maximum', {'window_size': 3, 'use_semantic_types': True}),
+                         step_key('x', 'feature_analysis.statistical_maximum', {'use_semantic_types': True, 'window_size': 3}))
+        self.assertNotEqual(step_key('x', 'feature_analysis.statistical_maximum', {'window_size': 3}),
+                            step_key('y', 'feature_analysis.statistical_maximum', {'window_size': 3}))
+        self.assertEqual(step_key('x', 'data_processing.column_parser'),
+                         step_key('x', 'data_processing.column_parser', {}))
+        self.assertEqual(dataset_fingerprint(_frame(5)), dataset_fingerprint(_frame(5)))
+        self.assertNotEqual(dataset_fingerprint(_frame(5)), dataset_fingerprint(_frame(6)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import shutil
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+from tods.utils import save_fitted_pipeline, FittedPipelineRegistry
+
+
+def _runtime(pipeline_id, size):
+    return SimpleNamespace(pipeline=SimpleNamespace(id=pipeline_id),
+                           steps_state=[None, {'left_inds_': np.zeros(size // 8)}])
+
+
+class FittedPipelineRegistryTest(unittest.TestCase):
+    def setUp(self):
+        self.save_path = tempfile.mkdtemp() + '/'
+        for pipeline_id in ['a', 'b', 'c']:
+            save_fitted_pipeline({'runtime': _runtime(pipeline_id, 800), 'dataset_metadata': None}, self.save_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.save_path, ignore_errors=True)
+
+    def test_hits_and_misses(self):
+        registry = FittedPipelineRegistry(save_path=self.save_path)
+        first = registry.get('a')
+        self.assertIs(registry.get('a'), first)
+        registry.get('b')
+
+        stats = registry.stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 2)
+        self.assertEqual(stats['pipelines'], 2)
+        self.assertGreater(stats['load_time'], 0.)
+
+        registry.evict('a')
+        self.assertNotIn('a', registry)
+        registry.clear()
+        self.assertEqual(len(registry), 0)
+        self.assertEqual(registry.stats()['misses'], 0)
+
+    def test_count_eviction(self):
+        registry = FittedPipelineRegistry(max_pipelines=2, save_path=self.save_path)
+        registry.get('a')
+        registry.get('b')
+        registry.get('a')
+        registry.get('c')
+        self.assertIn('a', registry)
+        self.assertNotIn('b', registry)
+        self.assertIn('c', registry)
+        self.assertEqual(registry.stats()['evictions'], 1)
+
+    def test_memory_eviction(self):
+        # Saved arrays are memory-mapped and not counted
+        registry = FittedPipelineRegistry(max_memory=1, save_path=self.save_path)
+        registry.get('a')
+        registry.get('b')
+        self.assertEqual(registry.memory(), 0)
+        self.assertEqual(len(registry), 2)
+
+        registry = FittedPipelineRegistry(max_memory=1000, save_path=self.save_path, mmap_mode=None)
+        registry.get('a')
+        self.assertEqual(registry.memory(), 800)
+        registry.get('b')
+        registry.get('c')
+        self.assertEqual(len(registry), 1)
+        self.assertIn('c', registry)
+        self.assertEqual(registry.stats()['evictions'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
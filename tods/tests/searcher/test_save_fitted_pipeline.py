@@ -0,0 +1,76 @@
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from types import SimpleNamespace
+
+import numpy as np
+
+from tods.utils import save_fitted_pipeline, load_fitted_pipeline, LazyModel, FITTED_PIPELINE_FORMAT_VERSION
+
+
+class FakeModel():
+    def save(self, path):
+        with open(path, 'w') as f:
+            f.write('model')
+
+
+# Saved like a Keras model
+FakeModel.__module__ = 'keras.engine.functional'
+
+
+class FakeDetector():
+    def __init__(self):
+        self.decision_scores_ = np.arange(10, dtype=np.float64)
+        self.threshold_ = 0.5
+        self.labels_ = np.array(['a', 'b'], dtype=object)
+        self.model_ = FakeModel()
+
+
+class SaveFittedPipelineTest(unittest.TestCase):
+    def setUp(self):
+        self.save_path = tempfile.mkdtemp() + '/'
+        self.detector = FakeDetector()
+        self.runtime = SimpleNamespace(pipeline=SimpleNamespace(id='fitted-pipeline'),
+                                       steps_state=[None, {'left_inds_': np.arange(4), 'clf_': self.detector}])
+
+    def tearDown(self):
+        shutil.rmtree(self.save_path, ignore_errors=True)
+
+    def test_layout(self):
+        pipeline_id = save_fitted_pipeline({'runtime': self.runtime, 'dataset_metadata': 'metadata'}, self.save_path)
+        pipeline_dir = os.path.join(self.save_path, pipeline_id)
+
+        with open(os.path.join(pipeline_dir, 'format.json')) as f:
+            layout = json.load(f)
+        self.assertEqual(layout['format_version'], FITTED_PIPELINE_FORMAT_VERSION)
+        self.assertEqual([model['path'] for model in layout['models']], [['clf_', 'model_']])
+        self.assertEqual(sorted(array['path'] for array in layout['arrays']),
+                         [['clf_', 'decision_scores_'], ['left_inds_']])
+
+        # The fitted pipeline given to save is left untouched
+        self.assertIsInstance(self.detector.model_, FakeModel)
+        np.testing.assert_array_equal(self.runtime.steps_state[1]['left_inds_'], np.arange(4))
+
+    def test_load(self):
+        pipeline_id = save_fitted_pipeline({'runtime': self.runtime, 'dataset_metadata': 'metadata'}, self.save_path)
+        fitted_pipeline = load_fitted_pipeline(pipeline_id, self.save_path)
+
+        self.assertIsNone(fitted_pipeline['dataset_metadata'])
+        params = fitted_pipeline['runtime'].steps_state[1]
+        self.assertIsInstance(params['left_inds_'], np.memmap)
+        np.testing.assert_array_equal(params['left_inds_'], np.arange(4))
+        np.testing.assert_array_equal(params['clf_'].decision_scores_, np.arange(10))
+        np.testing.assert_array_equal(params['clf_'].labels_, ['a', 'b'])
+        self.assertEqual(params['clf_'].threshold_, 0.5)
+
+        self.assertIsInstance(params['clf_'].model_, LazyModel)
+        self.assertFalse(params['clf_'].model_.loaded)
+
+        fitted_pipeline = load_fitted_pipeline(pipeline_id, self.save_path, mmap_mode=None)
+        self.assertNotIsInstance(fitted_pipeline['runtime'].steps_state[1]['left_inds_'], np.memmap)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import unittest
+
+from tods.searcher.successive_halving import halving_fractions, slice_length, promote, estimate_exhaustive_cpu_time
+
+
+class SuccessiveHalvingTest(unittest.TestCase):
+    def test_halving_fractions(self):
+        fractions = halving_fractions(1. / 9, 3)
+        self.assertEqual(len(fractions), 3)
+        self.assertAlmostEqual(fractions[0], 1. / 9)
+        self.assertAlmostEqual(fractions[1], 1. / 3)
+        self.assertEqual(fractions[-1], 1.)
+        self.assertEqual(halving_fractions(1., 3), [1.])
+        self.assertEqual(len(halving_fractions(0.2, 2)), 3)
+
+        with self.assertRaises(ValueError):
+            halving_fractions(0., 3)
+        with self.assertRaises(ValueError):
+            halving_fractions(0.5, 1)
+
+    def test_slice_length(self):
+        self.assertEqual(slice_length(100, 1. / 9), 12)
+        self.assertEqual(slice_length(100, 0.01, min_samples=10), 10)
+        self.assertEqual(slice_length(5, 0.5, min_samples=10), 5)
+
+    def test_promote(self):
+        scores = [0.2, 0.9, 0.5, 0.7, 0.1, 0.3]
+        self.assertEqual(promote(scores, 'max', 3), [1, 3])
+        self.assertEqual(promote(scores, 'min', 3), [4, 0])
+        self.assertEqual(promote(scores, 'max', 4), [1, 3])
+        self.assertEqual(promote([0.5], 'max', 3), [0])
+
+    def test_estimate_exhaustive_cpu_time(self):
+        cpu_times = {0: 1., 1: 3., 2: 9.}
+        fractions = {0: 1. / 9, 1: 1. / 3, 2: 1.}
+        self.assertAlmostEqual(estimate_exhaustive_cpu_time(cpu_times, fractions), 27.)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import numpy as np
+import unittest
+
+from d3m import utils
+from tods.sk_interface.base import to_container
+from tods.sk_interface.detection_algorithm.IsolationForest_skinterface import IsolationForestSKI
+from tods.sk_interface.detection_algorithm.KDiscordODetector_skinterface import KDiscordODetectorSKI
+
+
+class BaseSKI_TestCase(unittest.TestCase):
+    def setUp(self):
+        random_state = np.random.RandomState(42)
+        self.system_num = 3
+        self.X_train = [random_state.rand(100, 2) for _ in range(self.system_num)]
+        self.X_test = [random_state.rand(50, 2) for _ in range(self.system_num)]
+
+    def test_to_container(self):
+        for X in [np.random.rand(5, 3), np.arange(6).reshape(3, 2)]:
+            generated = to_container(X, generate_metadata=True)
+            fast = to_container(X, generate_metadata=False)
+            self.assertEqual(utils.to_json_structure(fast.metadata.to_internal_simple_structure()),
+                             utils.to_json_structure(generated.metadata.to_internal_simple_structure()))
+            np.testing.assert_array_equal(fast.values, generated.values)
+
+    def test_parallel_matches_serial(self):
+        for ski_class in [IsolationForestSKI, KDiscordODetectorSKI]:
+            serial = ski_class(system_num=self.system_num)
+            parallel = ski_class(system_num=self.system_num, system_n_jobs=2)
+            serial.fit(self.X_train)
+            parallel.fit(self.X_train)
+
+            for method in ['predict', 'predict_score']:
+                serial_output = getattr(serial, method)(self.X_test)
+                parallel_output = getattr(parallel, method)(self.X_test)
+                self.assertEqual(len(parallel_output), self.system_num)
+                for sys_idx in range(self.system_num):
+                    self.assertEqual(parallel_output[sys_idx].shape, serial_output[sys_idx].shape)
+                    if ski_class is KDiscordODetectorSKI:
+                        np.testing.assert_allclose(parallel_output[sys_idx], serial_output[sys_idx])
+
+
+if __name__ == '__main__':
+    unittest.main()
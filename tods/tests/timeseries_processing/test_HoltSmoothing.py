@@ -5,7 +5,9 @@ from d3m.metadata import base as metadata_base
 
 
 from tods.timeseries_processing import HoltSmoothing
+import numpy as np
 import pandas as pd
+from statsmodels.tsa.api import Holt
 
 
 class HoltSmoothingTestCase(unittest.TestCase):
@@ -60,6 +62,15 @@ class HoltSmoothingTestCase(unittest.TestCase):
         params = primitive.get_params()
         primitive.set_params(params=params)
 
+    def test_closed_form(self):
+        data = pd.DataFrame(np.cumsum(np.random.RandomState(0).randn(200, 3), axis=0))
+        for smoothing_level, smoothing_slope in [(0.2, 0.2), (0.5, 0.1), (0.9, 0.7)]:
+            smoothed = HoltSmoothing.holt_smoothing(data, smoothing_level=smoothing_level, smoothing_slope=smoothing_slope)
+            for column in range(3):
+                expected = Holt(data[column]).fit(smoothing_level=smoothing_level, smoothing_slope=smoothing_slope,
+                                                  optimized=False).fittedvalues
+                np.testing.assert_allclose(smoothed[:, column], expected)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -5,7 +5,9 @@ from d3m.metadata import base as metadata_base
 
 
 from tods.timeseries_processing import SimpleExponentialSmoothing
+import numpy as np
 import pandas as pd
+from statsmodels.tsa.api import SimpleExpSmoothing
 
 
 class SimpleExponentialSmoothingTestCase(unittest.TestCase):
@@ -58,6 +60,20 @@ class SimpleExponentialSmoothingTestCase(unittest.TestCase):
         params = primitive.get_params()
         primitive.set_params(params=params)
 
+    def test_closed_form(self):
+        data = pd.DataFrame(np.cumsum(np.random.RandomState(0).randn(200, 3), axis=0))
+        for smoothing_level in [0.2, 0.6, 1.]:
+            smoothed = SimpleExponentialSmoothing.simple_exponential_smoothing(data, smoothing_level=smoothing_level)
+            for column in range(3):
+                expected = SimpleExpSmoothing(data[column]).fit(smoothing_level=smoothing_level, optimized=False).fittedvalues
+                np.testing.assert_allclose(smoothed[:, column], expected)
+
+        # Optimized smoothing levels are fitted per column on the workers, in the column order
+        optimized = SimpleExponentialSmoothing.simple_exponential_smoothing(data, optimized=True, n_jobs=2)
+        for column in range(3):
+            expected = SimpleExpSmoothing(data[column]).fit(optimized=True).fittedvalues
+            np.testing.assert_allclose(optimized[:, column], expected)
+
 
 if __name__ == '__main__':
     unittest.main()
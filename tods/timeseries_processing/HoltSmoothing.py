@@ -11,6 +11,7 @@ import pandas as pd
 # Custom import commands if any
 from sklearn.preprocessing import Normalizer
 from statsmodels.tsa.api import ExponentialSmoothing, SimpleExpSmoothing, Holt
+from scipy.signal import lfilter
 
 
 from d3m.container.numpy import ndarray as d3m_ndarray
@@ -30,12 +31,13 @@ from d3m.metadata import base as metadata_base
 from d3m.metadata import hyperparams,params
 from d3m.primitive_interfaces import base, transformer
 
-__all__ = ('HoltSmoothingPrimitive',)
+__all__ = ('HoltSmoothingPrimitive', 'holt_smoothing')
 
 Inputs = d3m_dataframe
 Outputs = d3m_dataframe
 
 from tods.utils import construct_primitive_metadata
+from tods.common.parallel import map_columns
 class Params(params.Params):
     input_column_names: Optional[Any]
     target_names_: Optional[Sequence[Any]]
@@ -54,6 +56,32 @@ class Hyperparams(hyperparams.Hyperparams):
         description='Array like time series.',
         semantic_types=['https://metadata.datadrivendiscovery.org/types/TuningParameter']
     )
+    smoothing_level = hyperparams.Uniform(
+        lower=0.,
+        upper=1.,
+        default=0.2,
+        upper_inclusive=True,
+        description='The smoothing level, the alpha value of the level.',
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/TuningParameter']
+    )
+    smoothing_slope = hyperparams.Uniform(
+        lower=0.,
+        upper=1.,
+        default=0.2,
+        upper_inclusive=True,
+        description='The smoothing slope, the beta value of the trend.',
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/TuningParameter']
+    )
+    optimized = hyperparams.UniformBool(
+        default=False,
+        description='Estimate the smoothing level and slope by maximizing the log-likelihood instead of using smoothing_level and smoothing_slope.',
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/TuningParameter']
+    )
+    n_jobs = hyperparams.Hyperparameter[int](
+        default=1,
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/ResourcesUseParameter'],
+        description='Number of worker processes fitting the columns, -1 uses all the CPU cores and 1 fits them one after another.',
+    )
     # keep previous
     norm = hyperparams.Enumeration[str](
         default='l2',
@@ -104,6 +132,54 @@ class Hyperparams(hyperparams.Hyperparams):
         semantic_types=['https://metadata.datadrivendiscovery.org/types/ControlParameter']
     )
 
+def _fit_holt_smoothing(column, smoothing_level, smoothing_slope, optimized):
+    return Holt(column).fit(smoothing_level=smoothing_level, smoothing_slope=smoothing_slope, optimized=optimized).fittedvalues
+
+
+def holt_smoothing(X, smoothing_level=0.2, smoothing_slope=0.2, optimized=False, n_jobs=1):
+    """
+    Fitted values of the Holt smoothing of every column.
+
+    With fixed smoothing parameters the one step forecasts follow a second
+    order linear recurrence, evaluated as a linear filter for all the columns
+    at once from the initial level and slope of statsmodels, the first value
+    and the first difference. Optimized parameters are estimated by fitting a
+    statsmodels model per column on n_jobs workers.
+
+    Args:
+        X: DataFrame
+        smoothing_level: The alpha value of the level
+        smoothing_slope: The beta value of the trend
+        optimized: Estimate the smoothing parameters
+        n_jobs: Number of workers fitting the columns
+
+    Returns:
+        ndarray of shape (n_samples, n_columns)
+    """
+    if optimized:
+        return numpy.column_stack(map_columns(_fit_holt_smoothing, X, n_jobs=n_jobs, smoothing_level=smoothing_level,
+                                              smoothing_slope=smoothing_slope, optimized=optimized))
+
+    values = X.to_numpy(dtype=numpy.float64)
+    if values.shape[0] < 2:
+        raise ValueError("Holt smoothing needs at least 2 samples, got {}.".format(values.shape[0]))
+
+    alpha, beta = smoothing_level, smoothing_slope
+    fitted = numpy.empty_like(values)
+    level, slope = values[0], values[1] - values[0]
+    fitted[0] = level + slope
+    next_level = alpha * values[0] + (1. - alpha) * fitted[0]
+    fitted[1] = next_level + beta * (next_level - level) + (1. - beta) * slope
+
+    if values.shape[0] > 2:
+        # f[t + 1] = (2 - a(1 + b)) f[t] - (1 - a) f[t - 1] + a(1 + b) y[t] - a y[t - 1]
+        b = [alpha * (1. + beta), -alpha]
+        a = [1., alpha * (1. + beta) - 2., 1. - alpha]
+        zi = numpy.stack([b[1] * values[0] - a[1] * fitted[1] - a[2] * fitted[0], -a[2] * fitted[1]])
+        fitted[2:] = lfilter(b, a, values[1:-1], axis=0, zi=zi)[0]
+    return fitted
+
+
 class HoltSmoothingPrimitive(UnsupervisedLearnerPrimitiveBase[Inputs, Outputs, Params, Hyperparams]):
     """
     Holt Smoothing
@@ -113,6 +189,14 @@ class HoltSmoothingPrimitive(UnsupervisedLearnerPrimitiveBase[Inputs, Outputs, P
     ----------
     endog :Bounded[int]
         Array like time series.'
+    smoothing_level :float
+        The smoothing level, the alpha value of the level.
+    smoothing_slope :float
+        The smoothing slope, the beta value of the trend.
+    optimized :bool
+        Estimate the smoothing level and slope instead of using smoothing_level and smoothing_slope.
+    n_jobs :int
+        Number of worker processes fitting the columns when optimized.
     
     """
     
@@ -178,8 +262,12 @@ class HoltSmoothingPrimitive(UnsupervisedLearnerPrimitiveBase[Inputs, Outputs, P
                columns_to_calculate_holt_smoothing = list(set(inputs.columns)-set(['d3mIndex','timestamp','ground_truth']))
            else:
                columns_to_calculate_holt_smoothing = self.hyperparams['use_columns']
-           for column in self._training_indices:
-               outputs[inputs.columns[column]+"_holt_smoothing"] = Holt(inputs.iloc[:, column]).fit(smoothing_level=0.2, smoothing_slope=0.2,optimized=False).fittedvalues
+           smoothed = holt_smoothing(inputs.iloc[:, self._training_indices],
+                                     smoothing_level=self.hyperparams['smoothing_level'],
+                                     smoothing_slope=self.hyperparams['smoothing_slope'],
+                                     optimized=self.hyperparams['optimized'],
+                                     n_jobs=self.hyperparams['n_jobs'])
+           outputs[[inputs.columns[column]+"_holt_smoothing" for column in self._training_indices]] = smoothed
         except Exception as e:
                self.logger.error("Error in Calculating Holt smoothing",e)
         self._update_metadata(outputs)
@@ -35,6 +35,7 @@ __all__ = ('HoltWintersExponentialSmoothingPrimitive',)
 Inputs = d3m_dataframe
 Outputs = d3m_dataframe
 from tods.utils import construct_primitive_metadata
+from tods.common.parallel import map_columns
 
 class Params(params.Params):
     input_column_names: Optional[Any]
@@ -54,6 +55,11 @@ class Hyperparams(hyperparams.Hyperparams):
         description='Array like time seires.',
         semantic_types=['https://metadata.datadrivendiscovery.org/types/TuningParameter']
     )
+    n_jobs = hyperparams.Hyperparameter[int](
+        default=1,
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/ResourcesUseParameter'],
+        description='Number of worker processes fitting the columns, -1 uses all the CPU cores and 1 fits them one after another.',
+    )
     # keep previous
     norm = hyperparams.Enumeration[str](
         default='l2',
@@ -103,6 +109,10 @@ class Hyperparams(hyperparams.Hyperparams):
         semantic_types=['https://metadata.datadrivendiscovery.org/types/ControlParameter']
     )
 
+def _fit_holt_winters_smoothing(column):
+    return ExponentialSmoothing(column, seasonal_periods=3, trend='add', seasonal='add').fit(use_boxcox=False).fittedvalues
+
+
 class HoltWintersExponentialSmoothingPrimitive(UnsupervisedLearnerPrimitiveBase[Inputs, Outputs, Params, Hyperparams]):
     """
     HoltWinter Exponential Smoothing
@@ -112,6 +122,8 @@ class HoltWintersExponentialSmoothingPrimitive(UnsupervisedLearnerPrimitiveBase[
     ----------
     endog :Bounded[int]
         Array like time seires.
+    n_jobs :int
+        Number of worker processes fitting the columns, -1 uses all the CPU cores.
     
     """
     
@@ -177,8 +189,10 @@ class HoltWintersExponentialSmoothingPrimitive(UnsupervisedLearnerPrimitiveBase[
                columns_to_calculate_holt_winters_exponential_smoothing = list(set(inputs.columns)-set(['d3mIndex','timestamp','ground_truth']))
            else:
                columns_to_calculate_holt_winters_exponential_smoothing = self.hyperparams['use_columns']
-           for column in self._training_indices:              
-               outputs[inputs.columns[column]+"_holt_winters_smoothing"] = ExponentialSmoothing(inputs.iloc[:, column], seasonal_periods=3, trend = 'add', seasonal='add').fit(use_boxcox=False).fittedvalues
+           smoothed = map_columns(_fit_holt_winters_smoothing, inputs.iloc[:, self._training_indices],
+                                  n_jobs=self.hyperparams['n_jobs'])
+           for column, fittedvalues in zip(self._training_indices, smoothed):
+               outputs[inputs.columns[column]+"_holt_winters_smoothing"] = fittedvalues
         except Exception as e:
                self.logger.error("Error in Calculating Holt Winters smoothing",e)
         self._update_metadata(outputs)
@@ -10,6 +10,7 @@ import pandas as pd
 # Custom import commands if any
 from sklearn.preprocessing import Normalizer
 from statsmodels.tsa.api import ExponentialSmoothing, SimpleExpSmoothing, Holt
+from scipy.signal import lfilter
 import uuid
 
 
@@ -34,11 +35,12 @@ from d3m.primitive_interfaces import base, transformer
 
 
 
-__all__ = ('SimpleExponentialSmoothingPrimitive',)
+__all__ = ('SimpleExponentialSmoothingPrimitive', 'simple_exponential_smoothing')
 Inputs = d3m_dataframe
 # Inputs = container.Dataset
 Outputs = d3m_dataframe
 from tods.utils import construct_primitive_metadata
+from tods.common.parallel import map_columns
 
 class Params(params.Params):
     input_column_names: Optional[Any]
@@ -59,6 +61,25 @@ class Hyperparams(hyperparams.Hyperparams):
         semantic_types=['https://metadata.datadrivendiscovery.org/types/TuningParameter']
     )
 
+    smoothing_level = hyperparams.Uniform(
+        lower=0.,
+        upper=1.,
+        default=0.2,
+        upper_inclusive=True,
+        description='The smoothing level, the alpha value of the level.',
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/TuningParameter']
+    )
+    optimized = hyperparams.UniformBool(
+        default=False,
+        description='Estimate the smoothing level by maximizing the log-likelihood instead of using smoothing_level.',
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/TuningParameter']
+    )
+    n_jobs = hyperparams.Hyperparameter[int](
+        default=1,
+        semantic_types=['https://metadata.datadrivendiscovery.org/types/ResourcesUseParameter'],
+        description='Number of worker processes fitting the columns, -1 uses all the CPU cores and 1 fits them one after another.',
+    )
+
 # Keep previous
     norm = hyperparams.Enumeration[str](
         default='l2',
@@ -108,6 +129,41 @@ class Hyperparams(hyperparams.Hyperparams):
         semantic_types=['https://metadata.datadrivendiscovery.org/types/ControlParameter']
     )
 
+def _fit_simple_exponential_smoothing(column, smoothing_level, optimized):
+    return SimpleExpSmoothing(column).fit(smoothing_level=smoothing_level, optimized=optimized).fittedvalues
+
+
+def simple_exponential_smoothing(X, smoothing_level=0.2, optimized=False, n_jobs=1):
+    """
+    Fitted values of the simple exponential smoothing of every column.
+
+    With a fixed smoothing level the level recurrence, starting from the first
+    value like statsmodels, is a linear filter evaluated for all the columns at
+    once. An optimized smoothing level is estimated by fitting a statsmodels
+    model per column on n_jobs workers.
+
+    Args:
+        X: DataFrame
+        smoothing_level: The alpha value of the level
+        optimized: Estimate the smoothing level
+        n_jobs: Number of workers fitting the columns
+
+    Returns:
+        ndarray of shape (n_samples, n_columns)
+    """
+    if optimized:
+        return numpy.column_stack(map_columns(_fit_simple_exponential_smoothing, X, n_jobs=n_jobs,
+                                              smoothing_level=smoothing_level, optimized=optimized))
+
+    values = X.to_numpy(dtype=numpy.float64)
+    fitted = numpy.empty_like(values)
+    fitted[:1] = values[:1]
+    if values.shape[0] > 1:
+        alpha = smoothing_level
+        fitted[1:] = lfilter([alpha], [1., alpha - 1.], values[:-1], axis=0, zi=(1. - alpha) * values[:1])[0]
+    return fitted
+
+
 class SimpleExponentialSmoothingPrimitive(UnsupervisedLearnerPrimitiveBase[Inputs, Outputs, Params, Hyperparams]):
     """
     Primitive wrapping for simple exponential smoothing
@@ -117,6 +173,12 @@ Parameters
 ----------
     endog :int (lower = 2, upper = None, default = 3)
         Array like time series
+    smoothing_level :float (default = 0.2)
+        The smoothing level, the alpha value of the level
+    optimized :bool (default = False)
+        Estimate the smoothing level instead of using smoothing_level
+    n_jobs :int (default = 1)
+        Number of worker processes fitting the columns when optimized
     
     """
     
@@ -182,14 +244,16 @@ Parameters
                columns_to_calculate_simple_exponential_smoothing = list(set(inputs.columns)-set(['d3mIndex','timestamp','ground_truth']))
            else:
                columns_to_calculate_simple_exponential_smoothing = self.hyperparams['use_columns']
-           for column in self._training_indices:
-               outputs[inputs.columns[column]+"_simple_exponential_smoothing"] = SimpleExpSmoothing(inputs.iloc[:, column]).fit(smoothing_level=0.2,optimized=False).fittedvalues
+           smoothed = simple_exponential_smoothing(inputs.iloc[:, self._training_indices],
+                                                   smoothing_level=self.hyperparams['smoothing_level'],
+                                                   optimized=self.hyperparams['optimized'],
+                                                   n_jobs=self.hyperparams['n_jobs'])
+           outputs[[inputs.columns[column]+"_simple_exponential_smoothing" for column in self._training_indices]] = smoothed
         except Exception as e:
                self.logger.error("Error in Calculating simple exponential smoothing",e)
         self._update_metadata(outputs)
         #print(inputs)
         #print("-------------")
-        print(outputs)
 
         return base.CallResult(outputs)     
        
@@ -28,6 +28,7 @@ __all__ = ('TimeSeriesSeasonalityTrendDecompositionPrimitive',)
 Inputs = container.DataFrame
 Outputs = container.DataFrame
 from tods.utils import construct_primitive_metadata
+from tods.common.parallel import map_columns
 class Params(params.Params):
        #to-do : how to make params dynamic
        use_column_names: Optional[Any]
@@ -43,6 +44,12 @@ class Hyperparams(hyperparams.Hyperparams):
            'https://metadata.datadrivendiscovery.org/types/ControlParameter',
        ], description="Window Size for decomposition")
 
+       n_jobs = hyperparams.Hyperparameter[int](
+           default=1,
+           semantic_types=['https://metadata.datadrivendiscovery.org/types/ResourcesUseParameter'],
+           description='Number of worker processes decomposing the columns, -1 uses all the CPU cores and 1 decomposes them one after another.',
+       )
+
        use_columns = hyperparams.Set(
            elements=hyperparams.Hyperparameter[int](-1),
            default=(),
@@ -86,6 +93,18 @@ class Hyperparams(hyperparams.Hyperparams):
        )
 
 
+def _decompose_column(column, model, period):
+    decomposed_components = sm.tsa.seasonal_decompose(column, model=model,
+                                                      period=period,two_sided=False)
+    if (period > 1):
+        decomposed_components.trend[0:int(period / 2)] = decomposed_components.trend[int(period / 2)]
+        decomposed_components.trend[
+        len(decomposed_components.trend) - int(period / 2):len(decomposed_components.trend)] = \
+        decomposed_components.trend[len(decomposed_components.trend) - int(period / 2) - 1]
+
+    return decomposed_components.trend, decomposed_components.seasonal
+
+
 class TimeSeriesSeasonalityTrendDecompositionPrimitive(transformer.TransformerPrimitiveBase[Inputs, Outputs, Hyperparams]):
     """
     A primitive to decompose time series in trend , seasonality and residual
@@ -98,6 +117,8 @@ Parameters
         Window Size for decomposition
     model :(default='additive')
         Window Size for decomposition
+    n_jobs : int(default=1)
+        Number of worker processes decomposing the columns, -1 uses all the CPU cores.
     use_columns :Set(elements=hyperparams.Hyperparameter[int](-1))
         A set of column indices to force primitive to operate on. If any specified column cannot be parsed, it is skipped.
     exclude_columns :Set(elements=hyperparams.Hyperparameter[int](-1))
@@ -327,17 +348,10 @@ Parameters
         """
         transformed_X = utils.pandas.DataFrame()
 
-        for column in X.columns:
-            decomposed_components = sm.tsa.seasonal_decompose(X[column], model=model,
-                                                              period=period,two_sided=False)
-            period = self.hyperparams['period']
-            if (period > 1):
-                decomposed_components.trend[0:int(period / 2)] = decomposed_components.trend[int(period / 2)]
-                decomposed_components.trend[
-                len(decomposed_components.trend) - int(period / 2):len(decomposed_components.trend)] = \
-                decomposed_components.trend[len(decomposed_components.trend) - int(period / 2) - 1]
-
-            transformed_X[column + "_trend"] = decomposed_components.trend
-            transformed_X[column + "_seasonal"] = decomposed_components.seasonal
+        components = map_columns(_decompose_column, X, n_jobs=self.hyperparams['n_jobs'],
+                                 model=model, period=period)
+        for column, (trend, seasonal) in zip(X.columns, components):
+            transformed_X[column + "_trend"] = trend
+            transformed_X[column + "_seasonal"] = seasonal
 
         return transformed_X
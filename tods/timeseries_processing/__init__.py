@@ -1,9 +1,17 @@
-from tods.timeseries_processing.HoltSmoothing import HoltSmoothingPrimitive 
-from tods.timeseries_processing.HoltWintersExponentialSmoothing import HoltWintersExponentialSmoothingPrimitive
-from tods.timeseries_processing.MovingAverageTransformer import MovingAverageTransformerPrimitive
-from tods.timeseries_processing.SKStandardScaler import SKStandardScalerPrimitive 
-from tods.timeseries_processing.SKAxiswiseScaler import SKAxiswiseScalerPrimitive
-from tods.timeseries_processing.SKPowerTransformer import SKPowerTransformerPrimitive
-from tods.timeseries_processing.SKQuantileTransformer import SKQuantileTransformerPrimitive
-from tods.timeseries_processing.SimpleExponentialSmoothing import SimpleExponentialSmoothingPrimitive
-from tods.timeseries_processing.TimeSeriesSeasonalityTrendDecomposition import TimeSeriesSeasonalityTrendDecompositionPrimitive
+from tods.common.lazy import lazy_attributes
+
+# The primitives are imported on first access, see tods.common.lazy
+_PRIMITIVES = {
+    'HoltSmoothingPrimitive': 'tods.timeseries_processing.HoltSmoothing',
+    'HoltWintersExponentialSmoothingPrimitive': 'tods.timeseries_processing.HoltWintersExponentialSmoothing',
+    'MovingAverageTransformerPrimitive': 'tods.timeseries_processing.MovingAverageTransformer',
+    'SKStandardScalerPrimitive': 'tods.timeseries_processing.SKStandardScaler',
+    'SKAxiswiseScalerPrimitive': 'tods.timeseries_processing.SKAxiswiseScaler',
+    'SKPowerTransformerPrimitive': 'tods.timeseries_processing.SKPowerTransformer',
+    'SKQuantileTransformerPrimitive': 'tods.timeseries_processing.SKQuantileTransformer',
+    'SimpleExponentialSmoothingPrimitive': 'tods.timeseries_processing.SimpleExponentialSmoothing',
+    'TimeSeriesSeasonalityTrendDecompositionPrimitive': 'tods.timeseries_processing.TimeSeriesSeasonalityTrendDecomposition',
+}
+
+__all__ = list(_PRIMITIVES)
+__getattr__, __dir__ = lazy_attributes(__name__, _PRIMITIVES)
@@ -429,59 +429,199 @@ def fit_pipeline(dataset, pipeline, metric='F1', seed=0):
 
     return [fitted_pipeline,pipeline_result]
 
+# Version of the layout written by save_fitted_pipeline
+FITTED_PIPELINE_FORMAT_VERSION = 2
+
+
+class LazyModel():
+    """
+    Stand-in for a Keras model saved next to a fitted pipeline,
+    the model is loaded on first use.
+
+    Parameters
+    ----------
+    path: str
+        Path of the saved model
+    """
+    def __init__(self, path):
+        self.path = path
+        self._model = None
+
+    @property
+    def loaded(self):
+        return self._model is not None
+
+    def load(self):
+        if self._model is None:
+            import keras
+            self._model = keras.models.load_model(self.path, custom_objects={'sampling': sampling})
+        return self._model
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+
+    def __call__(self, *args, **kwargs):
+        return self.load()(*args, **kwargs)
+
+
+def _is_keras_model(value):
+    if isinstance(value, LazyModel):
+        return True
+    module = type(value).__module__
+    return hasattr(value, 'save') and (module.startswith('keras') or module.startswith('tensorflow'))
+
+
+def _is_numeric_array(value):
+    return isinstance(value, np.ndarray) and not value.dtype.hasobject
+
+
+def _fitted_state(steps_state):
+    """
+    Locate the Keras models and the numeric arrays of the fitted steps.
+    Paths start with the params key, followed by attribute names.
+    """
+    models, arrays = [], []
+    for step, params in enumerate(steps_state):
+        if not isinstance(params, dict):
+            continue
+        for key, value in params.items():
+            if _is_numeric_array(value):
+                arrays.append((step, (key,)))
+            clf_dict = getattr(value, '__dict__', None)
+            if clf_dict is None or isinstance(value, type):
+                continue
+            for name, attribute in clf_dict.items():
+                if _is_keras_model(attribute):
+                    models.append((step, (key, name)))
+                elif _is_numeric_array(attribute):
+                    arrays.append((step, (key, name)))
+                elif getattr(attribute, '__dict__', None) is not None and not isinstance(attribute, type):
+                    for inner_name, inner_attribute in vars(attribute).items():
+                        if _is_keras_model(inner_attribute):
+                            models.append((step, (key, name, inner_name)))
+    return models, arrays
+
+
+def _get_state(steps_state, step, path):
+    value = steps_state[step][path[0]]
+    for name in path[1:]:
+        value = getattr(value, name)
+    return value
+
+
+def _set_state(steps_state, step, path, value):
+    if len(path) == 1:
+        steps_state[step][path[0]] = value
+    else:
+        setattr(_get_state(steps_state, step, path[:-1]), path[-1], value)
+
+
 def save_fitted_pipeline(fitted_pipeline, save_path = find_save_folder()):
+    """
+    Save a fitted pipeline in a versioned layout::
+
+        <pipeline_id>/format.json        version, models and arrays of the fitted steps
+        <pipeline_id>/runtime.pkl        the runtime without models and arrays
+        <pipeline_id>/arrays/*.npy       numeric arrays, memory-mappable
+        <pipeline_id>/model/*            Keras models, loaded lazily
+
+    The dataset metadata is not saved, it is replaced by the metadata of the
+    dataset given to produce_fitted_pipeline.
+
+    Args:
+        fitted_pipeline: A fitted pipeline returned by fit_pipeline
+        save_path (str): The folder of the saved pipelines
+    Returns:
+        pipeline_id
+    """
     import os
+    import json
     import joblib
 
     runtime = fitted_pipeline['runtime']
-
     steps_state = runtime.steps_state
-
     pipeline_id = runtime.pipeline.id
+    pipeline_dir = os.path.join(save_path, str(pipeline_id))
+    os.makedirs(os.path.join(pipeline_dir, 'arrays'), exist_ok=True)
+    os.makedirs(os.path.join(pipeline_dir, 'model'), exist_ok=True)
+
+    models, arrays = _fitted_state(steps_state)
+    layout = {'format_version': FITTED_PIPELINE_FORMAT_VERSION, 'pipeline_id': str(pipeline_id),
+              'models': [], 'arrays': []}
+    detached = []
+    try:
+        for step, path in models:
+            value = _get_state(steps_state, step, path)
+            file_name = os.path.join('model', '{}.{}'.format(step, '.'.join(path)))
+            if isinstance(value, LazyModel):
+                value = value.load()
+            value.save(os.path.join(pipeline_dir, file_name))
+            layout['models'].append({'step': step, 'path': list(path), 'file': file_name})
+            detached.append((step, path, _get_state(steps_state, step, path)))
+            _set_state(steps_state, step, path, None)
+
+        for step, path in arrays:
+            value = _get_state(steps_state, step, path)
+            file_name = os.path.join('arrays', '{}.{}.npy'.format(step, '.'.join(path)))
+            np.save(os.path.join(pipeline_dir, file_name), value, allow_pickle=False)
+            layout['arrays'].append({'step': step, 'path': list(path), 'file': file_name})
+            detached.append((step, path, value))
+            _set_state(steps_state, step, path, None)
+
+        joblib.dump({'runtime': runtime}, os.path.join(pipeline_dir, 'runtime.pkl'))
+    finally:
+        # The fitted pipeline given by the caller is left untouched
+        for step, path, value in reversed(detached):
+            _set_state(steps_state, step, path, value)
+
+    with open(os.path.join(pipeline_dir, 'format.json'), 'w') as f:
+        json.dump(layout, f)
 
+    return pipeline_id
 
-    model_index = {}
-
-    for i in range(len(steps_state)):
-
-        if steps_state[i] != None and 'clf_' in runtime.steps_state[i]:
-            model_name = type(runtime.steps_state[i]['clf_']).__name__
-            model_index[str(model_name)] = i
+def load_fitted_pipeline(pipeline_id, save_path = find_save_folder(), mmap_mode='r'):
+    """
+    Load a fitted pipeline saved by save_fitted_pipeline.
+    Keras models are loaded on their first use.
 
-            if 'AutoEncoder' in str(type(runtime.steps_state[i]['clf_'])) or 'VAE' in str(type(runtime.steps_state[i]['clf_'])) or 'LSTMOutlierDetector' in str(type(runtime.steps_state[i]['clf_'])) or 'DeeplogLstm' in str(type(runtime.steps_state[i]['clf_'])):
-                runtime.steps_state[i]['clf_'].model_.save(save_path + str(pipeline_id) + '/model/' + str(model_name))
-                runtime.steps_state[i]['clf_'].model_ = None
-                joblib.dump(runtime.steps_state[i]['clf_'], save_path + str(pipeline_id) + '/model/' + str(model_name) + '.pkl')
+    Args:
+        pipeline_id: The id returned by save_fitted_pipeline
+        save_path (str): The folder of the saved pipelines
+        mmap_mode (str): Memory-map mode of the saved arrays, None reads them in memory
+    Returns:
+        fitted_pipeline
+    """
+    import os
+    import json
+    import joblib
 
-            elif 'SO_GAAL' in str(type(runtime.steps_state[i]['clf_'])):
-                runtime.steps_state[i]['clf_'].combine_model.save(save_path + str(pipeline_id) + '/model/' + str(model_name) + '_combine_model')
-                runtime.steps_state[i]['clf_'].combine_model = None
-                runtime.steps_state[i]['clf_'].discriminator.save(save_path + str(pipeline_id) + '/model/' + str(model_name) + '_discriminator')
-                runtime.steps_state[i]['clf_'].discriminator = None
-                runtime.steps_state[i]['clf_'].generator.save(save_path + str(pipeline_id) + '/model/' + str(model_name) + '_generator')
-                runtime.steps_state[i]['clf_'].generator = None
-                joblib.dump(runtime.steps_state[i]['clf_'], save_path + str(pipeline_id) + '/model/' + str(model_name) + '.pkl')
+    pipeline_dir = os.path.join(save_path, str(pipeline_id))
+    if not os.path.exists(os.path.join(pipeline_dir, 'format.json')):
+        return _load_legacy_fitted_pipeline(pipeline_id, save_path)
 
-            elif 'MO_GAAL' in str(type(runtime.steps_state[i]['clf_'])):
-                runtime.steps_state[i]['clf_'].discriminator.save(save_path + str(pipeline_id) + '/model/' + str(model_name) + '_discriminator')
-                runtime.steps_state[i]['clf_'].discriminator = None
-                joblib.dump(runtime.steps_state[i]['clf_'], save_path + str(pipeline_id) + '/model/' + str(model_name) + '.pkl')
+    with open(os.path.join(pipeline_dir, 'format.json')) as f:
+        layout = json.load(f)
+    if layout['format_version'] > FITTED_PIPELINE_FORMAT_VERSION:
+        raise ValueError('Fitted pipeline {} has format version {}, this version of tods reads up to {}.'.format(
+            pipeline_id, layout['format_version'], FITTED_PIPELINE_FORMAT_VERSION))
 
-            elif 'Detector' in str(type(runtime.steps_state[i]['clf_'])):
-                runtime.steps_state[i]['clf_']._model.model.save(save_path + str(pipeline_id) + '/model/' + str(model_name))
-                runtime.steps_state[i]['clf_']._model.model = None
-                joblib.dump(runtime.steps_state[i]['clf_'], save_path + str(pipeline_id) + '/model/' + str(model_name) + '.pkl')
+    fitted_pipeline = joblib.load(os.path.join(pipeline_dir, 'runtime.pkl'))
+    fitted_pipeline['dataset_metadata'] = None
+    steps_state = fitted_pipeline['runtime'].steps_state
 
-            else:
-                if not os.path.isdir(save_path + str(pipeline_id) + '/'):
-                    os.mkdir(save_path + str(pipeline_id) + '/')
+    for array in layout['arrays']:
+        value = np.load(os.path.join(pipeline_dir, array['file']), mmap_mode=mmap_mode, allow_pickle=False)
+        _set_state(steps_state, array['step'], tuple(array['path']), value)
 
-    joblib.dump(fitted_pipeline, save_path + str(pipeline_id) + '/fitted_pipeline.pkl')
-    joblib.dump(model_index, save_path + str(pipeline_id) + '/orders.pkl')
+    for model in layout['models']:
+        _set_state(steps_state, model['step'], tuple(model['path']), LazyModel(os.path.join(pipeline_dir, model['file'])))
 
-    return pipeline_id
+    return fitted_pipeline
 
-def load_fitted_pipeline(pipeline_id, save_path = find_save_folder()):
+def _load_legacy_fitted_pipeline(pipeline_id, save_path):
+    # Layout written before FITTED_PIPELINE_FORMAT_VERSION, every model is loaded eagerly
     import joblib
     import keras
 
@@ -531,12 +671,9 @@ def load_fitted_pipeline(pipeline_id, save_path = find_save_folder()):
             model._model.model = keras.models.load_model(save_path + str(pipeline_id) + '/model/' + str(model_name))
             fitted_pipeline['runtime'].steps_state[model_index]['clf_'] = model
 
-        else:
-            fitted_pipeline = joblib.load(save_path + str(pipeline_id) + '/fitted_pipeline.pkl')
-
     return fitted_pipeline
 
-def produce_fitted_pipeline(dataset, fitted_pipeline):
+def produce_fitted_pipeline(dataset, fitted_pipeline, backend=None):
     from d3m.metadata import base as metadata_base
     from axolotl.backend.simple import SimpleRunner
     import uuid
@@ -547,9 +684,12 @@ def produce_fitted_pipeline(dataset, fitted_pipeline):
     metadata_dict = {key: metadata_dict[key] for key in metadata_dict}
     dataset.metadata = dataset.metadata.update(('learningData', metadata_base.ALL_ELEMENTS, 1), metadata_dict)
 
-    backend = SimpleRunner(random_seed=0)
-
-    _id = str(uuid.uuid4())
+    if backend is None:
+        backend = SimpleRunner(random_seed=0)
+        _id = str(uuid.uuid4())
+    else:
+        # A backend kept with its runtime by FittedPipelineRegistry
+        _id = str(id(fitted_pipeline['runtime']))
     backend.fitted_pipelines[_id] = fitted_pipeline['runtime']
 
     pipeline_result = backend.produce_pipeline(_id, [dataset])
@@ -562,10 +702,179 @@ def fit_and_save_pipeline(dataset, pipeline, metric='F1', seed=0):
     fitted_pipeline_id = save_fitted_pipeline(fitted_pipeline[0])
     return fitted_pipeline_id
 
-def load_and_produce_pipeline(dataset, fitted_pipeline_id):
-    fitted_pipeline = load_fitted_pipeline(fitted_pipeline_id)
-    pipeline_result = produce_fitted_pipeline(dataset, fitted_pipeline)
-    return pipeline_result
+def estimate_fitted_pipeline_size(fitted_pipeline):
+    """
+    Estimate the memory held by a fitted pipeline: the numeric arrays of its
+    fitted steps that are not memory-mapped, and 4 bytes per parameter of its
+    loaded Keras models.
+    """
+    steps_state = fitted_pipeline['runtime'].steps_state
+    models, arrays = _fitted_state(steps_state)
+    size = 0
+    for step, path in arrays:
+        value = _get_state(steps_state, step, path)
+        if not isinstance(value, np.memmap):
+            size += value.nbytes
+    for step, path in models:
+        model = _get_state(steps_state, step, path)
+        if isinstance(model, LazyModel):
+            if not model.loaded:
+                continue
+            model = model.load()
+        size += 4 * model.count_params()
+    return size
+
+
+class FittedPipelineRegistry():
+    """
+    Process-local cache of loaded fitted pipelines for serving. Pipelines stay
+    loaded, with their Keras models and runner, until they are evicted in least
+    recently used order when there are more than ``max_pipelines`` of them or
+    their estimated memory exceeds ``max_memory``.
+
+    Parameters
+    ----------
+    max_pipelines: int
+        Maximum number of loaded pipelines
+    max_memory: int
+        Maximum estimated number of bytes of the loaded pipelines, None for no limit
+    save_path: str
+        The folder of the saved pipelines
+    mmap_mode: str
+        Memory-map mode of the saved arrays, see load_fitted_pipeline
+    """
+    def __init__(self, max_pipelines=64, max_memory=None, save_path=find_save_folder(), mmap_mode='r'):
+        import threading
+
+        self.max_pipelines = max_pipelines
+        self.max_memory = max_memory
+        self.save_path = save_path
+        self.mmap_mode = mmap_mode
+
+        self._entries = OrderedDict()
+        self._lock = threading.RLock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.load_time = 0.
+
+    def __contains__(self, pipeline_id):
+        return str(pipeline_id) in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, pipeline_id):
+        """
+        Return the loaded fitted pipeline, loading it on a miss.
+        """
+        return self._get_entry(pipeline_id)['fitted_pipeline']
+
+    def produce(self, dataset, pipeline_id):
+        """
+        Produce a loaded fitted pipeline on a dataset, see produce_fitted_pipeline.
+        """
+        entry = self._get_entry(pipeline_id)
+        with entry['lock']:
+            if entry['backend'] is None:
+                from axolotl.backend.simple import SimpleRunner
+                entry['backend'] = SimpleRunner(random_seed=0)
+            pipeline_result = produce_fitted_pipeline(dataset, entry['fitted_pipeline'], backend=entry['backend'])
+
+        with self._lock:
+            # Lazy models may have been loaded by this call
+            if str(pipeline_id) in self._entries:
+                entry['size'] = estimate_fitted_pipeline_size(entry['fitted_pipeline'])
+                self._evict()
+        return pipeline_result
+
+    def evict(self, pipeline_id):
+        """
+        Remove a pipeline from the registry.
+        """
+        with self._lock:
+            self._entries.pop(str(pipeline_id), None)
+
+    def clear(self):
+        """
+        Remove all the pipelines and reset the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.load_time = 0.
+
+    def memory(self):
+        """
+        Estimated number of bytes of the loaded pipelines.
+        """
+        return sum(entry['size'] for entry in self._entries.values())
+
+    def stats(self):
+        """
+        Hits, misses, evictions, total load time in seconds, number of loaded
+        pipelines and their estimated memory.
+        """
+        requests = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / requests if requests else 0.,
+            'evictions': self.evictions,
+            'load_time': self.load_time,
+            'pipelines': len(self._entries),
+            'memory': self.memory(),
+        }
+
+    def _get_entry(self, pipeline_id):
+        import time
+        import threading
+
+        key = str(pipeline_id)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+            start_time = time.perf_counter()
+            fitted_pipeline = load_fitted_pipeline(pipeline_id, self.save_path, mmap_mode=self.mmap_mode)
+            self.load_time += time.perf_counter() - start_time
+
+            entry = {
+                'fitted_pipeline': fitted_pipeline,
+                'backend': None,
+                'lock': threading.Lock(),
+                'size': estimate_fitted_pipeline_size(fitted_pipeline),
+            }
+            self._entries[key] = entry
+            self._evict()
+            return entry
+
+    def _evict(self):
+        # The most recently used pipeline is kept even if it is over the budget alone
+        while len(self._entries) > 1 and (len(self._entries) > self.max_pipelines or
+                                          (self.max_memory is not None and self.memory() > self.max_memory)):
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+
+# Registry used by load_and_produce_pipeline
+fitted_pipeline_registry = FittedPipelineRegistry()
+
+
+def load_and_produce_pipeline(dataset, fitted_pipeline_id, registry=None):
+    """
+    Produce a saved fitted pipeline on a dataset. The pipeline is loaded once
+    and kept in ``registry``, ``fitted_pipeline_registry`` by default.
+    """
+    if registry is None:
+        registry = fitted_pipeline_registry
+    return registry.produce(dataset, fitted_pipeline_id)
 
 def get_primitive_list(config, module_name):
     """